@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Rebuild every league listed in leagues.json in one run
+
+Extract jobs (one per league season) spend their time waiting on the platform
+APIs, so they run on a thread pool sized by workers.network. Each platform also
+gets its own cap from rate_limits, so adding workers scales throughput until a
+platform's limit is reached instead of flooding its API.
+
+Transform jobs are CPU-bound and run on a separate process pool (workers.cpu)
+as soon as all of a league's seasons have been extracted.
+
+Everything for a league lands in output/leagues/<name>/<platform>/ together
+with a status.json describing every job. A failing league never stops the
+others.
+
+Usage:
+    python batch.py
+    python batch.py --config leagues.json --league fatman --platform sleeper
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+DEFAULT_CONFIG = BASE_DIR / 'leagues.json'
+LEAGUES_DIR = BASE_DIR / 'output' / 'leagues'
+
+def load_json(filepath):
+    """Load JSON file"""
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+def write_json(filepath, data):
+    """Write JSON file"""
+    with open(filepath, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def load_seasons(league_dir, platform):
+    """Load the per-season extract files for a league, keyed by season"""
+    seasons = {}
+    for season_file in sorted(Path(league_dir).glob(f'{platform}_[0-9][0-9][0-9][0-9].json')):
+        seasons[int(season_file.stem.split('_')[1])] = load_json(season_file)
+    return seasons
+
+# ---------------------------------------------------------------------------
+# Extract jobs (network-bound, thread pool)
+# ---------------------------------------------------------------------------
+
+def extract_mfl_season(season, league_id):
+    """Pull one MFL season"""
+    import extract_mfl
+    data = extract_mfl.extract_league_data(season, league_id)
+    # fetch_mfl_data swallows request errors, so an unreachable league comes back as all None
+    if data['league'] is None:
+        raise RuntimeError(f"could not fetch MFL league {league_id} for {season}")
+    return data
+
+def extract_yahoo_season(season, league_key):
+    """Pull one Yahoo season (league_key is the full key, e.g. 399.l.114631)"""
+    import extract_yahoo_full
+    return extract_yahoo_full.extract_yahoo_data(season, league_key)
+
+def extract_sleeper_season(season, league_id):
+    """Pull one Sleeper season's playoff results and draft order"""
+    import extract_sleeper_drafts
+    import extract_sleeper_playoffs
+    return {
+        'year': season,
+        'league_id': league_id,
+        'playoffs': extract_sleeper_playoffs.parse_playoff_bracket(league_id, season),
+        'draft_order': extract_sleeper_drafts.extract_draft_order(league_id, season)
+    }
+
+# ---------------------------------------------------------------------------
+# Transform jobs (CPU-bound, process pool)
+# ---------------------------------------------------------------------------
+
+def transform_mfl(league_dir):
+    """Build mfl_dashboard_data.json for one league"""
+    from transform_mfl_for_dashboard import load_mfl_inputs, transform_mfl_data
+    output = transform_mfl_data(*load_mfl_inputs(league_dir))
+    write_json(league_dir / 'mfl_dashboard_data.json', output)
+    return len(output['manager_stats'])
+
+def transform_yahoo(league_dir):
+    """Build yahoo_dashboard_data.json for one league"""
+    from transform_yahoo_for_dashboard import transform_yahoo_data
+    yahoo_data = {str(season): data for season, data in load_seasons(league_dir, 'yahoo').items()}
+    team_mapping = load_json(BASE_DIR / 'yahoo_team_mapping.json')
+    output = transform_yahoo_data(yahoo_data, team_mapping)
+    write_json(league_dir / 'yahoo_dashboard_data.json', output)
+    return len(output['manager_stats'])
+
+def transform_sleeper(league_dir):
+    """Combine per-season Sleeper extracts into the playoff and draft files the dashboard reads"""
+    seasons = load_seasons(league_dir, 'sleeper')
+    playoff_results = [data['playoffs'] for data in seasons.values() if data.get('playoffs')]
+    draft_positions = {str(season): data.get('draft_order') or {} for season, data in seasons.items()}
+    write_json(league_dir / 'sleeper_playoff_results.json', playoff_results)
+    write_json(league_dir / 'sleeper_draft_positions.json', draft_positions)
+    return len(seasons)
+
+PLATFORMS = {
+    'mfl': {'extract': extract_mfl_season, 'transform': transform_mfl},
+    'yahoo': {'extract': extract_yahoo_season, 'transform': transform_yahoo},
+    'sleeper': {'extract': extract_sleeper_season, 'transform': transform_sleeper}
+}
+
+def run_extract(platform, season, league_id, league_dir, limiter):
+    """Extract one season and save it; returns elapsed seconds"""
+    start = time.time()
+    with limiter:
+        data = PLATFORMS[platform]['extract'](int(season), league_id)
+    if data is None:
+        raise RuntimeError(f"no data returned for {platform} {season}")
+    write_json(league_dir / f'{platform}_{season}.json', data)
+    return round(time.time() - start, 2)
+
+def run_transform(platform, league_dir):
+    """Transform a league's extracts; runs in a worker process"""
+    start = time.time()
+    PLATFORMS[platform]['transform'](league_dir)
+    return round(time.time() - start, 2)
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+def league_seasons(league):
+    """Season -> league ID for a config entry; Sleeper leagues can give just the current league_id"""
+    if 'seasons' in league:
+        return {int(season): league_id for season, league_id in league['seasons'].items()}
+    if league['platform'] == 'sleeper':
+        from sleeper_api import resolve_league_history
+        return resolve_league_history(league['league_id'])
+    raise ValueError(f"no seasons configured for {league['name']}/{league['platform']}")
+
+def job_result(future):
+    """Turn a finished future into a status entry"""
+    try:
+        return {'status': 'ok', 'seconds': future.result()}
+    except Exception as e:
+        return {'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+
+def write_status(league_dir, status):
+    """Persist a league's job statuses so progress survives a crash"""
+    write_json(league_dir / 'status.json', status)
+
+def run_batch(config, league_names=None, platforms=None):
+    """Schedule extract and transform jobs for every configured league"""
+    workers = config.get('workers', {})
+    limiters = {
+        platform: threading.BoundedSemaphore(limit)
+        for platform, limit in config.get('rate_limits', {}).items()
+    }
+
+    leagues = [
+        league for league in config['leagues']
+        if (not league_names or league['name'] in league_names)
+        and (not platforms or league['platform'] in platforms)
+    ]
+
+    statuses = {}
+    league_dirs = {}
+    remaining = {}
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=workers.get('network', 8)) as network_pool, \
+            ProcessPoolExecutor(max_workers=workers.get('cpu', 4)) as cpu_pool:
+
+        for league in leagues:
+            key = (league['name'], league['platform'])
+            league_dir = LEAGUES_DIR / league['name'] / league['platform']
+            league_dir.mkdir(parents=True, exist_ok=True)
+            league_dirs[key] = league_dir
+            statuses[key] = {
+                'name': league['name'],
+                'platform': league['platform'],
+                'started': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'jobs': {}
+            }
+
+            if league['platform'] not in PLATFORMS:
+                statuses[key]['jobs']['config'] = {
+                    'status': 'failed',
+                    'error': f"unknown platform '{league['platform']}'"
+                }
+                write_status(league_dir, statuses[key])
+                continue
+
+            try:
+                seasons = league_seasons(league)
+            except Exception as e:
+                statuses[key]['jobs']['discover'] = {'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+                write_status(league_dir, statuses[key])
+                continue
+
+            limiter = limiters.get(league['platform']) or nullcontext()
+            remaining[key] = len(seasons)
+            for season, league_id in sorted(seasons.items()):
+                future = network_pool.submit(
+                    run_extract, league['platform'], season, league_id, league_dir, limiter
+                )
+                pending[future] = (key, f'extract:{season}')
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, job = pending.pop(future)
+                status = statuses[key]
+                status['jobs'][job] = job_result(future)
+
+                outcome = status['jobs'][job]
+                detail = f"{outcome['seconds']}s" if outcome['status'] == 'ok' else outcome['error']
+                print(f"  [{key[0]}/{key[1]}] {job}: {outcome['status']} ({detail})")
+
+                if job.startswith('extract:'):
+                    remaining[key] -= 1
+                    if remaining[key] == 0:
+                        extracted = [
+                            j for j, r in status['jobs'].items()
+                            if j.startswith('extract:') and r['status'] == 'ok'
+                        ]
+                        if extracted:
+                            future = cpu_pool.submit(run_transform, key[1], league_dirs[key])
+                            pending[future] = (key, 'transform')
+                        else:
+                            status['jobs']['transform'] = {
+                                'status': 'skipped',
+                                'error': 'no seasons extracted'
+                            }
+
+                write_status(league_dirs[key], status)
+
+    for key, status in statuses.items():
+        status['finished'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        write_status(league_dirs[key], status)
+
+    return statuses
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild all configured leagues")
+    parser.add_argument('--config', default=str(DEFAULT_CONFIG), help="league config file")
+    parser.add_argument('--league', action='append', help="only run leagues with this name")
+    parser.add_argument('--platform', action='append', help="only run this platform")
+    args = parser.parse_args()
+
+    config = load_json(args.config)
+
+    print("=" * 60)
+    print("Batch league rebuild")
+    print("=" * 60)
+
+    start = time.time()
+    statuses = run_batch(config, args.league, args.platform)
+
+    failures = 0
+    print(f"\nSummary ({time.time() - start:.1f}s):")
+    for (name, platform), status in sorted(statuses.items()):
+        results = list(status['jobs'].values())
+        failed = [r for r in results if r['status'] != 'ok']
+        failures += len(failed)
+        mark = '✓' if not failed else '✗'
+        print(f"  {mark} {name}/{platform}: {len(results) - len(failed)}/{len(results)} jobs ok")
+
+    print(f"\nOutput: {LEAGUES_DIR}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Sync published data to a Netlify Blobs store, uploading only what changed
+
+Every publishable file under html5up-landed/assets/data/ becomes a blob keyed
+data/<path>, and h2h.json (publish_h2h.py) is also stored as h2h-data, the key
+/api/h2h reads. The store keeps a _sync-manifest blob of key -> SHA-256, so a
+run hashes the local files, uploads only keys whose hash differs (in
+parallel), deletes keys that no longer exist and then saves the new manifest.
+A run where nothing changed moves one small blob.
+
+Two stores implement the same get/set/delete interface:
+
+  NetlifyBlobStore  the site's store on Netlify (NETLIFY_SITE_ID and
+                    NETLIFY_AUTH_TOKEN), the same one getStore() opens
+  LocalBlobStore    a directory, one file per key, for development and
+                    for benchmarking syncs without touching Netlify
+
+    python blob_sync.py                          # sync to Netlify
+    python blob_sync.py --local output/blobs     # sync to a local directory
+    python blob_sync.py --dry-run                # list what would change
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote
+
+import requests
+
+from publish_assets import source_files
+from publish_bundle import ASSETS_DIR
+
+STORE_NAME = 'fantasy-stats'
+NETLIFY_API = 'https://api.netlify.com/api/v1/blobs'
+MANIFEST_KEY = '_sync-manifest'
+
+# Blobs read by the Netlify functions under their own keys
+NAMED_BLOBS = {'h2h-data': 'h2h.json'}
+
+class NetlifyBlobStore:
+    """A site-wide Netlify Blobs store, through the blobs REST API"""
+
+    def __init__(self, site_id, token, name=STORE_NAME):
+        # @netlify/blobs prefixes site-wide stores with "site:"
+        self.base = f"{NETLIFY_API}/{site_id}/site:{name}"
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+    def signed_url(self, method, key):
+        """The API answers with a short-lived URL for the blob itself"""
+        response = requests.request(method, f"{self.base}/{quote(key, safe='')}", headers={
+            **self.headers, 'Accept': 'application/json;type=signed-url'
+        })
+        response.raise_for_status()
+        return response.json()['url']
+
+    def get(self, key):
+        response = requests.get(self.signed_url('GET', key))
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.content
+
+    def set(self, key, data):
+        requests.put(self.signed_url('PUT', key), data=data).raise_for_status()
+
+    def delete(self, key):
+        response = requests.delete(f"{self.base}/{quote(key, safe='')}", headers=self.headers)
+        if response.status_code != 404:
+            response.raise_for_status()
+
+class LocalBlobStore:
+    """Stand-in store: one file per key in a directory"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, key):
+        return self.root / quote(key, safe='')
+
+    def get(self, key):
+        path = self.path(key)
+        return path.read_bytes() if path.exists() else None
+
+    def set(self, key, data):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.path(key).with_name(self.path(key).name + '.tmp')
+        tmp.write_bytes(data)
+        tmp.replace(self.path(key))
+
+    def delete(self, key):
+        if self.path(key).exists():
+            self.path(key).unlink()
+
+def local_blobs():
+    """{key: file} for everything that should be in the store"""
+    blobs = {f'data/{name}': ASSETS_DIR / name for name in source_files()}
+    for key, name in NAMED_BLOBS.items():
+        if (ASSETS_DIR / name).exists():
+            blobs[key] = ASSETS_DIR / name
+    return blobs
+
+def sync(store, workers=8, dry_run=False):
+    """Upload changed keys and delete removed ones; returns (uploaded, deleted, bytes sent, total bytes)"""
+    remote = json.loads(store.get(MANIFEST_KEY) or b'{}')
+    contents = {key: path.read_bytes() for key, path in local_blobs().items()}
+    hashes = {key: hashlib.sha256(data).hexdigest() for key, data in contents.items()}
+
+    uploads = sorted(key for key, digest in hashes.items() if remote.get(key) != digest)
+    deletes = sorted(key for key in remote if key not in hashes)
+    sent = sum(len(contents[key]) for key in uploads)
+    total = sum(len(data) for data in contents.values())
+    if dry_run or (not uploads and not deletes):
+        return uploads, deletes, sent, total
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda key: store.set(key, contents[key]), uploads))
+        list(pool.map(store.delete, deletes))
+
+    # Last, so an interrupted sync is retried next run
+    store.set(MANIFEST_KEY, json.dumps(hashes, indent=2, sort_keys=True).encode())
+    return uploads, deletes, sent, total
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync published data to the blob store")
+    parser.add_argument('--local', metavar='DIR', help="sync to a local directory instead of Netlify")
+    parser.add_argument('--workers', type=int, default=8, help="parallel uploads (default 8)")
+    parser.add_argument('--dry-run', action='store_true', help="only report what would change")
+    args = parser.parse_args()
+
+    if args.local:
+        store = LocalBlobStore(args.local)
+        print(f"Syncing to {args.local}...")
+    else:
+        site_id, token = os.environ.get('NETLIFY_SITE_ID'), os.environ.get('NETLIFY_AUTH_TOKEN')
+        if not site_id or not token:
+            print("Set NETLIFY_SITE_ID and NETLIFY_AUTH_TOKEN, or use --local DIR")
+            return
+        store = NetlifyBlobStore(site_id, token)
+        print(f"Syncing to Netlify Blobs store '{STORE_NAME}'...")
+
+    started = time.time()
+    uploads, deletes, sent, total = sync(store, workers=args.workers, dry_run=args.dry_run)
+    for key in uploads:
+        print(f"  {'would upload' if args.dry_run else 'uploaded'} {key}")
+    for key in deletes:
+        print(f"  {'would delete' if args.dry_run else 'deleted'} {key}")
+
+    print(f"\n✓ {len(uploads)} uploaded, {len(deletes)} deleted: {sent / 1024:.1f} KB of "
+          f"{total / 1024:.1f} KB in {time.time() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Final placements 1..N from playoff brackets, for any league size or format
+
+Each platform's brackets are loaded into one list of games:
+
+    {'id': ('W', 3), 'round': 2, 'teams': [a, b], 'from': [src, src],
+     'winner': a, 'loser': b, 'places': (3, 4), 'bottom': False}
+
+where a src is ('winner' | 'loser', game id) for a slot filled by an earlier
+game, and places is the (winner, loser) placement the game decides, if any.
+Together the games form a DAG; resolve_placements() walks it once in
+topological order, filling in teams and results, and returns every team's
+final place:
+
+  - teams in a placement game get that place
+  - the rest fill the remaining places in order: teams in the winners bracket
+    by how far they got, then teams in no bracket, then teams in the
+    losers bracket (where advancing is bad) by how early they got out, each
+    group ordered by regular-season standing
+
+sleeper_games() and mfl_games() load the two platforms' bracket payloads.
+"""
+from collections import deque
+
+def as_list(value):
+    """MFL returns a single object instead of a one-item list"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def topological_order(games):
+    """Games ordered so every game comes after the games that feed it"""
+    by_id = {g['id']: g for g in games}
+    pending = {g['id']: sum(1 for src in g['from'] if src and src[1] in by_id) for g in games}
+    feeds = {}
+    for g in games:
+        for src in g['from']:
+            if src and src[1] in by_id:
+                feeds.setdefault(src[1], []).append(g['id'])
+
+    ready = deque(sorted((g['round'], g['id']) for g in games if not pending[g['id']]))
+    order = []
+    while ready:
+        _, game_id = ready.popleft()
+        order.append(by_id[game_id])
+        for next_id in feeds.get(game_id, []):
+            pending[next_id] -= 1
+            if not pending[next_id]:
+                ready.append((by_id[next_id]['round'], next_id))
+    if len(order) != len(games):
+        raise ValueError("bracket has a cycle")
+    return order
+
+def resolve_placements(games, standings):
+    """
+    [team, ...] in final place order (1st first)
+
+    standings is every team in regular-season order, which breaks ties
+    between teams eliminated at the same stage. Returns None if a placement
+    game hasn't been decided yet.
+    """
+    by_id = {g['id']: g for g in games}
+    seed = {team: i for i, team in enumerate(standings)}
+    places = {}
+    top_round, bottom_round = {}, {}
+
+    for g in topological_order(games):
+        for i, src in enumerate(g['from']):
+            if g['teams'][i] is None and src and src[1] in by_id:
+                g['teams'][i] = by_id[src[1]][src[0]]
+        if g['winner'] is not None and g['loser'] is None:
+            g['loser'] = next((t for t in g['teams'] if t != g['winner']), None)
+
+        rounds = bottom_round if g['bottom'] else top_round
+        for team in g['teams']:
+            if team is not None:
+                rounds[team] = max(rounds.get(team, 0), g['round'])
+
+        if g['places']:
+            if g['winner'] is None:
+                return None
+            for team, place in zip((g['winner'], g['loser']), g['places']):
+                if team is not None and team not in places and place not in places.values():
+                    places[team] = place
+
+    def stage(team):
+        if team in top_round:
+            return (0, -top_round[team], seed[team])
+        if team not in bottom_round:
+            return (1, 0, seed[team])
+        return (2, bottom_round[team], seed[team])
+
+    free = [p for p in range(1, len(standings) + 1) if p not in places.values()]
+    rest = sorted((team for team in standings if team not in places), key=stage)
+    places.update(zip(rest, free))
+    return [team for team, _ in sorted(places.items(), key=lambda item: item[1])]
+
+def sleeper_games(winners_bracket, losers_bracket, n_teams):
+    """
+    Games from Sleeper's winners_bracket and losers_bracket
+
+    p marks a placement game: in the winners bracket the winner finishes
+    p-th, in the losers bracket Sleeper's "winner" is the team that keeps
+    losing, so p counts up from last place.
+    """
+    games = []
+    for prefix, bracket in (('W', winners_bracket), ('L', losers_bracket or [])):
+        bottom = prefix == 'L'
+        for m in bracket:
+            sources = []
+            for slot in ('t1_from', 't2_from'):
+                src = m.get(slot) or {}
+                kind = 'winner' if 'w' in src else 'loser' if 'l' in src else None
+                sources.append((kind, (prefix, src.get('w') or src.get('l'))) if kind else None)
+
+            places = None
+            if m.get('p'):
+                p = m['p']
+                places = (n_teams + 1 - p, n_teams - p) if bottom else (p, p + 1)
+            games.append({
+                'id': (prefix, m['m']),
+                'round': m['r'],
+                'teams': [m.get('t1'), m.get('t2')],
+                'from': sources,
+                'winner': m.get('w'),
+                'loser': m.get('l'),
+                'places': places,
+                'bottom': bottom
+            })
+    return games
+
+def mfl_games(brackets, standings):
+    """
+    Games from MFL playoffBracket exports ({bracket_id: playoffBracket})
+
+    MFL brackets don't say what they are played for, so it is inferred: a
+    bracket whose best team finished in the bottom half of the regular
+    season is a losers bracket, decided from last place up (the loser of
+    its final finishes last); the others are decided from first place down,
+    the bracket with the best team first. A bracket's final is the game
+    nothing else is fed from; a last-round game between losers of earlier
+    games is for the places after the final's.
+    """
+    seed = {team: i for i, team in enumerate(standings)}
+    n_teams = len(standings)
+    by_bracket = {}
+
+    for bracket_id, bracket in brackets.items():
+        games = by_bracket[bracket_id] = []
+        for round_number, playoff_round in enumerate(as_list(bracket.get('playoffRound')), 1):
+            for game in as_list(playoff_round.get('playoffGame')):
+                teams, sources, points = [], [], []
+                for side in ('home', 'away'):
+                    team = game.get(side) or {}
+                    teams.append(team.get('franchise_id'))
+                    if team.get('winner_of_game'):
+                        sources.append(('winner', (bracket_id, team['winner_of_game'])))
+                    elif team.get('loser_of_game'):
+                        sources.append(('loser', (bracket_id, team['loser_of_game'])))
+                    else:
+                        sources.append(None)
+                    points.append(float(team['points']) if team.get('points') not in (None, '') else None)
+
+                winner = loser = None
+                if None not in teams and None not in points and points[0] != points[1]:
+                    winner, loser = (teams[0], teams[1]) if points[0] > points[1] else (teams[1], teams[0])
+                games.append({
+                    'id': (bracket_id, game.get('game_id')),
+                    'round': round_number,
+                    'teams': teams,
+                    'from': sources,
+                    'winner': winner,
+                    'loser': loser,
+                    'places': None,
+                    'bottom': False
+                })
+
+    def best_seed(bracket_id):
+        teams = [team for g in by_bracket[bracket_id] for team in g['teams'] if team is not None]
+        return min((seed.get(team, n_teams) for team in teams), default=n_teams)
+
+    def finals(bracket_id):
+        """Games nothing is fed from, the final first and games between losers after it"""
+        games = by_bracket[bracket_id]
+        fed = {src[1] for g in games for src in g['from'] if src}
+        return sorted(
+            (g for g in games if g['id'] not in fed),
+            key=lambda g: (-g['round'], any(src and src[0] == 'loser' for src in g['from']))
+        )
+
+    ranked = sorted(by_bracket, key=best_seed)
+    top = [b for b in ranked if best_seed(b) < n_teams // 2]
+    # The bracket of the worst teams decides last place
+    bottom = [b for b in reversed(ranked) if b not in top]
+
+    next_top = 1
+    for bracket_id in top:
+        for g in finals(bracket_id):
+            g['places'] = (next_top, next_top + 1)
+            next_top += 2
+
+    next_bottom = n_teams
+    for bracket_id in bottom:
+        for g in by_bracket[bracket_id]:
+            g['bottom'] = True
+        for g in finals(bracket_id):
+            g['places'] = (next_bottom - 1, next_bottom)
+            next_bottom -= 2
+
+    return [g for games in by_bracket.values() for g in games]
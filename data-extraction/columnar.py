@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Columnar JSON encoding for published dashboard data
+
+Lists of records with the same keys (and objects whose values are such
+records, e.g. {"2016": {...}, "2017": {...}}) are stored as one array per
+column instead of repeating every key in every record:
+
+    [{"owner": "mikeion", "wins": 9}, {"owner": "rpthorp", "wins": 7}]
+    -> {"$c": ["owner", "wins"], "$v": [["mikeion", "rpthorp"], [9, 7]]}
+
+String columns with repeated values (owners, platforms, ...) are
+dictionary-encoded as {"$d": [distinct values], "$i": [index per row]}, and
+object-of-records tables keep their keys in "$k". Encoded payloads are wrapped
+as {"$columnar": 1, "data": ...}; decodeColumnar() in league-data.js undoes it
+and passes plain JSON through unchanged.
+
+    python columnar.py FILE.json    # compare sizes and check the round trip
+"""
+import json
+import sys
+
+def is_table(records):
+    """True for two or more dicts that all have the same (non-empty) keys"""
+    if len(records) < 2 or not all(isinstance(r, dict) and r for r in records):
+        return False
+    keys = set(records[0])
+    return all(set(r) == keys for r in records)
+
+def encode_column(values):
+    if all(isinstance(v, str) for v in values) and len(set(values)) < len(values):
+        distinct = list(dict.fromkeys(values))
+        index = {v: i for i, v in enumerate(distinct)}
+        return {'$d': distinct, '$i': [index[v] for v in values]}
+    return values
+
+def encode_table(records, keys=None):
+    columns = list(records[0])
+    table = {
+        '$c': columns,
+        '$v': [encode_column([encode_value(r[c]) for r in records]) for c in columns]
+    }
+    if keys is not None:
+        table['$k'] = keys
+    return table
+
+def encode_value(value):
+    if isinstance(value, list):
+        if is_table(value):
+            return encode_table(value)
+        return [encode_value(v) for v in value]
+    if isinstance(value, dict):
+        if is_table(list(value.values())):
+            return encode_table(list(value.values()), keys=list(value))
+        return {k: encode_value(v) for k, v in value.items()}
+    return value
+
+def encode(data):
+    return {'$columnar': 1, 'data': encode_value(data)}
+
+def decode_value(value):
+    if isinstance(value, list):
+        return [decode_value(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if '$c' not in value:
+        return {k: decode_value(v) for k, v in value.items()}
+
+    columns = [
+        [col['$d'][i] for i in col['$i']] if isinstance(col, dict) else col
+        for col in value['$v']
+    ]
+    records = [
+        {name: decode_value(column[row]) for name, column in zip(value['$c'], columns)}
+        for row in range(len(columns[0]))
+    ]
+    if '$k' in value:
+        return dict(zip(value['$k'], records))
+    return records
+
+def decode(payload):
+    if isinstance(payload, dict) and payload.get('$columnar') == 1:
+        return decode_value(payload['data'])
+    return payload
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python columnar.py FILE.json [FILE.json ...]")
+        sys.exit(1)
+
+    for path in sys.argv[1:]:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        plain = json.dumps(data, separators=(',', ':'))
+        encoded = json.dumps(encode(data), separators=(',', ':'))
+        ok = decode(json.loads(encoded)) == data
+        print(f"  {path}: {len(plain) / 1024:.1f} KB -> {len(encoded) / 1024:.1f} KB "
+              f"({1 - len(encoded) / len(plain):.0%} smaller){'' if ok else '  ROUND TRIP FAILED'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Local server for html5up-landed that behaves like the Netlify deploy
+
+Serves the site with:
+
+  - the Netlify function routes backed by the published artifacts
+    (/api/h2h -> assets/data/h2h.json from publish_h2h.py), so the dashboard
+    takes the same path locally as in production
+  - Brotli/gzip negotiation, using the precompressed .br/.gz files
+    publish_assets.py writes and compressing anything else on the fly
+  - strong ETags per encoding, If-None-Match -> 304
+  - the Cache-Control rules from html5up-landed/_headers
+
+--load-test runs the server in the background and fetches the page-load path
+(the pages, the manifest, every published data file and /api/h2h) from many
+concurrent clients, then reports throughput and latency percentiles, first
+for cold loads and then for revalidations with If-None-Match.
+
+    python dev_server.py                  # http://localhost:8888
+    python dev_server.py --load-test 2000 --concurrency 50
+"""
+import argparse
+import fnmatch
+import gzip
+import hashlib
+import http.client
+import json
+import mimetypes
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from publish_assets import HEADERS_FILE
+from publish_bundle import ASSETS_DIR, MANIFEST_FILE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SITE_DIR = HEADERS_FILE.parent
+
+# Same paths as the config.path of each function in netlify/functions/
+API_ROUTES = {'/api/h2h': ASSETS_DIR / 'h2h.json'}
+
+PAGES = ['/index.html', '/season.html', '/alltime.html', '/user.html', '/weekly.html', '/assets/js/league-data.js']
+
+def parse_headers_file(path):
+    """[(path pattern, {header: value})] from a Netlify _headers file"""
+    rules = []
+    if not path.exists():
+        return rules
+    for line in path.read_text().splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        if not line[0].isspace():
+            rules.append((line.strip(), {}))
+        elif rules and ':' in line:
+            name, value = line.split(':', 1)
+            rules[-1][1][name.strip()] = value.strip()
+    return rules
+
+def resolve(url_path):
+    """File for a request path, or None"""
+    if url_path in API_ROUTES:
+        return API_ROUTES[url_path] if API_ROUTES[url_path].is_file() else None
+    if url_path.endswith('/'):
+        url_path += 'index.html'
+    path = (SITE_DIR / unquote(url_path).lstrip('/')).resolve()
+    if SITE_DIR.resolve() not in path.parents or not path.is_file():
+        return None
+    return path
+
+# (path, mtime, encoding) -> (body, etag)
+_representations = {}
+_representations_lock = threading.Lock()
+
+def representation(path, encoding):
+    """Body and strong ETag of a file in an encoding ('br', 'gzip' or None)"""
+    key = (path, path.stat().st_mtime_ns, encoding)
+    with _representations_lock:
+        if key in _representations:
+            return _representations[key]
+
+    precompressed = path.with_name(path.name + {'br': '.br', 'gzip': '.gz'}.get(encoding, ''))
+    if encoding and precompressed.exists():
+        body = precompressed.read_bytes()
+    elif encoding == 'br':
+        body = brotli.compress(path.read_bytes(), quality=5)
+    elif encoding == 'gzip':
+        body = gzip.compress(path.read_bytes(), compresslevel=6, mtime=0)
+    else:
+        body = path.read_bytes()
+    etag = '"' + hashlib.sha256(body).hexdigest()[:16] + (f'-{encoding}' if encoding else '') + '"'
+
+    with _representations_lock:
+        _representations[key] = (body, etag)
+    return body, etag
+
+def choose_encoding(accept_encoding, content_type):
+    accepted = {part.split(';')[0].strip() for part in (accept_encoding or '').split(',')}
+    if not (content_type.startswith('text/') or content_type in ('application/json', 'application/javascript')):
+        return None
+    if 'br' in accepted and brotli:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+class DevHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; don't let Nagle delay the body
+    disable_nagle_algorithm = True
+    header_rules = []
+    quiet = False
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        url_path = urlsplit(self.path).path
+        path = resolve(url_path)
+        if path is None:
+            body = json.dumps({'error': 'Not found'}).encode() if url_path.startswith('/api/') else b'Not found'
+            self.send_response(404)
+            self.send_header('Content-Type', 'application/json' if url_path.startswith('/api/') else 'text/plain')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+            return
+
+        content_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        encoding = choose_encoding(self.headers.get('Accept-Encoding'), content_type)
+        body, etag = representation(path, encoding)
+
+        headers = {'Content-Type': content_type, 'ETag': etag, 'Vary': 'Accept-Encoding'}
+        if encoding:
+            headers['Content-Encoding'] = encoding
+        for pattern, rule_headers in self.header_rules:
+            if fnmatch.fnmatch(url_path, pattern):
+                headers.update(rule_headers)
+        if url_path.startswith('/api/'):
+            # get-h2h.mjs caches its response for an hour
+            headers.setdefault('Cache-Control', 'public, max-age=3600')
+
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(',')]:
+            self.send_response(304)
+            for name, value in headers.items():
+                if name not in ('Content-Type', 'Content-Encoding'):
+                    self.send_header(name, value)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+def make_server(port):
+    DevHandler.header_rules = parse_headers_file(HEADERS_FILE)
+    return ThreadingHTTPServer(('127.0.0.1', port), DevHandler)
+
+def page_load_paths():
+    """What a visitor's browser fetches: pages, manifest, data files and the API"""
+    paths = PAGES + ['/assets/data/manifest.json'] + [route for route, path in API_ROUTES.items() if path.exists()]
+    if MANIFEST_FILE.exists():
+        with open(MANIFEST_FILE, 'r') as f:
+            manifest = json.load(f)
+        paths += [f'/assets/data/{path}' for path in manifest.get('files', {}).values()]
+        if manifest.get('dashboard'):
+            paths.append(f"/assets/data/{manifest['dashboard']}")
+    return paths
+
+def percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+def load_test(port, requests_total, concurrency, revalidate):
+    """Fetch the page-load paths from concurrent clients; returns (latencies, bytes, statuses, seconds)"""
+    paths = page_load_paths()
+    etags = {}
+    if revalidate:
+        for path in paths:
+            conn = http.client.HTTPConnection('127.0.0.1', port)
+            conn.request('GET', path, headers={'Accept-Encoding': 'br, gzip'})
+            response = conn.getresponse()
+            response.read()
+            etags[path] = response.getheader('ETag')
+            conn.close()
+
+    local = threading.local()
+    lock = threading.Lock()
+    latencies, statuses = [], {}
+    received = [0]
+
+    def fetch(i):
+        # One keep-alive connection per client thread, like a browser
+        if not hasattr(local, 'conn'):
+            local.conn = http.client.HTTPConnection('127.0.0.1', port)
+        path = paths[i % len(paths)]
+        headers = {'Accept-Encoding': 'br, gzip'}
+        if revalidate and etags.get(path):
+            headers['If-None-Match'] = etags[path]
+
+        started = time.perf_counter()
+        local.conn.request('GET', path, headers=headers)
+        response = local.conn.getresponse()
+        body = response.read()
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+            received[0] += len(body)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(fetch, range(requests_total)))
+    return sorted(latencies), received[0], statuses, time.perf_counter() - started
+
+def report(label, latencies, received, statuses, seconds):
+    ms = [latency * 1000 for latency in latencies]
+    print(f"\n  {label}: {len(ms)} requests in {seconds:.2f}s ({len(ms) / seconds:.0f} req/s), "
+          f"{received / 1024:.0f} KB, status {statuses}")
+    print(f"    p50 {percentile(ms, 50):.1f} ms   p90 {percentile(ms, 90):.1f} ms   "
+          f"p99 {percentile(ms, 99):.1f} ms   max {ms[-1]:.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve html5up-landed locally with the Netlify routes")
+    parser.add_argument('--port', type=int, default=8888)
+    parser.add_argument('--load-test', type=int, metavar='REQUESTS', help="run a load test with this many requests")
+    parser.add_argument('--concurrency', type=int, default=20, help="concurrent clients for --load-test (default 20)")
+    args = parser.parse_args()
+
+    if not brotli:
+        print("  brotli not installed, only serving gzip (pip install brotli)")
+
+    if not args.load_test:
+        server = make_server(args.port)
+        print(f"Serving {SITE_DIR} at http://localhost:{args.port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n✓ Stopped")
+        return
+
+    DevHandler.quiet = True
+    server = make_server(0)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"Load testing {len(page_load_paths())} page-load paths with {args.concurrency} clients...")
+    report('Cold loads', *load_test(port, args.load_test, args.concurrency, revalidate=False))
+    report('Revalidations', *load_test(port, args.load_test, args.concurrency, revalidate=True))
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Full draft boards for every season in one indexed pick table
+
+Loads every pick from every round (MFL draftResults from the existing
+output/mfl/mfl_<year>.json extracts, Sleeper picks from the API) into
+output/drafts/draft_picks.db, a SQLite table keyed by season/unit/round/pick
+with indexes on owner, player and position. Owners are mapped to Sleeper
+usernames and each pick carries the player's name, position and NFL team, so
+questions like "early RB vs early WR" are local queries:
+
+    python draft_store.py               # rebuild the store
+    python draft_store.py --rounds 3    # position mix of each owner's first 3 rounds
+"""
+import argparse
+import json
+import sqlite3
+from pathlib import Path
+
+from sleeper_api import get_draft_picks, get_roster_owners, resolve_league_history
+
+BASE_DIR = Path(__file__).parent
+MFL_DIR = BASE_DIR / 'output' / 'mfl'
+DB_FILE = BASE_DIR / 'output' / 'drafts' / 'draft_picks.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS picks (
+    season      INTEGER NOT NULL,
+    platform    TEXT    NOT NULL,
+    draft_unit  TEXT    NOT NULL,
+    round       INTEGER NOT NULL,
+    round_pick  INTEGER NOT NULL,
+    pick_no     INTEGER NOT NULL,
+    owner       TEXT,
+    player_id   TEXT,
+    player_name TEXT,
+    position    TEXT,
+    nfl_team    TEXT,
+    PRIMARY KEY (season, draft_unit, round, round_pick)
+);
+CREATE INDEX IF NOT EXISTS picks_owner ON picks (owner, season);
+CREATE INDEX IF NOT EXISTS picks_player ON picks (player_id);
+CREATE INDEX IF NOT EXISTS picks_position ON picks (position, round);
+"""
+
+COLUMNS = [
+    'season', 'platform', 'draft_unit', 'round', 'round_pick', 'pick_no',
+    'owner', 'player_id', 'player_name', 'position', 'nfl_team'
+]
+
+# Load owner mapping
+with open(BASE_DIR / 'owner_mapping.json', 'r') as f:
+    mfl_to_sleeper = json.load(f)['mfl_to_sleeper']
+
+def connect(db_file=DB_FILE):
+    """Open the pick store, creating the table and indexes if needed"""
+    db_file.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_file)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+def as_list(value):
+    """MFL returns a bare object instead of a one-item list"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def mfl_owner(franchise_id):
+    """Map MFL franchise ID to (lowercase) Sleeper username"""
+    username = mfl_to_sleeper.get(str(franchise_id).zfill(4), {}).get('sleeper_username')
+    return username.lower() if username else None
+
+def mfl_picks(year, mfl_data):
+    """Build pick rows for one MFL season from its extract"""
+    players = {
+        p['id']: p for p in as_list(
+            ((mfl_data.get('players') or {}).get('players') or {}).get('player')
+        )
+    }
+    draft_results = (mfl_data.get('draft_results') or {}).get('draftResults') or {}
+
+    rows = []
+    for unit in as_list(draft_results.get('draftUnit')):
+        unit_picks = as_list(unit.get('draftPick'))
+        teams = len([f for f in unit.get('round1DraftOrder', '').split(',') if f])
+        teams = teams or len({p['franchise'] for p in unit_picks})
+
+        for pick in unit_picks:
+            # Unused/skipped picks come back without a player
+            if not pick.get('player'):
+                continue
+            round_no = int(pick['round'])
+            round_pick = int(pick['pick'])
+            player = players.get(pick['player'], {})
+            rows.append({
+                'season': year,
+                'platform': 'mfl',
+                'draft_unit': unit.get('unit', ''),
+                'round': round_no,
+                'round_pick': round_pick,
+                'pick_no': (round_no - 1) * teams + round_pick,
+                'owner': mfl_owner(pick['franchise']),
+                'player_id': pick['player'],
+                # MFL names are "Last, First"
+                'player_name': ' '.join(reversed(player['name'].split(', '))) if player.get('name') else None,
+                'position': player.get('position'),
+                'nfl_team': player.get('team')
+            })
+    return rows
+
+def sleeper_picks(year, league_id):
+    """Build pick rows for one Sleeper season (two requests for owners, cached picks)"""
+    draft, picks = get_draft_picks(league_id)
+    if not picks:
+        return []
+
+    roster_owners = get_roster_owners(league_id)
+    teams = (draft.get('settings') or {}).get('teams') or len(roster_owners)
+    rows = []
+    for pick in picks:
+        metadata = pick.get('metadata') or {}
+        name = f"{metadata.get('first_name', '')} {metadata.get('last_name', '')}".strip()
+        rows.append({
+            'season': year,
+            'platform': 'sleeper',
+            'draft_unit': '',
+            'round': pick['round'],
+            'round_pick': pick['pick_no'] - (pick['round'] - 1) * teams,
+            'pick_no': pick['pick_no'],
+            'owner': (roster_owners.get(pick['roster_id']) or '').lower() or None,
+            'player_id': pick.get('player_id'),
+            'player_name': name or None,
+            'position': metadata.get('position'),
+            'nfl_team': metadata.get('team')
+        })
+    return rows
+
+def store_season(conn, season, rows):
+    """Replace one season's picks"""
+    with conn:
+        conn.execute("DELETE FROM picks WHERE season = ?", (season,))
+        conn.executemany(
+            f"INSERT INTO picks ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+            [tuple(row[c] for c in COLUMNS) for row in rows]
+        )
+
+def stored_seasons(conn):
+    """Seasons already in the store"""
+    return {row['season'] for row in conn.execute("SELECT DISTINCT season FROM picks")}
+
+def build_store(conn, refresh=False):
+    """Load every season not yet in the store (all of them with refresh=True)"""
+    have = set() if refresh else stored_seasons(conn)
+
+    for year_file in sorted(MFL_DIR.glob('mfl_[0-9][0-9][0-9][0-9].json')):
+        year = int(year_file.stem.split('_')[1])
+        if year in have:
+            continue
+        with open(year_file, 'r') as f:
+            rows = mfl_picks(year, json.load(f))
+        store_season(conn, year, rows)
+        print(f"  {year} (MFL): {len(rows)} picks")
+
+    league_ids = resolve_league_history()
+    latest = max(league_ids) if league_ids else None
+    for year, league_id in league_ids.items():
+        # The newest season can still be drafting, so always reload it
+        if year in have and year != latest:
+            continue
+        rows = sleeper_picks(year, league_id)
+        store_season(conn, year, rows)
+        print(f"  {year} (Sleeper): {len(rows)} picks")
+
+def early_round_positions(conn, max_round=2):
+    """Per-owner count of picks by position within the first max_round rounds"""
+    query = """
+        SELECT owner, position, COUNT(*) AS picks
+        FROM picks
+        WHERE round <= ? AND owner IS NOT NULL
+        GROUP BY owner, position
+        ORDER BY owner, picks DESC
+    """
+    mix = {}
+    for row in conn.execute(query, (max_round,)):
+        mix.setdefault(row['owner'], {})[row['position'] or '?'] = row['picks']
+    return mix
+
+def owner_board(conn, owner):
+    """Every pick an owner has made, oldest first"""
+    query = "SELECT * FROM picks WHERE owner = ? ORDER BY season, round, round_pick"
+    return [dict(row) for row in conn.execute(query, (owner,))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the draft pick store")
+    parser.add_argument('--rounds', type=int, help="show each owner's position mix in the first N rounds")
+    parser.add_argument('--refresh', action='store_true', help="reload every season")
+    args = parser.parse_args()
+
+    conn = connect()
+
+    if args.rounds:
+        print(f"Position mix in rounds 1-{args.rounds}:")
+        for owner, positions in sorted(early_round_positions(conn, args.rounds).items()):
+            mix = ', '.join(f"{pos} {count}" for pos, count in positions.items())
+            print(f"  {owner:22} {mix}")
+        return
+
+    print("Building draft pick store...")
+    build_store(conn, refresh=args.refresh)
+    total = conn.execute("SELECT COUNT(*) FROM picks").fetchone()[0]
+    print(f"\n✓ {total} picks saved to {DB_FILE}")
+
+if __name__ == "__main__":
+    main()
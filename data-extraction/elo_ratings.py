@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Cross-era Elo ratings for every owner, 2016 to now
+
+Replays every head-to-head game (MFL, then Yahoo, then Sleeper; regular season
+and playoffs) in chronological order through a margin-of-victory Elo:
+
+  - everyone starts at `initial`
+  - each game moves both ratings by k * MOV multiplier * (result - expected),
+    where the multiplier grows with the log of the score margin and shrinks
+    when the favourite wins big (so blowouts by strong teams don't snowball)
+  - all of a week's games are rated off the ratings at the start of that week,
+    so two-game weeks (MFL division years) don't depend on game order
+  - at the first game of each new season ratings regress toward `initial` by
+    (1 - carryover), which also smooths the jumps between platforms
+
+State is kept in output/cache/elo_state.json (ratings, last week processed and
+every owner's trajectory), so a run only rates the final weeks after the last
+one processed. Use --rebuild to replay everything, e.g. after changing SETTINGS
+or a stat correction to an already rated week. Trajectories are published to
+html5up-landed/assets/data/elo_ratings.json for the user profile pages.
+"""
+import argparse
+import json
+import math
+from pathlib import Path
+
+from power_rankings import digest
+from weekly_scores import games_by_season, load_games
+
+BASE_DIR = Path(__file__).parent
+STATE_FILE = BASE_DIR / 'output' / 'cache' / 'elo_state.json'
+ASSETS_DIR = BASE_DIR.parent / 'html5up-landed' / 'assets' / 'data'
+OUTPUT_FILE = ASSETS_DIR / 'elo_ratings.json'
+
+SETTINGS = {
+    'initial': 1500,
+    'k': 24,
+    'carryover': 0.75
+}
+
+def new_state():
+    return {'settings': digest(SETTINGS), 'processed': None, 'ratings': {}, 'games': {}, 'history': {}}
+
+def load_state(rebuild=False):
+    """Load the saved ratings; started over if the settings have changed since"""
+    if STATE_FILE.exists() and not rebuild:
+        with open(STATE_FILE, 'r') as f:
+            state = json.load(f)
+        if state.get('settings') == digest(SETTINGS):
+            return state
+    return new_state()
+
+def save_state(state):
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_FILE, 'w') as f:
+        json.dump(state, f, indent=2)
+
+def expected_score(rating, opponent):
+    return 1 / (1 + 10 ** ((opponent - rating) / 400))
+
+def mov_multiplier(margin, winner_edge):
+    """Margin-of-victory multiplier; winner_edge is the winner's pre-game rating lead"""
+    return math.log(abs(margin) + 1) * 2.2 / (winner_edge * 0.001 + 2.2)
+
+def start_season(state):
+    """Regress every rating toward the mean at the start of a new season"""
+    carryover = SETTINGS['carryover']
+    initial = SETTINGS['initial']
+    state['ratings'] = {
+        owner: initial + (rating - initial) * carryover
+        for owner, rating in state['ratings'].items()
+    }
+
+def rate_week(state, season, week, week_games):
+    """Apply one week of games; cost is proportional to the games in it"""
+    ratings = state['ratings']
+    initial = SETTINGS['initial']
+    changes = {}
+    played = {}
+
+    for game in week_games:
+        (a, b), (pa, pb) = game['teams'], game['points']
+        ra, rb = ratings.get(a, initial), ratings.get(b, initial)
+        result = 1.0 if pa > pb else 0.0 if pb > pa else 0.5
+        edge = (ra - rb) if pa >= pb else (rb - ra)
+        # Ties have no margin, but still pull the ratings together
+        multiplier = mov_multiplier(pa - pb, edge) if result != 0.5 else 1.0
+        shift = SETTINGS['k'] * multiplier * (result - expected_score(ra, rb))
+        changes[a] = changes.get(a, 0.0) + shift
+        changes[b] = changes.get(b, 0.0) - shift
+        played[a] = played.get(a, 0) + 1
+        played[b] = played.get(b, 0) + 1
+
+    for owner, change in changes.items():
+        rating = ratings.get(owner, initial) + change
+        ratings[owner] = rating
+        state['games'][owner] = state['games'].get(owner, 0) + played[owner]
+        state['history'].setdefault(owner, []).append([season, week, round(rating, 1)])
+
+    state['processed'] = [season, week]
+
+def update(state, games):
+    """Rate every final week after the last one processed; returns the weeks rated"""
+    processed = tuple(state['processed']) if state['processed'] else (0, 0)
+    rated = []
+    for season, weeks in games_by_season(games).items():
+        for week, week_games in weeks.items():
+            if (season, week) <= processed:
+                continue
+            # Nothing after an in-progress week can be final either
+            if not all(game['final'] for game in week_games):
+                return rated
+            if season != processed[0]:
+                start_season(state)
+                processed = (season, 0)
+            rate_week(state, season, week, week_games)
+            processed = (season, week)
+            rated.append((season, week))
+    return rated
+
+def publish(state):
+    """Current table and per-owner trajectories for the dashboard"""
+    current = []
+    for owner, rating in state['ratings'].items():
+        history = state['history'].get(owner, [])
+        peak = max(history, key=lambda point: point[2]) if history else None
+        current.append({
+            'owner': owner,
+            'rating': round(rating, 1),
+            'games': state['games'].get(owner, 0),
+            'peak': peak[2] if peak else None,
+            'peak_season': peak[0] if peak else None,
+            'peak_week': peak[1] if peak else None
+        })
+    current.sort(key=lambda row: row['rating'], reverse=True)
+
+    output = {
+        'settings': SETTINGS,
+        'processed': state['processed'],
+        'current': current,
+        # [season, week, rating after that week] for every week the owner played
+        'history': state['history']
+    }
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump(output, f, indent=2)
+    return output
+
+def main():
+    parser = argparse.ArgumentParser(description="Update cross-era Elo ratings")
+    parser.add_argument('--rebuild', action='store_true', help="replay every game from scratch")
+    args = parser.parse_args()
+
+    print("Updating Elo ratings...")
+
+    state = load_state(rebuild=args.rebuild)
+    rated = update(state, load_games())
+    if rated:
+        print(f"  Rated {len(rated)} weeks: {rated[0][0]} wk {rated[0][1]} - {rated[-1][0]} wk {rated[-1][1]}")
+    else:
+        print("  Up to date")
+
+    save_state(state)
+    output = publish(state)
+
+    print(f"\n✓ Elo ratings saved to {OUTPUT_FILE}")
+    print("\nTop ratings:")
+    for row in output['current'][:5]:
+        print(f"  {row['owner']:22} {row['rating']:7.1f} ({row['games']} games)")
+
+if __name__ == "__main__":
+    main()
@@ -13,14 +13,14 @@ LEAGUE_ID = "59111"
 YEARS = [2016, 2017, 2018, 2019]
 BASE_URL = "https://api.myfantasyleague.com/{year}/export"
 
-def fetch_mfl_data(year, export_type, params=None):
+def fetch_mfl_data(year, export_type, params=None, league_id=LEAGUE_ID):
     """Fetch data from MFL API"""
     url = BASE_URL.format(year=year)
 
     # Default params
     all_params = {
         'TYPE': export_type,
-        'L': LEAGUE_ID,
+        'L': league_id,
         'JSON': '1'  # Request JSON format
     }
 
@@ -36,7 +36,7 @@ def fetch_mfl_data(year, export_type, params=None):
         print(f"Error fetching {export_type} for {year}: {e}")
         return None
 
-def extract_league_data(year):
+def extract_league_data(year, league_id=LEAGUE_ID):
     """Extract all relevant data for a given year"""
     print(f"\nExtracting data for {year}...")
 
@@ -53,31 +53,31 @@ def extract_league_data(year):
 
     # Fetch league info
     print(f"  Fetching league info...")
-    data['league'] = fetch_mfl_data(year, 'league')
+    data['league'] = fetch_mfl_data(year, 'league', league_id=league_id)
 
     # Fetch standings
     print(f"  Fetching standings...")
-    data['league_standings'] = fetch_mfl_data(year, 'leagueStandings')
+    data['league_standings'] = fetch_mfl_data(year, 'leagueStandings', league_id=league_id)
 
     # Fetch rosters
     print(f"  Fetching rosters...")
-    data['rosters'] = fetch_mfl_data(year, 'rosters')
+    data['rosters'] = fetch_mfl_data(year, 'rosters', league_id=league_id)
 
     # Fetch players
     print(f"  Fetching players...")
-    data['players'] = fetch_mfl_data(year, 'players')
+    data['players'] = fetch_mfl_data(year, 'players', league_id=league_id)
 
     # Fetch schedule/matchups
     print(f"  Fetching schedule...")
-    data['schedule'] = fetch_mfl_data(year, 'leagueSchedules')
+    data['schedule'] = fetch_mfl_data(year, 'leagueSchedules', league_id=league_id)
 
     # Fetch transactions
     print(f"  Fetching transactions...")
-    data['transactions'] = fetch_mfl_data(year, 'transactions')
+    data['transactions'] = fetch_mfl_data(year, 'transactions', league_id=league_id)
 
     # Fetch draft results
     print(f"  Fetching draft results...")
-    data['draft_results'] = fetch_mfl_data(year, 'draftResults')
+    data['draft_results'] = fetch_mfl_data(year, 'draftResults', league_id=league_id)
 
     return data
 
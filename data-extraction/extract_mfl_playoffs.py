@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 """
 Extract playoff results from MyFantasyLeague playoff brackets
+
+Every bracket of the season (championship, consolation, Sacco, ...) is
+fetched once and resolved together by brackets.py into each franchise's final
+place; the regular-season order comes from the saved mfl_<year>.json.
 """
-import requests
 import json
+from pathlib import Path
+
+from brackets import as_list, mfl_games, resolve_placements
+from extract_mfl import LEAGUE_ID, fetch_mfl_data
+
+MFL_DIR = Path(__file__).parent / 'output' / 'mfl'
 
 # Load owner mapping
-with open('owner_mapping.json', 'r') as f:
+with open(Path(__file__).parent / 'owner_mapping.json', 'r') as f:
     owner_map = json.load(f)
     mfl_to_sleeper = owner_map['mfl_to_sleeper']
 
@@ -17,118 +26,47 @@ def get_owner_name(franchise_id):
         return mfl_to_sleeper[franchise_id].get('real_name', 'Unknown')
     return f'Franchise {franchise_id}'
 
-def get_playoff_results(year):
-    """Get playoff results for a given year using playoff bracket API"""
-    league_id = '59111'
-    base_url = f'https://api.myfantasyleague.com/{year}/export'
-
+def regular_season_order(year, league_id=LEAGUE_ID):
+    """Franchise IDs in final regular-season standings order"""
+    league_file = MFL_DIR / f'mfl_{year}.json'
+    standings = None
+    if league_file.exists():
+        with open(league_file, 'r') as f:
+            standings = json.load(f).get('league_standings')
+    if not standings:
+        standings = fetch_mfl_data(year, 'leagueStandings', league_id=league_id) or {}
+    return [franchise['id'] for franchise in as_list((standings.get('leagueStandings') or {}).get('franchise'))]
+
+def get_playoff_results(year, league_id=LEAGUE_ID):
+    """Get every franchise's final place from the season's playoff brackets"""
     print('\n' + '='*80)
     print(f'{year} PLAYOFFS')
     print('='*80)
 
+    bracket_list = fetch_mfl_data(year, 'playoffBrackets', league_id=league_id) or {}
+    brackets = {}
+    for bracket in as_list((bracket_list.get('playoffBrackets') or {}).get('playoffBracket')):
+        data = fetch_mfl_data(year, 'playoffBracket', {'BRACKET_ID': bracket['id']}, league_id=league_id) or {}
+        if data.get('playoffBracket'):
+            brackets[bracket['id']] = data['playoffBracket']
+            print(f"  Bracket {bracket['id']}: {bracket.get('name', '')}")
+
+    standings = regular_season_order(year, league_id)
+    placements = resolve_placements(mfl_games(brackets, standings), standings) if brackets and standings else None
+    if not placements:
+        print("  Could not resolve playoff placements")
+        return None
+
     results = {
         'year': year,
-        'champion': None,
-        'runner_up': None,
-        'third_place': None,
-        'sacko': None
+        'champion': get_owner_name(placements[0]),
+        'runner_up': get_owner_name(placements[1]),
+        'third_place': get_owner_name(placements[2]),
+        'sacko': get_owner_name(placements[-1]),
+        'placements': [get_owner_name(franchise_id) for franchise_id in placements]
     }
-
-    # Get Championship Bracket (id=1) - final game is championship
-    params = {
-        'TYPE': 'playoffBracket',
-        'L': league_id,
-        'BRACKET_ID': '1',
-        'JSON': '1'
-    }
-    response = requests.get(base_url, params=params)
-    champ_bracket = response.json()
-
-    if 'playoffBracket' in champ_bracket and 'playoffRound' in champ_bracket['playoffBracket']:
-        rounds = champ_bracket['playoffBracket']['playoffRound']
-        if not isinstance(rounds, list):
-            rounds = [rounds]
-
-        # Last round is the championship
-        final_round = rounds[-1]
-        if 'playoffGame' in final_round:
-            games = final_round['playoffGame']
-            if not isinstance(games, list):
-                games = [games]
-
-            # First game in final round is championship
-            champ_game = games[0]
-            away_id = champ_game['away']['franchise_id']
-            home_id = champ_game['home']['franchise_id']
-            away_score = float(champ_game['away']['points'])
-            home_score = float(champ_game['home']['points'])
-
-            if away_score > home_score:
-                results['champion'] = get_owner_name(away_id)
-                results['runner_up'] = get_owner_name(home_id)
-            else:
-                results['champion'] = get_owner_name(home_id)
-                results['runner_up'] = get_owner_name(away_id)
-
-            print(f"Championship: {results['champion']} defeated {results['runner_up']}")
-            print(f"  Score: {away_score} - {home_score}")
-
-    # Get Sacco Bracket (id=2) - winner gets Sacko
-    params['BRACKET_ID'] = '2'
-    response = requests.get(base_url, params=params)
-    sacco_bracket = response.json()
-
-    if 'playoffBracket' in sacco_bracket and 'playoffRound' in sacco_bracket['playoffBracket']:
-        rounds = sacco_bracket['playoffBracket']['playoffRound']
-        if not isinstance(rounds, list):
-            rounds = [rounds]
-
-        # Last round - winner gets Sacko
-        final_round = rounds[-1]
-        if 'playoffGame' in final_round:
-            games = final_round['playoffGame']
-            if not isinstance(games, list):
-                games = [games]
-
-            # First game in final round
-            # In Sacco bracket, loser of the final gets the Sacko (last place)
-            sacco_game = games[0]
-            away_id = sacco_game['away']['franchise_id']
-            home_id = sacco_game['home']['franchise_id']
-            away_score = float(sacco_game['away']['points'])
-            home_score = float(sacco_game['home']['points'])
-
-            # Loser gets the Sacko
-            if away_score > home_score:
-                results['sacko'] = get_owner_name(home_id)  # home lost
-            else:
-                results['sacko'] = get_owner_name(away_id)  # away lost
-
-            print(f"Sacko: {results['sacko']} (lost the Sacco Bracket final)")
-            print(f"  Score: {away_score} - {home_score}")
-
-    # Get 3rd Place Bracket (id=4)
-    params['BRACKET_ID'] = '4'
-    response = requests.get(base_url, params=params)
-    third_bracket = response.json()
-
-    if 'playoffBracket' in third_bracket and 'playoffRound' in third_bracket['playoffBracket']:
-        playoff_round = third_bracket['playoffBracket']['playoffRound']
-        if 'playoffGame' in playoff_round:
-            game = playoff_round['playoffGame']
-            away_id = game['away']['franchise_id']
-            home_id = game['home']['franchise_id']
-            away_score = float(game['away']['points'])
-            home_score = float(game['home']['points'])
-
-            if away_score > home_score:
-                results['third_place'] = get_owner_name(away_id)
-            else:
-                results['third_place'] = get_owner_name(home_id)
-
-            print(f"3rd Place: {results['third_place']}")
-            print(f"  Score: {away_score} - {home_score}")
-
+    for place, name in enumerate(results['placements'], 1):
+        print(f"  {place:2}. {name}")
     return results
 
 if __name__ == "__main__":
@@ -139,7 +77,7 @@ if __name__ == "__main__":
             all_results.append(results)
 
     # Save playoff results
-    with open('output/mfl/mfl_playoff_results.json', 'w') as f:
+    with open(MFL_DIR / 'mfl_playoff_results.json', 'w') as f:
         json.dump(all_results, f, indent=2)
 
     print(f'\n\n{"="*80}')
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Extract weekly head-to-head results from MyFantasyLeague (2016-2019)
+
+Saves output/mfl/mfl_<year>_weekly_results.json as a list of
+{'week': 1, 'matchups': [{'franchise': [{'id', 'score', 'result', ...}, ...]}]},
+the format recalculate_mfl_points.py and weekly_scores.py read. Division years
+have two matchups per franchise in some weeks; both are kept.
+"""
+import json
+from pathlib import Path
+
+from extract_mfl import LEAGUE_ID, YEARS, fetch_mfl_data
+
+OUTPUT_DIR = Path(__file__).parent / 'output' / 'mfl'
+
+def as_list(value):
+    """MFL returns a bare object instead of a one-item list"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def season_weeks(year):
+    """Week range from the stored league settings (falls back to 1-17)"""
+    league_file = OUTPUT_DIR / f'mfl_{year}.json'
+    if league_file.exists():
+        with open(league_file, 'r') as f:
+            league = ((json.load(f).get('league') or {}).get('league')) or {}
+        if league.get('startWeek') and league.get('endWeek'):
+            return range(int(league['startWeek']), int(league['endWeek']) + 1)
+    return range(1, 18)
+
+def extract_weekly_results(year, league_id=LEAGUE_ID):
+    """Fetch every week's matchups for one season"""
+    weeks = []
+    for week in season_weeks(year):
+        data = fetch_mfl_data(year, 'weeklyResults', {'W': str(week)}, league_id=league_id)
+        results = (data or {}).get('weeklyResults') or {}
+        matchups = [m for m in as_list(results.get('matchup')) if len(as_list(m.get('franchise'))) == 2]
+        if not matchups:
+            continue
+        weeks.append({'week': week, 'matchups': matchups})
+    return weeks
+
+def main():
+    print("Extracting MFL weekly results...")
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for year in YEARS:
+        weeks = extract_weekly_results(year)
+        output_file = OUTPUT_DIR / f'mfl_{year}_weekly_results.json'
+        with open(output_file, 'w') as f:
+            json.dump(weeks, f, indent=2)
+        print(f"  {year}: {len(weeks)} weeks, {sum(len(w['matchups']) for w in weeks)} games")
+
+    print(f"\n✓ Weekly results saved to {OUTPUT_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -2,64 +2,33 @@
 """
 Extract draft positions from Sleeper API
 """
-import requests
 import json
 from pathlib import Path
 
-# Sleeper league IDs
-LEAGUE_IDS = {
-    2022: "859910378069577728",
-    2023: "998364322315190272",
-    2024: "1124841011114168320",
-    2025: "1257482235834028032"
-}
-
-def get_username_from_roster(league_id, roster_id):
-    """Get username for a roster ID"""
-    rosters = requests.get(f"https://api.sleeper.app/v1/league/{league_id}/rosters").json()
-    roster = next((r for r in rosters if r['roster_id'] == roster_id), None)
-
-    if not roster:
-        return None
-
-    users = requests.get(f"https://api.sleeper.app/v1/league/{league_id}/users").json()
-    user = next((u for u in users if u['user_id'] == roster['owner_id']), None)
-
-    if not user:
-        return None
-
-    profile = requests.get(f"https://api.sleeper.app/v1/user/{user['user_id']}").json()
-    return profile.get('username') if profile else None
+from sleeper_api import get_draft_picks, get_roster_owners, resolve_league_history
 
 def extract_draft_order(league_id, year):
     """Extract draft order for a given year"""
-    # Get drafts for this league
-    drafts_url = f"https://api.sleeper.app/v1/league/{league_id}/drafts"
-    drafts = requests.get(drafts_url).json()
+    # Get the league's draft and all of its picks (cached once the draft is complete)
+    draft, picks = get_draft_picks(league_id)
 
-    if not drafts or len(drafts) == 0:
+    if not draft:
         print(f"  No draft data found")
         return None
 
-    # Get the first draft (there's usually only one per season)
-    draft_id = drafts[0]['draft_id']
-
-    # Get all picks
-    picks_url = f"https://api.sleeper.app/v1/draft/{draft_id}/picks"
-    picks = requests.get(picks_url).json()
-
     if not picks:
-        print(f"  No picks found for draft {draft_id}")
+        print(f"  No picks found for draft {draft['draft_id']}")
         return None
 
     # Get round 1 picks only
     round1_picks = [p for p in picks if p['round'] == 1]
     round1_picks.sort(key=lambda x: x['pick_no'])
 
-    # Build draft order mapping
+    # Build draft order mapping (one batched owner lookup for the whole league)
+    roster_owners = get_roster_owners(league_id)
     draft_order = {}
     for pick in round1_picks:
-        username = get_username_from_roster(league_id, pick['roster_id'])
+        username = roster_owners.get(pick['roster_id'])
         if username:
             draft_order[username] = {
                 'pick': pick['pick_no'],
@@ -75,8 +44,10 @@ def main():
 
     all_draft_data = {}
 
-    for year in sorted(LEAGUE_IDS.keys()):
-        league_id = LEAGUE_IDS[year]
+    # Season -> league ID, discovered by walking previous_league_id (cached)
+    league_ids = resolve_league_history()
+
+    for year, league_id in league_ids.items():
         print(f"\n{year} (League ID: {league_id})")
 
         draft_order = extract_draft_order(league_id, year)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Extract weekly matchup payloads (starters, players, players_points) from Sleeper
+
+Saves one file per season to output/sleeper/matchups/sleeper_matchups_<season>.json
+together with the league's roster slots and a roster_id -> username map.
+Completed seasons are never re-fetched; for the current season only the newest
+stored week (stat corrections) and weeks after it are requested.
+"""
+import json
+from pathlib import Path
+
+from sleeper_api import fetch_json, get_roster_owners, resolve_league_history
+
+OUTPUT_DIR = Path(__file__).parent / 'output' / 'sleeper' / 'matchups'
+MAX_WEEK = 18
+
+def season_file(season):
+    return OUTPUT_DIR / f'sleeper_matchups_{season}.json'
+
+def load_season_matchups(season):
+    """Load a stored season (None if it hasn't been extracted)"""
+    if not season_file(season).exists():
+        return None
+    with open(season_file(season), 'r') as f:
+        return json.load(f)
+
+def last_week_to_fetch(league):
+    """Latest week worth requesting for a league"""
+    if league.get('status') == 'complete':
+        return MAX_WEEK
+    state = fetch_json("state/nfl")
+    if str(state.get('season')) != str(league['season']):
+        return 0
+    return min(int(state.get('week') or 0), MAX_WEEK)
+
+def extract_season_matchups(season, league_id, refresh=False):
+    """Fetch (or top up) one season's weekly matchups and save them"""
+    existing = None if refresh else load_season_matchups(season)
+    if existing and existing['status'] == 'complete':
+        return existing
+
+    league = fetch_json(f"league/{league_id}")
+    weeks = dict(existing['weeks']) if existing else {}
+
+    # Re-fetch the newest stored week as well, since scores get corrected after MNF
+    first_week = max([int(week) for week in weeks], default=1)
+    current_week = last_week_to_fetch(league)
+    for week in range(first_week, current_week + 1):
+        matchups = fetch_json(f"league/{league_id}/matchups/{week}")
+        if matchups and any(m.get('points') for m in matchups):
+            weeks[str(week)] = matchups
+
+    data = {
+        'season': season,
+        'league_id': league_id,
+        'status': league.get('status'),
+        'roster_positions': league.get('roster_positions', []),
+        'scoring_settings': league.get('scoring_settings', {}),
+        'playoff_week_start': league.get('settings', {}).get('playoff_week_start'),
+        # Weeks before this one are final; this week may still be in progress
+        'current_week': current_week,
+        'roster_owners': {str(rid): owner for rid, owner in get_roster_owners(league_id).items()},
+        'weeks': dict(sorted(weeks.items(), key=lambda item: int(item[0])))
+    }
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(season_file(season), 'w') as f:
+        json.dump(data, f, indent=2)
+
+    return data
+
+def load_all_matchups():
+    """Every stored season, oldest first"""
+    seasons = {}
+    for path in sorted(OUTPUT_DIR.glob('sleeper_matchups_[0-9][0-9][0-9][0-9].json')):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        seasons[data['season']] = data
+    return seasons
+
+def main():
+    print("Extracting Sleeper weekly matchups...")
+
+    for season, league_id in resolve_league_history().items():
+        data = extract_season_matchups(season, league_id)
+        print(f"  {season}: {len(data['weeks'])} weeks ({data['status']})")
+
+    print(f"\n✓ Matchups saved to {OUTPUT_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Extract every Sleeper transaction (waivers, free agent moves, trades)
+
+Each season is an append-only log, output/sleeper/transactions/
+sleeper_transactions_<season>.jsonl, with one transaction per line. A
+transaction is only appended when it is new or has changed since its last
+line (e.g. a pending waiver that was processed); readers keep the last line
+per transaction_id. A small sleeper_transactions_<season>.state.json next to
+it records the weeks fetched, the league status and FAAB budget.
+
+Like extract_sleeper_matchups.py, completed seasons are never re-fetched and
+the current season only re-requests the newest fetched week and the weeks
+after it.
+"""
+import json
+from pathlib import Path
+
+from extract_sleeper_matchups import last_week_to_fetch
+from sleeper_api import fetch_json, resolve_league_history
+
+OUTPUT_DIR = Path(__file__).parent / 'output' / 'sleeper' / 'transactions'
+
+def log_file(season):
+    return OUTPUT_DIR / f'sleeper_transactions_{season}.jsonl'
+
+def state_file(season):
+    return OUTPUT_DIR / f'sleeper_transactions_{season}.state.json'
+
+def read_log(season):
+    """Latest version of every logged transaction, by transaction_id"""
+    transactions = {}
+    if log_file(season).exists():
+        with open(log_file(season), 'r') as f:
+            for line in f:
+                if line.strip():
+                    tx = json.loads(line)
+                    transactions[tx['transaction_id']] = tx
+    return transactions
+
+def load_season_transactions(season):
+    """Load a stored season (None if it hasn't been extracted)"""
+    if not state_file(season).exists():
+        return None
+    with open(state_file(season), 'r') as f:
+        data = json.load(f)
+    data['transactions'] = sorted(
+        read_log(season).values(),
+        key=lambda tx: (tx.get('created') or 0, tx['transaction_id'])
+    )
+    return data
+
+def extract_season_transactions(season, league_id, refresh=False):
+    """Fetch one season's new transactions and append them to its log"""
+    existing = None if refresh else load_season_transactions(season)
+    if existing and existing['status'] == 'complete':
+        return existing
+    if refresh and log_file(season).exists():
+        log_file(season).unlink()
+
+    league = fetch_json(f"league/{league_id}")
+    logged = {tx['transaction_id']: tx for tx in (existing or {}).get('transactions', [])}
+    fetched_weeks = set((existing or {}).get('weeks', []))
+
+    # Pending waivers and commissioner edits can still change the newest week
+    first_week = max(fetched_weeks, default=1)
+    appended = 0
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(log_file(season), 'a') as log:
+        for week in range(first_week, last_week_to_fetch(league) + 1):
+            for tx in fetch_json(f"league/{league_id}/transactions/{week}") or []:
+                if logged.get(tx['transaction_id']) == tx:
+                    continue
+                log.write(json.dumps(tx, separators=(',', ':')) + '\n')
+                logged[tx['transaction_id']] = tx
+                appended += 1
+            fetched_weeks.add(week)
+
+    data = {
+        'season': season,
+        'league_id': league_id,
+        'status': league.get('status'),
+        'waiver_budget': (league.get('settings') or {}).get('waiver_budget', 100),
+        'weeks': sorted(fetched_weeks)
+    }
+    with open(state_file(season), 'w') as f:
+        json.dump(data, f, indent=2)
+
+    data['appended'] = appended
+    data['transactions'] = sorted(logged.values(), key=lambda tx: (tx.get('created') or 0, tx['transaction_id']))
+    return data
+
+def load_all_transactions():
+    """Every stored season, oldest first"""
+    seasons = {}
+    for path in sorted(OUTPUT_DIR.glob('sleeper_transactions_[0-9][0-9][0-9][0-9].state.json')):
+        season = int(path.name.split('_')[2].split('.')[0])
+        seasons[season] = load_season_transactions(season)
+    return seasons
+
+def main():
+    print("Extracting Sleeper transactions...")
+
+    for season, league_id in resolve_league_history().items():
+        data = extract_season_transactions(season, league_id)
+        new = f", {data['appended']} new" if 'appended' in data else ''
+        print(f"  {season}: {len(data['transactions'])} transactions{new} ({data['status']})")
+
+    print(f"\n✓ Transactions saved to {OUTPUT_DIR}")
+
+if __name__ == "__main__":
+    main()
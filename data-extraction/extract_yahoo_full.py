@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 """
 Extract Yahoo Fantasy data for 2020-2021 seasons
+
+Each season takes a handful of batched requests through yahoo_api: one for
+the settings and standings (with managers), and the scoreboards a few weeks
+at a time.
 """
-from yahoofantasy import Context
 import json
 from pathlib import Path
 
+from extract_yahoo_matchups import extract_season
+from yahoo_api import fetch_league
+
 # Yahoo league IDs for "Fat Man's League of 14"
 LEAGUES = {
     2020: "399.l.114631",
     2021: "406.l.1061934"
 }
 
-ctx = Context()
-
 def extract_yahoo_data(year, league_key):
     """Extract data for a Yahoo league"""
     print(f"\n{'='*60}")
@@ -21,68 +25,39 @@ def extract_yahoo_data(year, league_key):
     print(f"{'='*60}")
 
     try:
-        # Get all leagues for the year
-        leagues = ctx.get_leagues('nfl', year)
+        print("  Fetching settings and standings...")
+        settings, standings = fetch_league(league_key)
 
-        # Find the correct league by key
-        league = None
-        for lg in leagues:
-            if lg.league_key == league_key:
-                league = lg
-                break
-
-        if not league:
-            print(f"  Could not find league with key {league_key}")
-            return None
-
-        print(f"League: {league.name}")
-        print(f"League Key: {league.league_key}")
+        print(f"League: {settings['name']}")
+        print(f"League Key: {league_key}")
 
         data = {
             'year': year,
             'league_key': league_key,
-            'league_name': league.name,
-            'standings': [],
-            'teams': [],
+            'league_name': settings['name'],
+            'standings': standings,
+            'teams': standings,
             'matchups': {},
-            'settings': {}
+            'settings': settings
         }
+        for team in standings:
+            print(f"    {team['name']} ({team['manager_name']}): {team['wins']}-{team['losses']} ({team['points_for']} pts)")
+
+        # Every week's games, fetched in parallel
+        print("  Fetching matchups...")
+        for game in extract_season(year, league_key):
+            data['matchups'].setdefault(str(game['week']), []).append(game)
+        print(f"    {sum(len(games) for games in data['matchups'].values())} games in {len(data['matchups'])} weeks")
 
-        # Get standings
-        print("  Fetching standings...")
-        standings = league.standings()
+        # The champion is the #1 ranked team after playoffs
         if standings:
-            for team in standings:
-                team_data = {
-                    'team_key': str(team.team_key) if hasattr(team, 'team_key') else None,
-                    'team_id': str(team.team_id) if hasattr(team, 'team_id') else None,
-                    'name': str(team.name) if hasattr(team, 'name') else None,
-                    'manager_name': str(team.manager.nickname) if hasattr(team, 'manager') and hasattr(team.manager, 'nickname') else None,
-                    'wins': int(team.team_standings.outcome_totals.wins) if hasattr(team, 'team_standings') else 0,
-                    'losses': int(team.team_standings.outcome_totals.losses) if hasattr(team, 'team_standings') else 0,
-                    'ties': int(team.team_standings.outcome_totals.ties) if hasattr(team, 'team_standings') else 0,
-                    'points_for': float(team.team_standings.points_for) if hasattr(team, 'team_standings') else 0.0,
-                    'points_against': float(team.team_standings.points_against) if hasattr(team, 'team_standings') else 0.0,
-                    'rank': int(team.team_standings.rank) if hasattr(team, 'team_standings') else None
-                }
-                data['standings'].append(team_data)
-                data['teams'].append(team_data)
-                print(f"    {team_data['name']}: {team_data['wins']}-{team_data['losses']} ({team_data['points_for']} pts)")
-
-        # Try to get playoff bracket/championship
-        print("  Checking for playoff data...")
-        try:
-            # The champion is typically the #1 ranked team after playoffs
-            if data['standings']:
-                champion = data['standings'][0]  # First place
-                data['champion'] = {
-                    'team_name': champion['name'],
-                    'manager_name': champion['manager_name'],
-                    'team_key': champion['team_key']
-                }
-                print(f"  Champion: {champion['name']} ({champion['manager_name']})")
-        except Exception as e:
-            print(f"  Could not determine champion: {e}")
+            champion = standings[0]
+            data['champion'] = {
+                'team_name': champion['name'],
+                'manager_name': champion['manager_name'],
+                'team_key': champion['team_key']
+            }
+            print(f"  Champion: {champion['name']} ({champion['manager_name']})")
 
         return data
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Extract weekly matchups for every Yahoo season (2020-2021)
+
+Looks each league up once (yahoo_api.get_league, cached) and fetches the
+season's scoreboards in batches of weeks (yahoo_api.fetch_matchups), the
+batches in parallel over one authenticated session with at most WORKERS
+requests in flight. Games are saved in the normalized format
+weekly_scores.py reads (output/yahoo/matchups/yahoo_games_<year>.json), with
+teams mapped to Sleeper usernames through yahoo_team_mapping.json, so the
+Yahoo seasons join the all-play, power ranking and Elo calculations.
+Finished seasons that already have a file are skipped.
+
+    python extract_yahoo_matchups.py            # new seasons only
+    python extract_yahoo_matchups.py --refresh  # re-extract every season
+"""
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from weekly_scores import YAHOO_GAMES_DIR
+from yahoo_api import WEEKS_PER_REQUEST, fetch_matchups, get_league, text, yahoo_leagues
+
+BASE_DIR = Path(__file__).parent
+
+# Scoreboard requests in flight at once; Yahoo throttles bursts harder than Sleeper
+WORKERS = 4
+
+def team_owners(season):
+    """Map a season's Yahoo team names to lowercase Sleeper usernames"""
+    with open(BASE_DIR / 'yahoo_team_mapping.json', 'r') as f:
+        mapping = json.load(f).get(str(season), {})
+    return {name: username.lower() for name, username in mapping.items()}
+
+def matchup_game(matchup, season, owners):
+    """Normalized game record for a scoreboard matchup"""
+    teams = matchup.findall('teams/team')
+    if len(teams) != 2:
+        return None
+    return {
+        'season': season,
+        'week': int(text(matchup, 'week')),
+        'platform': 'yahoo',
+        'playoff': text(matchup, 'is_playoffs') == '1',
+        'final': text(matchup, 'status') == 'postevent',
+        'teams': [owners.get(text(t, 'name')) or f"yahoo_{text(t, 'team_key')}" for t in teams],
+        'points': [round(float(text(t, 'team_points/total', 0)), 2) for t in teams]
+    }
+
+def extract_season(season, league_key, workers=WORKERS):
+    """Every game of a Yahoo season, in week order"""
+    league = get_league(league_key)
+    weeks = list(range(league['start_week'], league['end_week'] + 1))
+    owners = team_owners(season)
+
+    def fetch_batch(batch):
+        # Convert while streaming, so each matchup element can be freed
+        games = (matchup_game(matchup, season, owners) for matchup in fetch_matchups(league_key, batch))
+        return [game for game in games if game]
+
+    batches = [weeks[i:i + WEEKS_PER_REQUEST] for i in range(0, len(weeks), WEEKS_PER_REQUEST)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        games = [game for batch_games in pool.map(fetch_batch, batches) for game in batch_games]
+    games.sort(key=lambda game: game['week'])
+
+    unmapped = sorted({team for game in games for team in game['teams'] if team.startswith('yahoo_')})
+    if unmapped:
+        print(f"  ⚠ {season}: no Sleeper username for {', '.join(unmapped)} (add them to yahoo_team_mapping.json)")
+    return games
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract Yahoo weekly matchups")
+    parser.add_argument('--refresh', action='store_true', help="re-extract seasons that already have a file")
+    parser.add_argument('--workers', type=int, default=WORKERS, help=f"parallel scoreboard requests (default {WORKERS})")
+    args = parser.parse_args()
+
+    print("Extracting Yahoo matchups...")
+    YAHOO_GAMES_DIR.mkdir(parents=True, exist_ok=True)
+
+    for season, league_key in yahoo_leagues().items():
+        games_file = YAHOO_GAMES_DIR / f'yahoo_games_{season}.json'
+        if games_file.exists() and not args.refresh:
+            print(f"  {season}: already extracted")
+            continue
+
+        started = time.time()
+        games = extract_season(season, league_key, workers=args.workers)
+        with open(games_file, 'w') as f:
+            json.dump(games, f, indent=2)
+        print(f"  {season}: {len(games)} games in {time.time() - started:.1f}s")
+
+    print(f"\n✓ Yahoo matchups saved to {YAHOO_GAMES_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Structural diffs of published JSON as JSON Patch (RFC 6902) operations
+
+diff(old, new) walks both documents and returns the add/remove/replace
+operations that turn old into new: objects key by key, lists item by item
+(with items added or removed at the end), anything else replaced whole. When
+the patch would be bigger than the new document it is a single replace of the
+root instead. apply(doc, patch) applies one.
+
+    python json_patch.py OLD.json NEW.json    # print the patch and its size
+"""
+import copy
+import json
+import sys
+
+def escape(key):
+    """A JSON Pointer (RFC 6901) reference token"""
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+def unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+def diff_value(old, new, path, ops):
+    if type(old) is not type(new):
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+    elif isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': f'{path}/{escape(key)}'})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({'op': 'add', 'path': f'{path}/{escape(key)}', 'value': value})
+            else:
+                diff_value(old[key], value, f'{path}/{escape(key)}', ops)
+    elif isinstance(new, list):
+        for i in range(min(len(old), len(new))):
+            diff_value(old[i], new[i], f'{path}/{i}', ops)
+        # Remove from the end so earlier indexes stay valid
+        for i in range(len(old) - 1, len(new) - 1, -1):
+            ops.append({'op': 'remove', 'path': f'{path}/{i}'})
+        for i in range(len(old), len(new)):
+            ops.append({'op': 'add', 'path': f'{path}/{i}', 'value': new[i]})
+    elif old != new:
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+
+def diff(old, new):
+    """JSON Patch from old to new ([] if they are equal)"""
+    ops = []
+    diff_value(old, new, '', ops)
+    if ops and len(json.dumps(ops)) >= len(json.dumps(new)):
+        return [{'op': 'replace', 'path': '', 'value': new}]
+    return ops
+
+def apply(doc, patch):
+    """Apply add/remove/replace operations; returns a new document"""
+    doc = copy.deepcopy(doc)
+    for op in patch:
+        if op['path'] == '':
+            doc = copy.deepcopy(op.get('value'))
+            continue
+
+        tokens = [unescape(t) for t in op['path'].split('/')[1:]]
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        key = tokens[-1]
+        if isinstance(parent, list):
+            key = len(parent) if key == '-' else int(key)
+
+        if op['op'] == 'remove':
+            del parent[key]
+        elif op['op'] == 'add' and isinstance(parent, list):
+            parent.insert(key, copy.deepcopy(op['value']))
+        else:
+            parent[key] = copy.deepcopy(op['value'])
+    return doc
+
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: python json_patch.py OLD.json NEW.json")
+        sys.exit(1)
+
+    with open(sys.argv[1], 'r') as f:
+        old = json.load(f)
+    with open(sys.argv[2], 'r') as f:
+        new = json.load(f)
+
+    patch = diff(old, new)
+    print(json.dumps(patch, indent=2))
+    ok = apply(old, patch) == new
+    size = len(json.dumps(patch, separators=(',', ':')))
+    full = len(json.dumps(new, separators=(',', ':')))
+    print(f"\n  {len(patch)} operations, {size / 1024:.1f} KB vs {full / 1024:.1f} KB in full"
+          f"{'' if ok else '  APPLY FAILED'}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Lineup efficiency: how many points each manager left on the bench
+
+For every team and week of every Sleeper season this compares the points the
+manager actually started against the best legal lineup they could have set
+from the same roster, using the league's roster slots (QB, RB, FLEX, ...).
+
+The optimal lineups for a whole season are solved at once with numpy: each
+team-week is a row of (points, position bitmask) per rostered player, and a
+dynamic program walks the players, keeping for every row the best total for
+each count of filled slots per slot type (QB, RB, FLEX, ...). Each player is
+either benched or put in one open slot they are eligible for, so the result
+is the exact best assignment, multi-position players and overlapping flex
+slots (WRRB_FLEX vs REC_FLEX) included.
+
+Reads output/sleeper/matchups/ (see extract_sleeper_matchups.py) and writes
+per-manager tables to html5up-landed/assets/data/lineup_efficiency.json.
+"""
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from extract_sleeper_matchups import load_all_matchups
+from sleeper_api import get_player_positions
+
+ASSETS_DIR = Path(__file__).parent.parent / 'html5up-landed' / 'assets' / 'data'
+OUTPUT_FILE = ASSETS_DIR / 'lineup_efficiency.json'
+
+POSITION_BITS = {
+    'QB': 1 << 0, 'RB': 1 << 1, 'WR': 1 << 2, 'TE': 1 << 3, 'K': 1 << 4,
+    'DEF': 1 << 5, 'DL': 1 << 6, 'LB': 1 << 7, 'DB': 1 << 8
+}
+
+# Which positions each Sleeper roster slot accepts
+SLOT_POSITIONS = {
+    'QB': ['QB'], 'RB': ['RB'], 'WR': ['WR'], 'TE': ['TE'], 'K': ['K'], 'DEF': ['DEF'],
+    'DL': ['DL'], 'LB': ['LB'], 'DB': ['DB'],
+    'FLEX': ['RB', 'WR', 'TE'],
+    'WRRB_FLEX': ['RB', 'WR'],
+    'REC_FLEX': ['WR', 'TE'],
+    'SUPER_FLEX': ['QB', 'RB', 'WR', 'TE'],
+    'IDP_FLEX': ['DL', 'LB', 'DB']
+}
+
+def slot_masks(roster_positions):
+    """Bitmasks for the starting slots (bench/IR/taxi dropped)"""
+    masks = []
+    for slot in roster_positions:
+        if slot not in SLOT_POSITIONS:
+            continue
+        mask = 0
+        for position in SLOT_POSITIONS[slot]:
+            mask |= POSITION_BITS[position]
+        masks.append(mask)
+    return masks
+
+def player_mask(player_id, positions):
+    """Position bitmask for a player (team defenses use their team code as ID)"""
+    mask = 0
+    for position in positions.get(player_id, ['DEF'] if player_id.isalpha() else []):
+        mask |= POSITION_BITS.get(position, 0)
+    return mask
+
+def season_arrays(season_data, positions):
+    """
+    Flatten a season into per-team-week arrays
+
+    Returns (rows, points, masks, actual) where rows is a list of
+    (week, roster_id), points/masks are [rows, max roster size] and actual is the
+    points the manager really started.
+    """
+    rows = []
+    roster_points = []
+    roster_masks = []
+    actual = []
+
+    for week, matchups in season_data['weeks'].items():
+        for matchup in matchups:
+            # Teams knocked out of the playoffs have no matchup that week
+            if matchup.get('matchup_id') is None:
+                continue
+            players_points = matchup.get('players_points') or {}
+            players = matchup.get('players') or []
+            starters = [s for s in matchup.get('starters') or [] if s and s != '0']
+
+            rows.append((int(week), matchup['roster_id']))
+            roster_points.append([players_points.get(p, 0.0) for p in players])
+            roster_masks.append([player_mask(p, positions) for p in players])
+            actual.append(sum(players_points.get(s, 0.0) for s in starters))
+
+    width = max((len(p) for p in roster_points), default=0)
+    points = np.full((len(rows), width), -np.inf)
+    masks = np.zeros((len(rows), width), dtype=np.int64)
+    for i, (row_points, row_masks) in enumerate(zip(roster_points, roster_masks)):
+        points[i, :len(row_points)] = row_points
+        masks[i, :len(row_masks)] = row_masks
+
+    return rows, points, masks, np.array(actual)
+
+def optimal_points(points, masks, slots):
+    """Best legal lineup score for every row at once"""
+    # Slots with the same mask are interchangeable, so a state only needs how
+    # many of each slot type are filled, packed as a mixed-radix number
+    slot_types = sorted(Counter(slots).items())
+    strides, n_states = [], 1
+    for _, count in slot_types:
+        strides.append(n_states)
+        n_states *= count + 1
+    states = np.arange(n_states)
+    open_states = [states[(states // stride) % (count + 1) < count]
+                   for stride, (_, count) in zip(strides, slot_types)]
+
+    best = np.full((points.shape[0], n_states), -np.inf)
+    best[:, 0] = 0.0
+    for j in range(points.shape[1]):
+        # Sleeper allows an empty slot, so never start a negative score
+        gain = np.where(points[:, j] > 0, points[:, j], -np.inf)
+        placed = best.copy()
+        for stride, (slot_mask, _), source in zip(strides, slot_types, open_states):
+            eligible = np.where((masks[:, j] & slot_mask) != 0, gain, -np.inf)
+            target = source + stride
+            placed[:, target] = np.maximum(placed[:, target], best[:, source] + eligible[:, None])
+        best = placed
+
+    return best.max(axis=1)
+
+def season_efficiency(season_data, positions):
+    """Per-manager actual vs optimal points for one season"""
+    rows, points, masks, actual = season_arrays(season_data, positions)
+    if not rows:
+        return {}
+    optimal = optimal_points(points, masks, slot_masks(season_data['roster_positions']))
+
+    owners = season_data.get('roster_owners', {})
+    managers = {}
+    for (week, roster_id), act, opt in zip(rows, actual, optimal):
+        owner = (owners.get(str(roster_id)) or f'roster_{roster_id}').lower()
+        manager = managers.setdefault(owner, {'weeks': [], 'actual': [], 'optimal': []})
+        manager['weeks'].append(week)
+        manager['actual'].append(round(float(act), 2))
+        manager['optimal'].append(round(float(opt), 2))
+
+    for manager in managers.values():
+        manager.update(summarize(manager['actual'], manager['optimal']))
+        manager['perfect_weeks'] = sum(1 for a, o in zip(manager['actual'], manager['optimal']) if a >= o)
+
+    return managers
+
+def summarize(actual, optimal):
+    """Totals and efficiency for a list of weekly actual/optimal scores"""
+    total_actual = sum(actual)
+    total_optimal = sum(optimal)
+    return {
+        'total_actual': round(total_actual, 2),
+        'total_optimal': round(total_optimal, 2),
+        'points_left': round(total_optimal - total_actual, 2),
+        'efficiency': round(total_actual / total_optimal, 4) if total_optimal else None
+    }
+
+def main():
+    print("Calculating lineup efficiency...")
+    start = time.time()
+
+    positions = get_player_positions()
+    all_matchups = load_all_matchups()
+
+    seasons = {}
+    career = {}
+    for season, season_data in all_matchups.items():
+        managers = season_efficiency(season_data, positions)
+        seasons[str(season)] = managers
+        print(f"  {season}: {sum(len(m['weeks']) for m in managers.values())} team-weeks")
+        beaten = sum(1 for m in managers.values() for a, o in zip(m['actual'], m['optimal']) if a > o + 0.01)
+        if beaten:
+            print(f"  ⚠ {season}: {beaten} lineups score more than the optimal one (check slot/position mapping)")
+
+        for owner, manager in managers.items():
+            totals = career.setdefault(owner, {'actual': [], 'optimal': []})
+            totals['actual'].extend(manager['actual'])
+            totals['optimal'].extend(manager['optimal'])
+
+    output = {
+        'generated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seasons': seasons,
+        'career': {owner: summarize(t['actual'], t['optimal']) for owner, t in career.items()}
+    }
+
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    print(f"\n✓ Lineup efficiency saved to {OUTPUT_FILE} ({time.time() - start:.2f}s)")
+    print("\nMost points left on the bench (career):")
+    ranked = sorted(output['career'].items(), key=lambda item: item[1]['points_left'], reverse=True)
+    for owner, totals in ranked[:5]:
+        print(f"  {owner:22} {totals['points_left']:8.1f} pts ({totals['efficiency']:.1%} efficient)")
+
+if __name__ == "__main__":
+    main()
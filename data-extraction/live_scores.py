@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Poll Sleeper for live scores during games and publish them as static files
+
+Runs as one long-lived process so the dashboard reads live scores from
+html5up-landed/assets/data/live/ instead of every open page calling Sleeper.
+It watches /state/nfl and, while our season is on, polls the current week's
+/matchups/{week}:
+
+  - every 30 seconds during game windows (Thursday, Sunday, Monday and late
+    season Saturday games, US Eastern), doubling the wait after every poll
+    where nothing changed, up to 5 minutes
+  - every 30 minutes outside game windows, every 6 hours in the offseason
+
+A poll that changes anything writes live/<season>_w<week>_<seq>.json with only
+the matchup rows that changed, and rewrites live/latest.json with every row
+for the week and the names of the recent deltas. Only the newest MAX_DELTAS
+delta files are kept. Each of those polls also updates the week's live win
+probabilities (see win_probability.py).
+
+    python live_scores.py           # run until stopped
+    python live_scores.py --once    # a single poll, e.g. from cron
+"""
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import requests
+
+from publish_bundle import LIVE_DIR
+from sleeper_api import CURRENT_LEAGUE_ID, fetch_json
+from win_probability import record_live
+
+LATEST_FILE = LIVE_DIR / 'latest.json'
+MAX_DELTAS = 50
+
+GAME_INTERVAL = 30
+MAX_GAME_INTERVAL = 5 * 60
+IDLE_INTERVAL = 30 * 60
+OFFSEASON_INTERVAL = 6 * 60 * 60
+
+# (weekday, start hour, end hour) in US Eastern, Monday = 0; end hours past 24
+# run into the next day (overtime in late games)
+EASTERN = ZoneInfo('America/New_York')
+GAME_WINDOWS = [
+    (0, 19, 25),   # Monday night
+    (3, 20, 25),   # Thursday night
+    (5, 13, 25),   # Saturday games late in the season
+    (6, 9, 25)     # Sunday, from the London games to the end of SNF
+]
+
+def in_game_window(now=None):
+    now = (now or datetime.now(EASTERN)).astimezone(EASTERN)
+    hour = now.hour + now.minute / 60
+    for weekday, start, end in GAME_WINDOWS:
+        if now.weekday() == weekday and start <= hour < end:
+            return True
+        if now.weekday() == (weekday + 1) % 7 and hour + 24 < end:
+            return True
+    return False
+
+def next_interval(in_window, unchanged_polls):
+    """Seconds until the next poll"""
+    if not in_window:
+        return IDLE_INTERVAL
+    return min(GAME_INTERVAL * 2 ** unchanged_polls, MAX_GAME_INTERVAL)
+
+def live_row(matchup):
+    """The fields the dashboard and win probabilities need from a Sleeper matchup row"""
+    return {
+        'roster_id': matchup['roster_id'],
+        'matchup_id': matchup.get('matchup_id'),
+        'points': round(matchup.get('points') or 0.0, 2),
+        'starters': matchup.get('starters') or [],
+        'starters_points': [round(p or 0.0, 2) for p in matchup.get('starters_points') or []]
+    }
+
+def write_json(path, data):
+    """Replace a file atomically, since it is served while the poller runs"""
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp, path)
+
+def load_state(league_id):
+    """Resume from the published latest.json, or start empty"""
+    state = {
+        'season': str(fetch_json(f"league/{league_id}")['season']),
+        'league_id': league_id,
+        'week': None,
+        'seq': 0,
+        'rows': {},
+        'deltas': []
+    }
+    if LATEST_FILE.exists():
+        with open(LATEST_FILE, 'r') as f:
+            latest = json.load(f)
+        if latest['league_id'] == league_id and latest['season'] == state['season']:
+            state.update(week=latest['week'], seq=latest['seq'], deltas=latest['deltas'])
+            state['rows'] = {row['roster_id']: row for row in latest['matchups']}
+    return state
+
+def current_week(state):
+    """The week in progress, or None outside our season"""
+    nfl_state = fetch_json("state/nfl")
+    if str(nfl_state.get('season')) != state['season'] or nfl_state.get('season_type') not in ('regular', 'post'):
+        return None
+    return int(nfl_state.get('week') or 0) or None
+
+def poll(state, week):
+    """Fetch the week's matchups and publish any changes; returns the changed rows"""
+    if week != state['week']:
+        state.update(week=week, seq=0, rows={})
+
+    matchups = fetch_json(f"league/{state['league_id']}/matchups/{week}") or []
+    rows = {m['roster_id']: live_row(m) for m in matchups}
+    changed = [row for roster_id, row in sorted(rows.items()) if state['rows'].get(roster_id) != row]
+    if not changed:
+        return []
+
+    state['seq'] += 1
+    state['rows'] = rows
+    header = {
+        'season': state['season'],
+        'league_id': state['league_id'],
+        'week': week,
+        'seq': state['seq'],
+        'updated': int(time.time())
+    }
+    LIVE_DIR.mkdir(parents=True, exist_ok=True)
+
+    delta_name = f"{state['season']}_w{week}_{state['seq']}.json"
+    write_json(LIVE_DIR / delta_name, {**header, 'matchups': changed})
+    state['deltas'] = (state['deltas'] + [delta_name])[-MAX_DELTAS:]
+    for path in LIVE_DIR.glob('[0-9]*_w*_*.json'):
+        if path.name not in state['deltas']:
+            path.unlink()
+
+    write_json(LATEST_FILE, {**header, 'matchups': list(rows.values()), 'deltas': state['deltas']})
+    # The scores are already published, so a model failure must not stop the poller
+    try:
+        record_live(state['season'], state['league_id'], week, rows.values(), header['updated'])
+    except Exception as e:
+        print(f"  ⚠ Win probability update failed ({e!r}); scores were still published")
+    return changed
+
+def run(league_id, once=False):
+    """Poll until stopped (or just once)"""
+    state = load_state(league_id)
+    unchanged_polls = 0
+    while True:
+        interval = OFFSEASON_INTERVAL
+        try:
+            week = current_week(state)
+            if week:
+                changed = poll(state, week)
+                unchanged_polls = 0 if changed else unchanged_polls + 1
+                interval = next_interval(in_game_window(), unchanged_polls)
+                stamp = datetime.now().strftime('%H:%M:%S')
+                print(f"  {stamp} week {week}: {len(changed)} rows changed (seq {state['seq']}), next poll in {interval}s")
+            else:
+                print("  Not in season, waiting")
+        except requests.RequestException as e:
+            interval = GAME_INTERVAL if in_game_window() else IDLE_INTERVAL
+            print(f"  Sleeper request failed ({e}), retrying in {interval}s")
+
+        if once:
+            return
+        time.sleep(interval)
+
+def main():
+    parser = argparse.ArgumentParser(description="Poll Sleeper for live scores and publish them")
+    parser.add_argument('--league', default=CURRENT_LEAGUE_ID, help="league ID (default: the current league)")
+    parser.add_argument('--once', action='store_true', help="poll once and exit")
+    args = parser.parse_args()
+
+    print(f"Polling live scores into {LIVE_DIR}...")
+    try:
+        run(args.league, once=args.once)
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Publish a slim Sleeper player index for name lookups
+
+The dashboard used to download Sleeper's multi-megabyte /players/nfl dump on
+every page load just to turn player IDs into names. This projects the dump
+(fetched at most once a day by sleeper_api.get_player_index()) down to
+id -> [name, position, team] and publishes:
+
+  players/index.json   every NFL player
+  players/league.json  only players that have ever been on one of our
+                       rosters, in a draft or in a transaction
+
+under html5up-landed/assets/data/. Each carries a version (content hash).
+Every run diffs the new index against the published one; changes are logged
+to output/cache/player_index_diffs/ and the files are only rewritten when
+something changed.
+"""
+import argparse
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from draft_store import DB_FILE
+from extract_sleeper_matchups import load_all_matchups
+from extract_sleeper_transactions import load_all_transactions
+from sleeper_api import CACHE_DIR, CURRENT_LEAGUE_ID, fetch_json, get_player_index
+
+ASSETS_DIR = Path(__file__).parent.parent / 'html5up-landed' / 'assets' / 'data'
+PLAYERS_DIR = ASSETS_DIR / 'players'
+INDEX_FILE = PLAYERS_DIR / 'index.json'
+LEAGUE_FILE = PLAYERS_DIR / 'league.json'
+DIFFS_DIR = CACHE_DIR / 'player_index_diffs'
+
+def slim_index(player_index):
+    """id -> [name, position, team], dropping entries with no name"""
+    return {
+        player_id: row[:3]
+        for player_id, row in sorted(player_index.items())
+        if row[0]
+    }
+
+def version(players):
+    return hashlib.sha256(json.dumps(players, sort_keys=True).encode()).hexdigest()[:12]
+
+def diff_index(old, new):
+    """Players added, changed (e.g. a new team) and removed between two indexes"""
+    return {
+        'added': {pid: row for pid, row in new.items() if pid not in old},
+        'changed': {pid: row for pid, row in new.items() if pid in old and old[pid] != row},
+        'removed': sorted(pid for pid in old if pid not in new)
+    }
+
+def league_player_ids():
+    """Every player ID seen in our rosters, drafts, matchups and transactions"""
+    ids = set()
+
+    for season_data in load_all_matchups().values():
+        for matchups in season_data['weeks'].values():
+            for matchup in matchups:
+                ids.update(matchup.get('players') or [])
+
+    for season_data in load_all_transactions().values():
+        for tx in season_data['transactions']:
+            ids.update((tx.get('adds') or {}).keys())
+            ids.update((tx.get('drops') or {}).keys())
+
+    if DB_FILE.exists():
+        conn = sqlite3.connect(DB_FILE)
+        ids.update(row[0] for row in conn.execute(
+            "SELECT DISTINCT player_id FROM picks WHERE platform = 'sleeper' AND player_id IS NOT NULL"
+        ))
+        conn.close()
+
+    # Current rosters, including players added since the last extract
+    for roster in fetch_json(f"league/{CURRENT_LEAGUE_ID}/rosters"):
+        ids.update(roster.get('players') or [])
+        ids.update(roster.get('reserve') or [])
+        ids.update(roster.get('taxi') or [])
+
+    return ids
+
+def load_published(path):
+    if path.exists():
+        with open(path, 'r') as f:
+            return json.load(f)
+    return {'version': None, 'players': {}}
+
+def write_index(path, players):
+    """Write a versioned index unless it is unchanged; returns True if written"""
+    new_version = version(players)
+    if load_published(path)['version'] == new_version:
+        return False
+    PLAYERS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'version': new_version, 'players': players}, f, separators=(',', ':'))
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish the slim player index")
+    parser.add_argument('--refresh', action='store_true', help="download /players/nfl even if today's copy is cached")
+    args = parser.parse_args()
+
+    print("Building player index...")
+
+    players = slim_index(get_player_index(refresh=args.refresh))
+    diff = diff_index(load_published(INDEX_FILE)['players'], players)
+    print(f"  {len(players)} players: {len(diff['added'])} added, "
+          f"{len(diff['changed'])} changed, {len(diff['removed'])} removed")
+
+    if any(diff.values()):
+        DIFFS_DIR.mkdir(parents=True, exist_ok=True)
+        diff_file = DIFFS_DIR / f"{time.strftime('%Y-%m-%d')}_{version(players)}.json"
+        with open(diff_file, 'w') as f:
+            json.dump(diff, f, indent=2)
+
+    ids = league_player_ids()
+    league_players = {pid: row for pid, row in players.items() if pid in ids}
+    print(f"  {len(league_players)} players in our league history")
+
+    updated = []
+    if write_index(INDEX_FILE, players):
+        updated.append(INDEX_FILE.name)
+    if write_index(LEAGUE_FILE, league_players):
+        updated.append(LEAGUE_FILE.name)
+    print(f"\n✓ Player index saved to {PLAYERS_DIR} ({', '.join(updated) or 'unchanged'})")
+
+if __name__ == "__main__":
+    main()
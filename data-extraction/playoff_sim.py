@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Replay past seasons through other playoff formats
+
+A format is a dict:
+
+    {'teams': 6, 'byes': 2, 'reseed': True, 'final_weeks': 2, 'consolation': True}
+
+  teams        playoff teams, seeded from the regular-season standings
+               (standings.py, tiebreakers included)
+  byes         top seeds that skip the first round
+  reseed       the best seed left plays the worst seed left each round,
+               instead of a fixed bracket
+  final_weeks  weeks the final (and any consolation game alongside it) is
+               played over, scores summed
+  consolation  playoff teams knocked out keep playing a ladder for their
+               places (losers of the semis for 3rd, ...) instead of being
+               ordered by round and seed
+
+Every season is replayed with its real weekly scores. The playoffs end in the
+season's last week; they start in the real first playoff week, or earlier if
+the format needs more weeks (which shortens the regular season it is seeded
+from). Sleeper still scores teams with no game that week (knocked out of the
+real playoffs), and those points are used; only a team with no score at all
+(MFL and Yahoo weeks without a game) is given its regular-season average, and
+results count how often that happened. Ties go to the better seed.
+
+The default grid is every valid combination of FORMAT_GRID. Each (season,
+format) pair is one task for a process pool, and the season arrays are sent
+to each worker once. Champions are compared with the real ones from the
+published playoff results. Writes html5up-landed/assets/data/playoff_formats.json.
+
+    python playoff_sim.py
+    python playoff_sim.py --teams 4 6 --byes 0 2 --workers 8
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+from extract_sleeper_matchups import load_all_matchups
+from publish_bundle import ASSETS_DIR
+from standings import season_table, standings_as_of
+from weekly_scores import games_by_season, load_games, score_cube
+
+BASE_DIR = Path(__file__).parent
+OUTPUT_FILE = ASSETS_DIR / 'playoff_formats.json'
+RESULTS_FILES = ['mfl_playoff_results.json', 'yahoo_playoff_results.json', 'sleeper_playoff_results.json']
+
+FORMAT_GRID = {
+    'teams': [4, 5, 6, 7, 8, 10, 12],
+    'byes': [0, 1, 2, 3, 4, 6],
+    'reseed': [False, True],
+    'final_weeks': [1, 2],
+    'consolation': [False, True]
+}
+
+def second_round_size(teams, byes):
+    """Teams left after the first round, or None if the format doesn't make a bracket"""
+    if not 0 <= byes < teams or (teams - byes) % 2:
+        return None
+    size = byes + (teams - byes) // 2
+    return size if size >= 2 and size & (size - 1) == 0 else None
+
+def format_name(fmt):
+    return (f"{fmt['teams']}t-{fmt['byes']}bye-{'reseed' if fmt['reseed'] else 'fixed'}-"
+            f"{fmt['final_weeks']}wkfinal{'-ladder' if fmt['consolation'] else ''}")
+
+def format_grid(grid=FORMAT_GRID):
+    formats = []
+    for values in product(*grid.values()):
+        fmt = dict(zip(grid, values))
+        size = second_round_size(fmt['teams'], fmt['byes'])
+        # With only the final after the first round, reseeding changes nothing
+        if size and not (fmt['reseed'] and size == 2):
+            formats.append(fmt)
+    return formats
+
+def slot_count(fmt):
+    """Rounds the championship bracket needs (the final counts as one)"""
+    # The first round, then one round per halving of the field
+    return second_round_size(fmt['teams'], fmt['byes']).bit_length()
+
+def bracket_order(size):
+    """Seed positions in a fixed bracket, e.g. [1, 4, 2, 3] for four"""
+    order = [1]
+    while len(order) < size:
+        order = [s for seed in order for s in (seed, 2 * len(order) + 1 - seed)]
+    return order
+
+def unpaired_scores(season_data):
+    """{(owner, week): points} for Sleeper rows with no game that week"""
+    owners = season_data.get('roster_owners', {})
+    return {
+        ((owners.get(str(m['roster_id'])) or f"roster_{m['roster_id']}").lower(), int(week)): m['points']
+        for week, matchups in season_data['weeks'].items()
+        for m in matchups
+        if m.get('matchup_id') is None and m.get('points') is not None
+    }
+
+def prepare_season(season_games, extra_scores=None):
+    """Everything a worker needs to replay one season; extra_scores fill weeks a team had no game"""
+    owners, weeks, scores = score_cube(season_games)
+    for (owner, week), points in (extra_scores or {}).items():
+        if owner in owners and week in weeks and np.isnan(scores[owners.index(owner), weeks.index(week)]):
+            scores[owners.index(owner), weeks.index(week)] = points
+    table = season_table(season_games)
+    regular = [weeks.index(week) for week in table['weeks']]
+    averages = np.nanmean(scores[:, regular], axis=1) if regular else np.zeros(len(owners))
+    first_playoff = next((week for week, games in season_games.items() if any(g['playoff'] for g in games)), None)
+    return {'owners': owners, 'weeks': weeks, 'scores': scores, 'averages': averages,
+            'table': table, 'first_playoff': first_playoff}
+
+def simulate(season, fmt):
+    """Champion and full placements for one season under one format (None if it doesn't fit)"""
+    weeks, scores = season['weeks'], season['scores']
+    slots_needed = slot_count(fmt)
+    n_weeks = slots_needed - 1 + fmt['final_weeks']
+    if fmt['teams'] > len(season['owners']) or n_weeks >= len(weeks):
+        return None
+
+    start = min(weeks.index(season['first_playoff']), len(weeks) - n_weeks)
+    playoff_weeks = list(range(start, start + n_weeks))
+    slots = [[j] for j in playoff_weeks[:slots_needed - 1]] + [playoff_weeks[slots_needed - 1:]]
+
+    standings = [row['owner'] for row in standings_as_of(season['table'], weeks[start] - 1)]
+    seed = {owner: i for i, owner in enumerate(standings)}
+    index = {owner: i for i, owner in enumerate(season['owners'])}
+    estimated = set()
+
+    def score(team, slot):
+        total = 0.0
+        for j in slots[slot]:
+            points = scores[index[team], j]
+            if np.isnan(points):
+                estimated.add((team, j))
+                points = season['averages'][index[team]]
+            total += points
+        return total
+
+    def play(a, b, slot):
+        """(winner, loser); the better seed wins a tie"""
+        sa, sb = score(a, slot), score(b, slot)
+        return (a, b) if sa > sb or (sa == sb and seed[a] < seed[b]) else (b, a)
+
+    teams, byes = fmt['teams'], fmt['byes']
+    size = second_round_size(teams, byes)
+    seeds = standings[:teams]
+    knocked_out = []
+    slot = 0
+
+    # First round: seed k (after the byes) plays seed teams + 1 + byes - k for bracket position k
+    position = {k: seeds[k - 1] for k in range(1, byes + 1)}
+    losers = []
+    for k in range(byes + 1, size + 1):
+        winner, loser = play(seeds[k - 1], seeds[teams + byes - k], slot)
+        position[k] = winner
+        losers.append(loser)
+    knocked_out.append((slot, losers))
+    slot += 1
+
+    field = [position[k] for k in bracket_order(size)]
+    while len(field) > 1:
+        if fmt['reseed']:
+            ranked = sorted(field, key=seed.get)
+            pairs = [(ranked[i], ranked[-1 - i]) for i in range(len(ranked) // 2)]
+        else:
+            pairs = [(field[i], field[i + 1]) for i in range(0, len(field), 2)]
+        results = [play(a, b, slot) for a, b in pairs]
+        field = [winner for winner, _ in results]
+        knocked_out.append((slot, [loser for _, loser in results]))
+        slot += 1
+
+    placements = field
+    for slot, losers in reversed(knocked_out):
+        group = sorted(losers, key=seed.get)
+        placements.extend(ladder(group, slot + 1, play, seed, len(slots)) if fmt['consolation'] else group)
+    placements.extend(standings[teams:])
+
+    return {'champion': placements[0], 'placements': placements, 'estimated_scores': len(estimated)}
+
+def ladder(group, slot, play, seed, n_slots):
+    """A consolation ladder: winners play on for the better places, losers for the rest"""
+    if len(group) == 1 or slot >= n_slots:
+        return group
+    # The middle seed of an odd group sits out the round with the winners
+    pairs = [(group[i], group[-1 - i]) for i in range(len(group) // 2)]
+    results = [play(a, b, slot) for a, b in pairs]
+    winners = [winner for winner, _ in results] + ([group[len(group) // 2]] if len(group) % 2 else [])
+    losers = [loser for _, loser in results]
+    return (ladder(sorted(winners, key=seed.get), slot + 1, play, seed, n_slots)
+            + ladder(sorted(losers, key=seed.get), slot + 1, play, seed, n_slots))
+
+# Seasons are sent to each worker once instead of with every task
+_seasons = {}
+
+def init_worker(seasons):
+    _seasons.update(seasons)
+
+def run_task(task):
+    season, fmt = task
+    return season, format_name(fmt), simulate(_seasons[season], fmt)
+
+def actual_champions():
+    """{season: lowercase Sleeper username} from the published playoff results"""
+    with open(BASE_DIR / 'owner_mapping.json', 'r') as f:
+        mapping = json.load(f)['mfl_to_sleeper'].values()
+    usernames = {m['real_name'].lower(): m['sleeper_username'].lower() for m in mapping if m.get('real_name')}
+
+    champions = {}
+    for name in RESULTS_FILES:
+        path = ASSETS_DIR / name
+        if not path.exists():
+            continue
+        with open(path, 'r') as f:
+            for row in json.load(f):
+                if row.get('champion'):
+                    champion = row['champion'].lower()
+                    champions[int(row['year'])] = usernames.get(champion, champion)
+    return champions
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay past seasons through other playoff formats")
+    for key, values in FORMAT_GRID.items():
+        kind = int if isinstance(values[0], int) and not isinstance(values[0], bool) else lambda v: v.lower() in ('1', 'true', 'yes')
+        parser.add_argument(f"--{key.replace('_', '-')}", nargs='+', type=kind, default=values,
+                            help=f"values to try (default {' '.join(map(str, values))})")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    started = time.time()
+    print("Replaying playoff formats...")
+    sleeper_seasons = load_all_matchups()
+    seasons = {}
+    for season, season_games in games_by_season(load_games()).items():
+        if all(g['final'] for games in season_games.values() for g in games) and \
+                any(g['playoff'] for games in season_games.values() for g in games):
+            extra = unpaired_scores(sleeper_seasons[season]) if season in sleeper_seasons else None
+            seasons[season] = prepare_season(season_games, extra)
+
+    formats = format_grid({key: getattr(args, key) for key in FORMAT_GRID})
+    tasks = [(season, fmt) for fmt in formats for season in seasons]
+    print(f"  {len(formats)} formats x {len(seasons)} seasons")
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker, initargs=(seasons,)) as pool:
+        chunksize = max(1, len(tasks) // (4 * (args.workers or 1)))
+        for season, name, result in pool.map(run_task, tasks, chunksize=chunksize):
+            if result:
+                results.setdefault(name, {})[str(season)] = result
+
+    champions = actual_champions()
+    summary = {}
+    for fmt in formats:
+        name = format_name(fmt)
+        replayed = results.get(name, {})
+        compared = [season for season in replayed if int(season) in champions]
+        changed = [season for season in compared if replayed[season]['champion'] != champions[int(season)]]
+        summary[name] = {
+            'format': fmt,
+            'seasons': len(replayed),
+            'compared': len(compared),
+            'champion_changed': len(changed),
+            'changed_seasons': changed,
+            'results': replayed
+        }
+
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump({'actual_champions': {str(season): c for season, c in champions.items()}, 'formats': summary}, f, indent=2)
+
+    for name, row in sorted(summary.items(), key=lambda item: -item[1]['champion_changed'])[:10]:
+        print(f"  {name}: champion changes in {row['champion_changed']} of {row['compared']} seasons")
+    print(f"\n✓ {len(tasks)} replays in {time.time() - started:.1f}s, saved to {OUTPUT_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Week-by-week power rankings from the weekly score cube
+
+Replaces the season-totals formula in league-data.js::calculatePowerRankings.
+After every regular-season week each team gets a power score made of:
+
+  - win_pct:     actual record to date
+  - all_play:    record to date if they had played every team every week
+  - points:      recency-weighted average score over the last `window` weeks
+                 (weights halve every `half_life` weeks), relative to the
+                 league's best
+
+Rankings are incremental. The state in output/cache/power_rankings_state.json
+keeps each week's rows (which carry the cumulative records) and a hash of that
+week's games, so a run only recomputes from the first week whose games are new
+or changed, normally just the latest one. The full history for every season is
+published to html5up-landed/assets/data/power_rankings.json.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+from weekly_scores import games_by_season, load_games, score_cube
+
+BASE_DIR = Path(__file__).parent
+STATE_FILE = BASE_DIR / 'output' / 'cache' / 'power_rankings_state.json'
+ASSETS_DIR = BASE_DIR.parent / 'html5up-landed' / 'assets' / 'data'
+OUTPUT_FILE = ASSETS_DIR / 'power_rankings.json'
+
+SETTINGS = {
+    'window': 6,
+    'half_life': 3,
+    'weights': {'win_pct': 0.3, 'all_play': 0.35, 'points': 0.35}
+}
+
+def digest(data):
+    """Stable short hash of any JSON-serializable value"""
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()[:16]
+
+def load_state():
+    """Load saved rankings; discarded if the settings have changed since"""
+    if STATE_FILE.exists():
+        with open(STATE_FILE, 'r') as f:
+            state = json.load(f)
+        if state.get('settings') == digest(SETTINGS):
+            return state
+    return {'settings': digest(SETTINGS), 'seasons': {}}
+
+def save_state(state):
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_FILE, 'w') as f:
+        json.dump(state, f, indent=2)
+
+def week_results(week_games, owners):
+    """Per-owner (wins, losses, ties) for one week's games"""
+    results = {owner: [0, 0, 0] for owner in owners}
+    for game in week_games:
+        (a, b), (pa, pb) = game['teams'], game['points']
+        if pa > pb:
+            results[a][0] += 1
+            results[b][1] += 1
+        elif pb > pa:
+            results[b][0] += 1
+            results[a][1] += 1
+        else:
+            results[a][2] += 1
+            results[b][2] += 1
+    return results
+
+def all_play_results(week_scores):
+    """Per-team (wins, losses, ties) against every other team's score that week"""
+    played = ~np.isnan(week_scores)
+    s = np.where(played, week_scores, 0.0)
+    beats = (s[:, None] > s[None, :]) & played[:, None] & played[None, :]
+    ties = (s[:, None] == s[None, :]) & played[:, None] & played[None, :]
+    np.fill_diagonal(ties, False)
+    return beats.sum(axis=1), beats.sum(axis=0), ties.sum(axis=1)
+
+def weighted_points(scores, j):
+    """Recency-weighted average score over the window ending at week index j"""
+    start = 0 if not SETTINGS['window'] else max(0, j + 1 - SETTINGS['window'])
+    window = scores[:, start:j + 1]
+    age = np.arange(window.shape[1])[::-1]
+    weights = np.where(np.isnan(window), 0.0, 0.5 ** (age / SETTINGS['half_life']))
+    totals = weights.sum(axis=1)
+    return np.where(totals > 0, np.nansum(window * weights, axis=1) / np.maximum(totals, 1e-9), 0.0)
+
+def rank_week(owners, scores, j, week_games, previous_rows):
+    """Rows for week index j, building on the previous week's cumulative records"""
+    previous = {row['owner']: row for row in previous_rows}
+    results = week_results(week_games, owners)
+    ap_wins, ap_losses, ap_ties = all_play_results(scores[:, j])
+    points = weighted_points(scores, j)
+    best_points = points.max() or 1.0
+
+    rows = []
+    for i, owner in enumerate(owners):
+        prev = previous.get(owner, {})
+        wins = prev.get('wins', 0) + results[owner][0]
+        losses = prev.get('losses', 0) + results[owner][1]
+        ties = prev.get('ties', 0) + results[owner][2]
+        all_play_wins = prev.get('all_play_wins', 0) + int(ap_wins[i])
+        all_play_losses = prev.get('all_play_losses', 0) + int(ap_losses[i])
+        all_play_ties = prev.get('all_play_ties', 0) + int(ap_ties[i])
+
+        games = wins + losses + ties
+        all_play_games = all_play_wins + all_play_losses + all_play_ties
+        win_pct = (wins + ties / 2) / games if games else 0.0
+        all_play_pct = (all_play_wins + all_play_ties / 2) / all_play_games if all_play_games else 0.0
+
+        weights = SETTINGS['weights']
+        power = 100 * (
+            weights['win_pct'] * win_pct
+            + weights['all_play'] * all_play_pct
+            + weights['points'] * points[i] / best_points
+        )
+
+        rows.append({
+            'owner': owner,
+            'power': round(float(power), 2),
+            'wins': wins,
+            'losses': losses,
+            'ties': ties,
+            'all_play_wins': all_play_wins,
+            'all_play_losses': all_play_losses,
+            'all_play_ties': all_play_ties,
+            'weighted_points': round(float(points[i]), 2)
+        })
+
+    rows.sort(key=lambda row: row['power'], reverse=True)
+    for rank, row in enumerate(rows, 1):
+        row['rank'] = rank
+    return rows
+
+def update_season(season_state, season_games):
+    """Recompute weeks from the first new/changed one; returns the weeks recomputed"""
+    regular = {
+        week: games for week, games in season_games.items()
+        if not any(game['playoff'] for game in games)
+    }
+    if not regular:
+        return []
+
+    owners, weeks, scores = score_cube(regular)
+    hashes = {str(week): digest(regular[week]) for week in weeks}
+
+    stored = season_state.setdefault('week_hashes', {})
+    rows_by_week = season_state.setdefault('weeks', {})
+    dirty = [j for j, week in enumerate(weeks) if stored.get(str(week)) != hashes[str(week)]]
+    if not dirty:
+        return []
+
+    recomputed = []
+    for j in range(dirty[0], len(weeks)):
+        week = str(weeks[j])
+        previous_rows = rows_by_week.get(str(weeks[j - 1]), []) if j else []
+        rows_by_week[week] = rank_week(owners, scores, j, regular[weeks[j]], previous_rows)
+        stored[week] = hashes[week]
+        recomputed.append(weeks[j])
+
+    # Weeks that disappeared (e.g. a re-extract with fewer weeks)
+    for week in set(rows_by_week) - set(hashes):
+        del rows_by_week[week]
+        stored.pop(week, None)
+
+    return recomputed
+
+def main():
+    print("Updating power rankings...")
+
+    state = load_state()
+    for season, season_games in games_by_season(load_games()).items():
+        season_state = state['seasons'].setdefault(str(season), {})
+        recomputed = update_season(season_state, season_games)
+        if recomputed:
+            print(f"  {season}: recomputed weeks {recomputed[0]}-{recomputed[-1]}")
+        else:
+            print(f"  {season}: up to date")
+
+    save_state(state)
+
+    output = {
+        'settings': SETTINGS,
+        'seasons': {
+            season: {
+                'weeks': sorted(int(week) for week in season_state['weeks']),
+                'rankings': season_state['weeks']
+            }
+            for season, season_state in state['seasons'].items()
+            if season_state.get('weeks')
+        }
+    }
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    print(f"\n✓ Power rankings saved to {OUTPUT_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Publish the dashboard data files as minified, fingerprinted, precompressed assets
+
+For every JSON file under html5up-landed/assets/data/ (including the profile
+shards and weekly matrices) this writes a minified copy named by its content
+hash to assets/data/dist/, alongside .br (quality 11) and .gz (level 9)
+variants, and records original name -> fingerprinted path in
+assets/data/manifest.json. league-data.js looks files up through the manifest,
+so everything except the manifest can be cached as immutable. The Netlify
+cache rules are generated into html5up-landed/_headers.
+
+Files whose contents didn't change keep their fingerprinted copies untouched.
+For the ones that did, a JSON Patch against the previously published data
+(see json_patch.py) goes into assets/data/changes/<version>.json, where
+version is a counter kept in the manifest ("version", with the oldest change
+set still available in "changes_from"). A consumer that has version N can
+apply changes/N+1.json ... instead of downloading every changed file again.
+
+Run last, after the extract/transform/publish_* scripts:
+
+    python publish_assets.py
+    python publish_assets.py --columnar   # columnar-encoded (see columnar.py)
+"""
+import argparse
+import gzip
+import json
+from pathlib import Path
+
+from columnar import decode, encode
+from json_patch import diff
+from publish_bundle import ASSETS_DIR, BUNDLE_DIR, LIVE_DIR, MANIFEST_FILE, content_hash, minify, write_manifest
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST_DIR = ASSETS_DIR / 'dist'
+CHANGES_DIR = ASSETS_DIR / 'changes'
+MAX_CHANGE_SETS = 50
+HEADERS_FILE = ASSETS_DIR.parent.parent / '_headers'
+
+HEADERS = """# Generated by data-extraction/publish_assets.py
+
+# Content-hashed files never change
+/assets/data/dist/*
+  Cache-Control: public, max-age=31536000, immutable
+
+/assets/data/bundles/*
+  Cache-Control: public, max-age=31536000, immutable
+
+/assets/data/changes/*
+  Cache-Control: public, max-age=31536000, immutable
+
+# The manifest names the current versions, so always revalidate it
+/assets/data/manifest.json
+  Cache-Control: public, max-age=0, must-revalidate
+
+# Rewritten by live_scores.py during games; a few seconds of caching is plenty
+/assets/data/live/*
+  Cache-Control: public, max-age=15
+"""
+
+def source_files():
+    """Every publishable JSON file (profiles/, weekly/, ...), as paths relative to ASSETS_DIR"""
+    skip = {MANIFEST_FILE, DIST_DIR, BUNDLE_DIR, CHANGES_DIR, LIVE_DIR}
+    files = [
+        p for p in ASSETS_DIR.rglob('*.json')
+        if not any(p == d or d in p.parents for d in skip)
+    ]
+    return sorted(p.relative_to(ASSETS_DIR).as_posix() for p in files)
+
+def write_if_changed(path, data):
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+def write_compressed(path, data):
+    """Write .gz and (if brotli is installed) .br next to path"""
+    # mtime=0 keeps the gzip output identical for identical input
+    write_if_changed(path.with_name(path.name + '.gz'), gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli:
+        write_if_changed(path.with_name(path.name + '.br'), brotli.compress(data, quality=11))
+
+def publish_file(name, columnar=False):
+    """Minify, fingerprint and compress one file; returns its dist path"""
+    with open(ASSETS_DIR / name, 'r') as f:
+        data = json.load(f)
+    data = minify(encode(data) if columnar else data).encode()
+
+    stem = name[:-len('.json')]
+    dist_name = f'{stem}.{content_hash(data.decode())}.json'
+    dist_file = DIST_DIR / dist_name
+    dist_file.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(dist_file, data)
+    write_compressed(dist_file, data)
+    return f'dist/{dist_name}'
+
+def remove_stale(directory, keep):
+    """Delete fingerprinted files (and their .br/.gz) no longer in the manifest"""
+    removed = 0
+    for path in directory.rglob('*.json*'):
+        base = path.as_posix()
+        for suffix in ('.br', '.gz'):
+            base = base[:-len(suffix)] if base.endswith(suffix) else base
+        if Path(base).relative_to(ASSETS_DIR).as_posix() not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+def load_manifest():
+    if MANIFEST_FILE.exists():
+        with open(MANIFEST_FILE, 'r') as f:
+            return json.load(f)
+    return {}
+
+def change_set(previous, files):
+    """{name: JSON Patch} for every file whose data changed (None if it was removed)"""
+    changes = {}
+    for name, path in files.items():
+        if previous.get(name) == path:
+            continue
+        with open(ASSETS_DIR / name, 'r') as f:
+            new = json.load(f)
+        old = None
+        if name in previous and (ASSETS_DIR / previous[name]).exists():
+            with open(ASSETS_DIR / previous[name], 'r') as f:
+                old = decode(json.load(f))
+        patch = diff(old, new) if old is not None else [{'op': 'replace', 'path': '', 'value': new}]
+        # A different path can also mean the same data, re-encoded
+        if patch:
+            changes[name] = patch
+    for name in previous:
+        if name not in files:
+            changes[name] = None
+    return changes
+
+def write_change_set(manifest, changes):
+    """Save a change set as the next version; returns the manifest entries"""
+    version = manifest.get('version', 0)
+    changes_from = manifest.get('changes_from', version + 1)
+    if changes:
+        version += 1
+        data = minify({'version': version, 'files': changes}).encode()
+        CHANGES_DIR.mkdir(parents=True, exist_ok=True)
+        write_if_changed(CHANGES_DIR / f'{version}.json', data)
+        write_compressed(CHANGES_DIR / f'{version}.json', data)
+
+        changes_from = max(changes_from, version - MAX_CHANGE_SETS + 1)
+        for path in CHANGES_DIR.glob('*.json*'):
+            if int(path.name.split('.')[0]) < changes_from:
+                path.unlink()
+    return {'version': version, 'changes_from': changes_from}
+
+def publish_assets(columnar=False):
+    """Publish every file; returns the manifest files map and the change set"""
+    manifest = load_manifest()
+    files = {name: publish_file(name, columnar) for name in source_files()}
+    changes = change_set(manifest.get('files', {}), files)
+
+    # The bundle is fingerprinted by publish_bundle.py; just compress it
+    bundles = set()
+    for bundle_file in BUNDLE_DIR.glob('dashboard.*.json'):
+        write_compressed(bundle_file, bundle_file.read_bytes())
+        bundles.add(bundle_file.relative_to(ASSETS_DIR).as_posix())
+
+    versions = write_change_set(manifest, changes)
+    remove_stale(DIST_DIR, set(files.values()))
+    remove_stale(BUNDLE_DIR, bundles)
+    write_manifest(MANIFEST_FILE, {'files': files, **versions})
+    write_if_changed(HEADERS_FILE, HEADERS.encode())
+    return files, changes
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish minified, fingerprinted, precompressed data assets")
+    parser.add_argument('--columnar', action='store_true', help="use the columnar encoding")
+    args = parser.parse_args()
+
+    print("Publishing static assets...")
+    if not brotli:
+        print("  brotli not installed, skipping .br files (pip install brotli)")
+
+    files, changes = publish_assets(columnar=args.columnar)
+
+    original = sum((ASSETS_DIR / name).stat().st_size for name in files)
+    minified = sum((ASSETS_DIR / path).stat().st_size for path in files.values())
+    gzipped = sum((ASSETS_DIR / (path + '.gz')).stat().st_size for path in files.values())
+    print(f"  {len(files)} files: {original / 1024:.1f} KB -> {minified / 1024:.1f} KB minified, {gzipped / 1024:.1f} KB gzip")
+    if brotli:
+        brotlied = sum((ASSETS_DIR / (path + '.br')).stat().st_size for path in files.values())
+        print(f"  {brotlied / 1024:.1f} KB brotli")
+    if changes:
+        print(f"  {len(changes)} files changed, change set {load_manifest()['version']}")
+    else:
+        print("  No changes")
+
+    print(f"\n✓ Assets saved to {DIST_DIR}")
+    print(f"✓ Cache headers: {HEADERS_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Publish the historical dashboard data as one content-hashed bundle
+
+Merges the per-platform transform outputs in html5up-landed/assets/data/
+(MFL/Yahoo dashboard data, playoff results, Sleeper draft positions) into a
+single minified html5up-landed/assets/data/bundles/dashboard.<hash>.json and
+writes a small manifest.json naming the current bundle. The bundle never
+changes once published, so it can be cached forever; only the manifest needs
+revalidating. Run after the transform/extract scripts:
+
+    python publish_bundle.py
+    python publish_bundle.py --columnar   # columnar-encoded (see columnar.py)
+"""
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from columnar import encode
+
+ASSETS_DIR = Path(__file__).parent.parent / 'html5up-landed' / 'assets' / 'data'
+BUNDLE_DIR = ASSETS_DIR / 'bundles'
+MANIFEST_FILE = ASSETS_DIR / 'manifest.json'
+# Rewritten during games by live_scores.py, never fingerprinted
+LIVE_DIR = ASSETS_DIR / 'live'
+
+# Bundle key -> source file in ASSETS_DIR
+BUNDLE_SOURCES = {
+    'mfl': 'mfl_dashboard_data.json',
+    'yahoo': 'yahoo_dashboard_data.json',
+    'mfl_playoffs': 'mfl_playoff_results.json',
+    'sleeper_playoffs': 'sleeper_playoff_results.json',
+    'sleeper_drafts': 'sleeper_draft_positions.json'
+}
+
+def minify(data):
+    return json.dumps(data, separators=(',', ':'), sort_keys=True)
+
+def content_hash(text):
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+def build_bundle():
+    """Load every source that exists (missing ones are published as null)"""
+    bundle = {}
+    for key, filename in BUNDLE_SOURCES.items():
+        source = ASSETS_DIR / filename
+        if source.exists():
+            with open(source, 'r') as f:
+                bundle[key] = json.load(f)
+        else:
+            bundle[key] = None
+    return bundle
+
+def write_manifest(manifest_file, entries):
+    """Merge entries into the manifest (other publish steps add their own keys)"""
+    manifest = {}
+    if manifest_file.exists():
+        with open(manifest_file, 'r') as f:
+            manifest = json.load(f)
+    if all(manifest.get(key) == value for key, value in entries.items()):
+        return
+    manifest.update(entries)
+    with open(manifest_file, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+def publish_bundle(columnar=False):
+    """Write the bundle and manifest; returns the bundle path relative to ASSETS_DIR"""
+    bundle = build_bundle()
+    text = minify(encode(bundle) if columnar else bundle)
+    name = f'dashboard.{content_hash(text)}.json'
+
+    BUNDLE_DIR.mkdir(parents=True, exist_ok=True)
+    bundle_file = BUNDLE_DIR / name
+    if not bundle_file.exists():
+        bundle_file.write_text(text)
+
+    # Old versions are no longer referenced by the manifest
+    for old in BUNDLE_DIR.glob('dashboard.*.json'):
+        if old.name != name:
+            old.unlink()
+
+    path = f'bundles/{name}'
+    write_manifest(MANIFEST_FILE, {'dashboard': path})
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish the dashboard data bundle")
+    parser.add_argument('--columnar', action='store_true', help="use the columnar encoding")
+    args = parser.parse_args()
+
+    print("Publishing dashboard bundle...")
+
+    path = publish_bundle(columnar=args.columnar)
+    size = (ASSETS_DIR / path).stat().st_size
+    sources = sum((ASSETS_DIR / f).stat().st_size for f in BUNDLE_SOURCES.values() if (ASSETS_DIR / f).exists())
+
+    print(f"  {len(BUNDLE_SOURCES)} files, {sources / 1024:.1f} KB -> {size / 1024:.1f} KB")
+    print(f"\n✓ Bundle saved to {ASSETS_DIR / path}")
+    print(f"✓ Manifest: {MANIFEST_FILE}")
+
+if __name__ == "__main__":
+    main()
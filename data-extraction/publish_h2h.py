@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Publish the Sleeper head-to-head matrix served by /api/h2h
+
+Builds the same payload netlify/functions/refresh-h2h.mjs computes
+({h2hMatrix: {user_id: {user_id: {wins, losses}}}, userNames, lastUpdated},
+regular season games only) from the stored weekly matchups
+(extract_sleeper_matchups.py), so it only needs each season's rosters and
+users instead of one request per week. Writes
+html5up-landed/assets/data/h2h.json, and leaves the file (and lastUpdated)
+alone when no record changed. blob_sync.py uploads it as the h2h-data blob.
+"""
+import json
+from datetime import datetime, timezone
+
+from extract_sleeper_matchups import load_all_matchups
+from publish_bundle import ASSETS_DIR
+from sleeper_api import fetch_json
+
+H2H_FILE = ASSETS_DIR / 'h2h.json'
+
+def season_h2h(season_data, h2h_matrix, user_names):
+    """Add one season's regular-season results to the matrix"""
+    league_id = season_data['league_id']
+    owners = {r['roster_id']: r['owner_id'] for r in fetch_json(f"league/{league_id}/rosters")}
+    for user in fetch_json(f"league/{league_id}/users"):
+        user_names[user['user_id']] = user.get('display_name') or (user.get('metadata') or {}).get('team_name') or 'Unknown'
+
+    last_regular_week = (season_data.get('playoff_week_start') or 14) - 1
+    for week, matchups in season_data['weeks'].items():
+        if int(week) > last_regular_week:
+            continue
+
+        pairs = {}
+        for m in matchups:
+            pairs.setdefault(m['matchup_id'], []).append(m)
+        for pair in pairs.values():
+            if len(pair) != 2:
+                continue
+            user1, user2 = owners.get(pair[0]['roster_id']), owners.get(pair[1]['roster_id'])
+            if not user1 or not user2:
+                continue
+            record1 = h2h_matrix.setdefault(user1, {}).setdefault(user2, {'wins': 0, 'losses': 0})
+            record2 = h2h_matrix.setdefault(user2, {}).setdefault(user1, {'wins': 0, 'losses': 0})
+            if pair[0]['points'] > pair[1]['points']:
+                record1['wins'] += 1
+                record2['losses'] += 1
+            elif pair[1]['points'] > pair[0]['points']:
+                record2['wins'] += 1
+                record1['losses'] += 1
+
+def main():
+    print("Calculating head-to-head records...")
+
+    h2h_matrix = {}
+    user_names = {}
+    for season, season_data in load_all_matchups().items():
+        season_h2h(season_data, h2h_matrix, user_names)
+        print(f"  {season}: {len(season_data['weeks'])} weeks")
+
+    previous = {}
+    if H2H_FILE.exists():
+        with open(H2H_FILE, 'r') as f:
+            previous = json.load(f)
+    if previous.get('h2hMatrix') == h2h_matrix and previous.get('userNames') == user_names:
+        print(f"\n✓ Head-to-head unchanged: {H2H_FILE}")
+        return
+
+    with open(H2H_FILE, 'w') as f:
+        json.dump({
+            'h2hMatrix': h2h_matrix,
+            'userNames': user_names,
+            'lastUpdated': datetime.now(timezone.utc).isoformat()
+        }, f, indent=2)
+
+    print(f"\n✓ Head-to-head saved to {H2H_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Publish one small profile shard per owner for user.html
+
+Precomputes everything renderUserProfile() used to assemble in the browser
+(career totals, year-by-year rows across MFL/Yahoo/Sleeper, playoff
+placements, draft slots), plus head-to-head records from the weekly games and
+the owner's Elo trajectory, and writes it to
+html5up-landed/assets/data/profiles/<username>.json. A profile page then loads
+a few KB instead of every platform's full data.
+
+Reads the files publish_bundle.py bundles, elo_ratings.json and the weekly
+games (weekly_scores.py), and the Sleeper API for per-season rosters.
+"""
+import json
+
+from publish_bundle import ASSETS_DIR, build_bundle, minify
+from sleeper_api import fetch_json, get_roster_owners, resolve_league_history
+from weekly_scores import load_games
+
+PROFILES_DIR = ASSETS_DIR / 'profiles'
+ELO_FILE = ASSETS_DIR / 'elo_ratings.json'
+
+PLACES = ['champion', 'runner_up', 'third_place', 'fourth_place', 'fifth_place',
+          'sixth_place', 'seventh_place', 'eighth_place', 'sacko']
+
+def camel(key):
+    head, *rest = key.split('_')
+    return head + ''.join(word.title() for word in rest)
+
+def new_profile(username):
+    return {
+        'username': username,
+        'seasons': [],
+        'totalWins': 0,
+        'totalLosses': 0,
+        'totalTies': 0,
+        'totalPointsFor': 0,
+        'totalPointsAgainst': 0,
+        'championships': 0,
+        'runnerUps': 0,
+        'sackos': 0,
+        'playoffAppearances': 0,
+        'h2h': [],
+        'elo': None
+    }
+
+def add_historical(profiles, dashboard_data, platform):
+    """Season rows and totals from an MFL/Yahoo dashboard file"""
+    for manager in (dashboard_data or {}).get('manager_stats', []):
+        profile = profiles.setdefault(manager['username'], new_profile(manager['username']))
+        totals = manager['totals']
+        profile['totalWins'] += totals['wins']
+        profile['totalLosses'] += totals['losses']
+        profile['totalTies'] += totals['ties']
+        profile['totalPointsFor'] += totals['points_for']
+        profile['totalPointsAgainst'] += totals['points_against']
+        profile['championships'] += totals['championships']
+
+        for year, year_data in manager['years'].items():
+            row = {
+                'year': int(year),
+                'platform': platform,
+                'wins': year_data['wins'],
+                'losses': year_data['losses'],
+                'ties': year_data['ties'],
+                'pointsFor': year_data['points_for'],
+                'pointsAgainst': year_data['points_against'],
+                'champion': year_data['champion'],
+                'runnerUp': year_data.get('runner_up') or False,
+                'finish': year_data.get('finish'),
+                'totalTeams': year_data.get('total_teams')
+            }
+            if platform == 'MFL':
+                row['draftPick'] = year_data.get('draft_pick')
+            profile['seasons'].append(row)
+
+def add_sleeper_season(profiles, season, league_id, playoffs, drafts):
+    """Season rows from one Sleeper league's rosters"""
+    rosters = fetch_json(f"league/{league_id}/rosters")
+    users = {u['user_id']: u for u in fetch_json(f"league/{league_id}/users")}
+    owners = get_roster_owners(league_id)
+
+    # Same ordering the dashboard uses: wins, then points
+    standings = sorted(
+        rosters,
+        key=lambda r: ((r.get('settings') or {}).get('wins', 0), (r.get('settings') or {}).get('fpts', 0)),
+        reverse=True
+    )
+    places = next((p for p in playoffs or [] if p['year'] == season), {})
+    season_drafts = (drafts or {}).get(str(season), {})
+
+    for finish, roster in enumerate(standings, 1):
+        username = (owners.get(roster['roster_id']) or '').lower()
+        if not username:
+            continue
+        settings = roster.get('settings') or {}
+        profile = profiles.setdefault(username, new_profile(username))
+
+        row = {
+            'year': season,
+            'platform': 'Sleeper',
+            'teamName': ((users.get(roster.get('owner_id')) or {}).get('metadata') or {}).get('team_name'),
+            'wins': settings.get('wins', 0),
+            'losses': settings.get('losses', 0),
+            'ties': settings.get('ties', 0),
+            'pointsFor': settings.get('fpts', 0),
+            'pointsAgainst': settings.get('fpts_against', 0)
+        }
+        for place in PLACES:
+            row[camel(place)] = places.get(place) == username
+        row['finish'] = finish
+        row['totalTeams'] = len(rosters)
+        row['draftPick'] = (season_drafts.get(username) or {}).get('pick')
+
+        profile['totalWins'] += row['wins']
+        profile['totalLosses'] += row['losses']
+        profile['totalTies'] += row['ties']
+        profile['totalPointsFor'] += row['pointsFor']
+        profile['totalPointsAgainst'] += row['pointsAgainst']
+        profile['championships'] += row['champion']
+        profile['runnerUps'] += row['runnerUp']
+        profile['sackos'] += row['sacko']
+        profile['seasons'].append(row)
+
+def head_to_head(games):
+    """Per owner, per opponent record and points over every game"""
+    records = {}
+    for game in games:
+        for (owner, opponent), (points, against) in (
+            (game['teams'], game['points']),
+            (game['teams'][::-1], game['points'][::-1])
+        ):
+            row = records.setdefault(owner, {}).setdefault(opponent, {
+                'opponent': opponent, 'wins': 0, 'losses': 0, 'ties': 0,
+                'pointsFor': 0.0, 'pointsAgainst': 0.0
+            })
+            if points > against:
+                row['wins'] += 1
+            elif points < against:
+                row['losses'] += 1
+            else:
+                row['ties'] += 1
+            row['pointsFor'] = round(row['pointsFor'] + points, 2)
+            row['pointsAgainst'] = round(row['pointsAgainst'] + against, 2)
+
+    return {
+        owner: sorted(rows.values(), key=lambda r: (-(r['wins'] + r['losses'] + r['ties']), r['opponent']))
+        for owner, rows in records.items()
+    }
+
+def build_profiles():
+    bundle = build_bundle()
+    profiles = {}
+
+    add_historical(profiles, bundle['mfl'], 'MFL')
+    add_historical(profiles, bundle['yahoo'], 'Yahoo')
+    for season, league_id in resolve_league_history().items():
+        add_sleeper_season(profiles, season, league_id, bundle['sleeper_playoffs'], bundle['sleeper_drafts'])
+
+    h2h = head_to_head(load_games())
+    elo = None
+    if ELO_FILE.exists():
+        with open(ELO_FILE, 'r') as f:
+            elo = json.load(f)
+
+    for username, profile in profiles.items():
+        profile['seasons'].sort(key=lambda s: s['year'])
+        profile['totalPointsFor'] = round(profile['totalPointsFor'], 2)
+        profile['totalPointsAgainst'] = round(profile['totalPointsAgainst'], 2)
+        profile['h2h'] = h2h.get(username, [])
+        if elo and username in elo['history']:
+            ranked = [row['owner'] for row in elo['current']]
+            profile['elo'] = {
+                'history': elo['history'][username],
+                'current': elo['current'][ranked.index(username)],
+                'rank': ranked.index(username) + 1
+            }
+
+    return profiles
+
+def write_shards(profiles):
+    """Write changed shards and drop ones for owners no longer present; returns files written"""
+    PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for username, profile in profiles.items():
+        shard = PROFILES_DIR / f'{username}.json'
+        text = minify(profile)
+        if shard.exists() and shard.read_text() == text:
+            continue
+        shard.write_text(text)
+        written += 1
+
+    for shard in PROFILES_DIR.glob('*.json'):
+        if shard.stem not in profiles:
+            shard.unlink()
+    return written
+
+def main():
+    print("Publishing profile shards...")
+
+    profiles = build_profiles()
+    written = write_shards(profiles)
+    sizes = [(PROFILES_DIR / f'{u}.json').stat().st_size for u in profiles]
+
+    print(f"  {len(profiles)} owners, {written} shards updated, largest {max(sizes, default=0) / 1024:.1f} KB")
+    print(f"\n✓ Profiles saved to {PROFILES_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Publish per-season weekly score matrices and transaction summaries
+
+For every Sleeper season this writes html5up-landed/assets/data/weekly/:
+
+  sleeper_<season>.json        roster x week points (and matchup IDs) for every
+                               finished week except the newest, plus the
+                               deduplicated transactions from those weeks
+  sleeper_<season>_delta.json  the same for just the newest finished week
+
+so the weekly charts, manager analysis and waiver tables render from two
+cached files instead of one Sleeper request per week. The base file only
+changes once a week; stat corrections only touch the small delta. Weeks still
+in progress are left out and fetched live by the dashboard.
+
+Reads the extracts from extract_sleeper_matchups.py and
+extract_sleeper_transactions.py.
+"""
+import json
+
+from extract_sleeper_matchups import load_all_matchups
+from extract_sleeper_transactions import load_all_transactions
+from publish_bundle import ASSETS_DIR
+
+WEEKLY_DIR = ASSETS_DIR / 'weekly'
+
+def final_weeks(season_data):
+    """Weeks whose scores are final"""
+    weeks = sorted(int(week) for week in season_data['weeks'])
+    if season_data.get('status') == 'complete':
+        return weeks
+    current_week = season_data.get('current_week') or 99
+    return [week for week in weeks if week < current_week]
+
+def score_matrix(season_data, weeks):
+    """Roster IDs and [roster][week] points / matchup IDs (None where a team has no row)"""
+    rosters = sorted({m['roster_id'] for week in weeks for m in season_data['weeks'][str(week)]})
+    index = {roster_id: i for i, roster_id in enumerate(rosters)}
+    points = [[None] * len(weeks) for _ in rosters]
+    matchup_ids = [[None] * len(weeks) for _ in rosters]
+
+    for j, week in enumerate(weeks):
+        for matchup in season_data['weeks'][str(week)]:
+            i = index[matchup['roster_id']]
+            points[i][j] = round(matchup.get('points') or 0.0, 2)
+            matchup_ids[i][j] = matchup.get('matchup_id')
+
+    return rosters, points, matchup_ids
+
+def transaction_summary(tx):
+    """The fields the dashboard reads, in Sleeper's shape"""
+    return {
+        'transaction_id': tx['transaction_id'],
+        'type': tx.get('type'),
+        'status': tx.get('status'),
+        'leg': tx.get('leg'),
+        'created': tx.get('created'),
+        'roster_ids': tx.get('roster_ids') or [],
+        'adds': tx.get('adds'),
+        'drops': tx.get('drops'),
+        'settings': {'waiver_bid': (tx.get('settings') or {}).get('waiver_bid', 0)}
+    }
+
+def weekly_asset(season_data, transactions, weeks):
+    rosters, points, matchup_ids = score_matrix(season_data, weeks)
+    week_set = set(weeks)
+    return {
+        'season': season_data['season'],
+        'league_id': season_data['league_id'],
+        'weeks': weeks,
+        'rosters': rosters,
+        'points': points,
+        'matchup_ids': matchup_ids,
+        'transactions': [transaction_summary(tx) for tx in transactions if tx.get('leg') in week_set]
+    }
+
+def write_if_changed(path, data):
+    """Write JSON unless the file already holds exactly this data; returns True if written"""
+    text = json.dumps(data, indent=2)
+    if path.exists() and path.read_text() == text:
+        return False
+    path.write_text(text)
+    return True
+
+def publish_season(season_data, season_transactions):
+    """Write one season's base and delta files; returns the files written"""
+    weeks = final_weeks(season_data)
+    if not weeks:
+        return []
+    transactions = (season_transactions or {}).get('transactions', [])
+
+    WEEKLY_DIR.mkdir(parents=True, exist_ok=True)
+    season = season_data['season']
+    written = []
+    for name, asset_weeks in (
+        (f'sleeper_{season}.json', weeks[:-1]),
+        (f'sleeper_{season}_delta.json', weeks[-1:])
+    ):
+        if write_if_changed(WEEKLY_DIR / name, weekly_asset(season_data, transactions, asset_weeks)):
+            written.append(name)
+    return written
+
+def main():
+    print("Publishing weekly score matrices...")
+
+    all_transactions = load_all_transactions()
+    for season, season_data in load_all_matchups().items():
+        written = publish_season(season_data, all_transactions.get(season))
+        weeks = final_weeks(season_data)
+        print(f"  {season}: {len(weeks)} final weeks, {len(written)} files updated")
+
+    print(f"\n✓ Weekly data saved to {WEEKLY_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+All-time record book, updated one week at a time
+
+One pass over every normalized game (weekly_scores.load_games) in order
+keeps the top K of each record in a bounded heap, for every scope: all-time,
+each season and each manager.
+
+  highest_score         a team's points in a game
+  lowest_score
+  biggest_blowout       winning margin (in the winner's book)
+  closest_game          smallest margin (in both teams' books)
+  highest_losing_score  points scored in a loss (in the loser's book)
+  longest_win_streak    consecutive wins, across seasons except in a
+  longest_loss_streak   season's own book
+
+The heaps, the streaks in progress and a hash of every week already counted
+are saved in output/cache/record_book_state.json, so a run only adds the
+weeks finished since the last one. If an earlier week changes (or a week
+appears before the last one counted, e.g. a newly extracted Yahoo season)
+the book is rebuilt from scratch; --rebuild forces that. The book is
+published to html5up-landed/assets/data/records.json, best record first.
+"""
+import argparse
+import hashlib
+import heapq
+import json
+from pathlib import Path
+
+from publish_bundle import ASSETS_DIR
+from weekly_scores import load_games
+
+STATE_FILE = Path(__file__).parent / 'output' / 'cache' / 'record_book_state.json'
+OUTPUT_FILE = ASSETS_DIR / 'records.json'
+
+K = 10
+
+# Record -> whether bigger values are better
+CATEGORIES = {
+    'highest_score': True,
+    'lowest_score': False,
+    'biggest_blowout': True,
+    'closest_game': False,
+    'highest_losing_score': True,
+    'longest_win_streak': True,
+    'longest_loss_streak': True
+}
+
+def week_digest(games):
+    return hashlib.sha1(json.dumps(games, sort_keys=True).encode()).hexdigest()[:16]
+
+def new_state():
+    return {'k': K, 'seq': 0, 'weeks': {}, 'books': {}, 'streaks': {'career': {}, 'season': {}}}
+
+def load_state():
+    if STATE_FILE.exists():
+        with open(STATE_FILE, 'r') as f:
+            state = json.load(f)
+        if state.get('k') == K:
+            return state
+    return new_state()
+
+def save_state(state):
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_FILE, 'w') as f:
+        json.dump(state, f, separators=(',', ':'))
+
+def push(state, scopes, category, value, record):
+    """Offer a record to the category's heap in every scope, keeping the best K"""
+    # Heaps are min-heaps of [key, seq, record]; the worst kept record is on top
+    key = value if CATEGORIES[category] else -value
+    state['seq'] += 1
+    for scope in scopes:
+        heap = state['books'].setdefault(scope, {}).setdefault(category, [])
+        entry = [key, -state['seq'], record]
+        if len(heap) < K:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+def end_streak(state, streak, scopes):
+    if streak and streak['length'] > 1:
+        category = 'longest_win_streak' if streak['type'] == 'W' else 'longest_loss_streak'
+        push(state, scopes, category, streak['length'], streak)
+
+def extend_streak(streaks, key, owner, result, game):
+    """Add a result to a streak; returns the streak it ended, if any"""
+    streak = streaks.get(key)
+    if result == 'T' or (streak and streak['type'] != result):
+        streaks.pop(key, None)
+        ended, streak = streak, None
+    else:
+        ended = None
+    if result == 'T':
+        return ended
+    if not streak:
+        streak = streaks[key] = {'owner': owner, 'type': result, 'length': 0,
+                                 'start': {'season': game['season'], 'week': game['week']}}
+    streak['length'] += 1
+    streak['end'] = {'season': game['season'], 'week': game['week']}
+    return ended
+
+def add_game(state, game):
+    season = str(game['season'])
+    (a, b), (pa, pb) = game['teams'], game['points']
+    all_time, season_scope = 'all_time', f'season:{season}'
+
+    # A new season ends the previous season's streaks in its own book
+    season_streaks = state['streaks']['season']
+    for key in [key for key in season_streaks if not key.startswith(f'{season}:')]:
+        end_streak(state, season_streaks.pop(key), [f"season:{key.split(':')[0]}"])
+
+    for owner, points, opponent, opponent_points in ((a, pa, b, pb), (b, pb, a, pa)):
+        record = {'owner': owner, 'points': points, 'opponent': opponent, 'opponent_points': opponent_points,
+                  'season': game['season'], 'week': game['week'], 'playoff': game['playoff']}
+        scopes = [all_time, season_scope, f'manager:{owner}']
+        push(state, scopes, 'highest_score', points, record)
+        push(state, scopes, 'lowest_score', points, record)
+        if points < opponent_points:
+            push(state, scopes, 'highest_losing_score', points, record)
+
+        result = 'W' if points > opponent_points else 'L' if points < opponent_points else 'T'
+        end_streak(state, extend_streak(state['streaks']['career'], owner, owner, result, game),
+                   [all_time, f'manager:{owner}'])
+        end_streak(state, extend_streak(state['streaks']['season'], f'{season}:{owner}', owner, result, game),
+                   [season_scope])
+
+    winner, loser = (a, b) if pa >= pb else (b, a)
+    margin = round(abs(pa - pb), 2)
+    record = {'winner': winner, 'loser': loser, 'winner_points': max(pa, pb), 'loser_points': min(pa, pb),
+              'margin': margin, 'season': game['season'], 'week': game['week'], 'playoff': game['playoff']}
+    if pa != pb:
+        push(state, [all_time, season_scope, f'manager:{winner}'], 'biggest_blowout', margin, record)
+    push(state, [all_time, season_scope, f'manager:{a}', f'manager:{b}'], 'closest_game', margin, record)
+
+def update(state, games, rebuild=False):
+    """Add every finished week not yet in the book; returns (weeks added, rebuilt)"""
+    weeks = {}
+    for game in games:
+        weeks.setdefault(f"{game['season']}-{game['week']}", []).append(game)
+    # Stop at the first week still in progress so weeks are added in order
+    finished = []
+    for key, week_games in weeks.items():
+        if not all(g['final'] for g in week_games):
+            break
+        finished.append(key)
+
+    counted = state['weeks']
+    digests = {key: week_digest(weeks[key]) for key in finished}
+    new = [key for key in finished if key not in counted]
+    stale = any(counted.get(key) not in (None, digests[key]) for key in finished) or set(counted) - set(digests)
+    out_of_order = new and counted and finished.index(new[0]) < len(counted)
+    if rebuild or stale or out_of_order:
+        state.clear()
+        state.update(new_state())
+        counted = state['weeks']
+        new, rebuild = finished, True
+
+    for key in new:
+        for game in weeks[key]:
+            add_game(state, game)
+        counted[key] = digests[key]
+    return new, bool(rebuild)
+
+def book(state):
+    """{scope: {category: [records, best first]}}, counting streaks still going"""
+    books = {scope: {c: list(heap) for c, heap in categories.items()} for scope, categories in state['books'].items()}
+    scratch = {'books': books, 'seq': state['seq']}
+    for owner, streak in state['streaks']['career'].items():
+        end_streak(scratch, {**streak, 'active': True}, ['all_time', f'manager:{owner}'])
+    for key, streak in state['streaks']['season'].items():
+        end_streak(scratch, {**streak, 'active': True}, [f"season:{key.split(':')[0]}"])
+
+    return {
+        scope: {category: [entry[2] for entry in sorted(heap, reverse=True)] for category, heap in categories.items()}
+        for scope, categories in books.items()
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Update the all-time record book")
+    parser.add_argument('--rebuild', action='store_true', help="recount every game from scratch")
+    args = parser.parse_args()
+
+    print("Updating record book...")
+    state = load_state()
+    added, rebuilt = update(state, load_games(), rebuild=args.rebuild)
+    save_state(state)
+    if rebuilt:
+        print(f"  Rebuilt from {len(added)} weeks")
+    else:
+        print(f"  {len(added)} new weeks" + (f" ({added[0]} to {added[-1]})" if added else ""))
+
+    books = book(state)
+    output = {
+        'k': K,
+        'all_time': books.get('all_time', {}),
+        'seasons': {scope.split(':', 1)[1]: b for scope, b in sorted(books.items()) if scope.startswith('season:')},
+        'managers': {scope.split(':', 1)[1]: b for scope, b in sorted(books.items()) if scope.startswith('manager:')}
+    }
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    top = output['all_time'].get('highest_score', [])
+    if top:
+        print(f"  Highest score ever: {top[0]['points']} by {top[0]['owner']} ({top[0]['season']} week {top[0]['week']})")
+    print(f"\n✓ Record book saved to {OUTPUT_FILE}")
+
+if __name__ == "__main__":
+    main()
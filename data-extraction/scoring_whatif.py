@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Re-score Sleeper seasons under other scoring settings
+
+Every player-week stat line of a season is a row of one stats matrix
+(columns are stat keys: rec, pass_yd, rush_td, ...), and a ruleset in
+Sleeper scoring_settings form is a weight per column, so one matrix product
+scores every player-week under every ruleset at once. Starters are then
+summed per team-week with an index array, matchups re-decided and the
+standings rebuilt (standings.py) for each ruleset.
+
+RULESETS are changes on top of each season's own scoring_settings, so
+'league' reproduces the real scores; the PPR rulesets also zero the league's
+reception bonuses, so only te_premium has one. Position bonuses Sleeper applies to
+receptions (bonus_rec_te, ...) become their own columns. Stat lines come
+from Sleeper's weekly stats and are cached per week in
+output/cache/sleeper_stats/ (only rostered players). Each season's result
+per ruleset is cached in output/cache/scoring_whatif/ under a hash of the
+weights and the stats, so only new rulesets or changed stats are computed.
+Writes html5up-landed/assets/data/scoring_whatif.json.
+
+    python scoring_whatif.py
+    python scoring_whatif.py --set rec=0.75 --set bonus_rec_te=0.25   # adds a 'custom' ruleset
+"""
+import argparse
+import hashlib
+import json
+import time
+
+import numpy as np
+
+from extract_sleeper_matchups import load_all_matchups
+from publish_bundle import ASSETS_DIR
+from sleeper_api import CACHE_DIR, fetch_json, get_player_index
+from standings import season_table, standings_as_of
+from weekly_scores import sleeper_games
+
+STATS_DIR = CACHE_DIR / 'sleeper_stats'
+RESULTS_DIR = CACHE_DIR / 'scoring_whatif'
+OUTPUT_FILE = ASSETS_DIR / 'scoring_whatif.json'
+
+# Bonus keys that score a stat only for one position
+POSITION_BONUSES = {
+    'bonus_rec_rb': ('rec', 'RB'),
+    'bonus_rec_wr': ('rec', 'WR'),
+    'bonus_rec_te': ('rec', 'TE')
+}
+
+# The PPR rulesets clear any reception bonus the league itself uses
+NO_BONUSES = {bonus: 0.0 for bonus in POSITION_BONUSES}
+
+RULESETS = {
+    'league': {},
+    'standard': {'rec': 0.0, **NO_BONUSES},
+    'half_ppr': {'rec': 0.5, **NO_BONUSES},
+    'full_ppr': {'rec': 1.0, **NO_BONUSES},
+    'te_premium': {'rec': 1.0, **NO_BONUSES, 'bonus_rec_te': 0.5}
+}
+
+def digest(data):
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()[:16]
+
+def week_is_final(season_data, week):
+    return season_data.get('status') == 'complete' or int(week) < (season_data.get('current_week') or 99)
+
+def week_stats(season_data, week):
+    """{player_id: {stat: value}} for a week's rostered players"""
+    path = STATS_DIR / f"{season_data['league_id']}_w{week}.json"
+    if path.exists() and week_is_final(season_data, week):
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    rostered = {pid for m in season_data['weeks'][week] for pid in m.get('players') or []}
+    stats = fetch_json(f"stats/nfl/regular/{season_data['season']}/{week}") or {}
+    stats = {pid: line for pid, line in stats.items() if pid in rostered}
+    STATS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(stats, f, separators=(',', ':'))
+    return stats
+
+def stats_matrix(season_data, positions):
+    """(rows, columns, matrix): rows maps (week, player_id) to a matrix row"""
+    rows, lines, row_positions = {}, [], []
+    for week, matchups in season_data['weeks'].items():
+        stats = week_stats(season_data, week)
+        for m in matchups:
+            for pid in m.get('players') or []:
+                if (week, pid) not in rows:
+                    rows[(week, pid)] = len(lines)
+                    lines.append(stats.get(pid) or {})
+                    row_positions.append(positions.get(pid))
+
+    numeric = {key for line in lines for key, value in line.items() if isinstance(value, (int, float))}
+    columns = sorted(numeric | set(POSITION_BONUSES))
+    index = {key: i for i, key in enumerate(columns)}
+    matrix = np.zeros((len(lines), len(columns)))
+    for r, line in enumerate(lines):
+        for key, value in line.items():
+            if key in numeric:
+                matrix[r, index[key]] = value
+
+    row_positions = np.array(row_positions, dtype=object)
+    for bonus, (stat, position) in POSITION_BONUSES.items():
+        if stat in index:
+            matrix[:, index[bonus]] = np.where(row_positions == position, matrix[:, index[stat]], 0.0)
+    return rows, columns, matrix
+
+def ruleset_settings(base, changes):
+    return {**base, **changes}
+
+def weights(settings, columns):
+    return np.array([float(settings.get(key) or 0.0) for key in columns])
+
+def team_weeks(season_data, rows):
+    """[(week, matchup row)] and a padded team-week x starter array of matrix rows (-1 = empty)"""
+    entries = [(week, m) for week, matchups in season_data['weeks'].items() for m in matchups]
+    width = max((len(m.get('starters') or []) for _, m in entries), default=0)
+    starters = np.full((len(entries), width), -1)
+    for t, (week, m) in enumerate(entries):
+        for s, pid in enumerate(m.get('starters') or []):
+            starters[t, s] = rows.get((week, pid), -1)
+    return entries, starters
+
+def rescore(season_data, entries, scores):
+    """Standings and weekly team scores from one ruleset's team-week points"""
+    weeks = {}
+    for (week, m), points in zip(entries, scores):
+        weeks.setdefault(week, []).append({**m, 'points': round(float(points), 2)})
+    games = sleeper_games({**season_data, 'weeks': weeks})
+
+    by_week = {}
+    for game in games:
+        by_week.setdefault(game['week'], []).append(game)
+    table = season_table(by_week)
+    return {
+        'standings': standings_as_of(table, max(table['weeks'], default=0)),
+        'weeks': {
+            str(week): {team: points for g in week_games for team, points in zip(g['teams'], g['points'])}
+            for week, week_games in sorted(by_week.items())
+        }
+    }
+
+def season_whatif(season_data, positions, rulesets):
+    """{ruleset: result} for one season, computing only rulesets not cached yet"""
+    base = season_data.get('scoring_settings') or fetch_json(f"league/{season_data['league_id']}").get('scoring_settings') or {}
+    rows, columns, matrix = stats_matrix(season_data, positions)
+    stats_digest = hashlib.sha1(matrix.tobytes() + json.dumps(columns).encode()).hexdigest()[:16]
+
+    results, pending = {}, {}
+    for name, changes in rulesets.items():
+        settings = ruleset_settings(base, changes)
+        key = digest({'settings': settings, 'stats': stats_digest})
+        path = RESULTS_DIR / f"{season_data['season']}_{key}.json"
+        if path.exists():
+            with open(path, 'r') as f:
+                results[name] = json.load(f)
+        else:
+            pending[name] = (settings, key, path)
+    if not pending:
+        return results, 0.0
+
+    started = time.time()
+    entries, starters = team_weeks(season_data, rows)
+    # Every ruleset in one product: player-week x ruleset points
+    points = matrix @ np.stack([weights(settings, columns) for settings, _, _ in pending.values()], axis=1)
+    team_points = np.where(starters[:, :, None] >= 0, points[starters], 0.0).sum(axis=1)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    for r, (name, (settings, key, path)) in enumerate(pending.items()):
+        # Rulesets that come out the same as the league's own settings share a file
+        result = {'hash': key, **rescore(season_data, entries, team_points[:, r])}
+        with open(path, 'w') as f:
+            json.dump(result, f, separators=(',', ':'))
+        results[name] = result
+    return results, time.time() - started
+
+def league_drift(season_data, league_result):
+    """Largest gap between the 'league' ruleset and the real scores (should be ~0)"""
+    drift = 0.0
+    for game in sleeper_games(season_data):
+        rescored = league_result['weeks'].get(str(game['week']), {})
+        for team, points in zip(game['teams'], game['points']):
+            drift = max(drift, abs(rescored.get(team, points) - points))
+    return drift
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score Sleeper seasons under other scoring settings")
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUE',
+                        help="add a 'custom' ruleset with these scoring_settings changes")
+    args = parser.parse_args()
+
+    rulesets = dict(RULESETS)
+    if args.set:
+        rulesets['custom'] = {key: float(value) for key, value in (item.split('=', 1) for item in args.set)}
+
+    print("Re-scoring seasons...")
+    positions = {pid: row[1] for pid, row in get_player_index().items()}
+
+    seasons = {}
+    for season, season_data in load_all_matchups().items():
+        if not season_data['weeks']:
+            continue
+        results, elapsed = season_whatif(season_data, positions, rulesets)
+        seasons[str(season)] = results
+        leaders = ', '.join(f"{name}: {result['standings'][0]['owner']}" for name, result in results.items() if result['standings'])
+        print(f"  {season}: {elapsed * 1000:.0f} ms ({leaders})")
+        drift = league_drift(season_data, results['league'])
+        if drift > 0.05:
+            print(f"  ⚠ {season}: league scoring is off from the real scores by up to {drift:.2f} points")
+
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump({'rulesets': rulesets, 'seasons': seasons}, f, indent=2)
+
+    print(f"\n✓ Scoring what-ifs saved to {OUTPUT_FILE}")
+
+if __name__ == "__main__":
+    main()
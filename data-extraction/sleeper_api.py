@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Shared Sleeper API helpers
+
+resolve_league_history() replaces the hand-maintained LEAGUE_IDS tables: it
+starts at the current league and follows previous_league_id back to our first
+Sleeper season. Each league it sees is cached in
+output/cache/sleeper_league_history.json; seasons that are finished never
+change, so only the in-progress league is re-fetched on later runs.
+
+get_roster_owners() resolves every roster in a league to a username with two
+requests, instead of three requests per lookup.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+API_BASE = "https://api.sleeper.app/v1"
+# NFL schedule with each game's status; not part of the versioned API
+SCHEDULE_BASE = "https://api.sleeper.app/schedule/nfl/regular"
+
+# The only Sleeper ID that needs editing: bump it when the new season's league is created
+CURRENT_LEAGUE_ID = "1257482235834028032"
+
+CACHE_DIR = Path(__file__).parent / 'output' / 'cache'
+HISTORY_CACHE_FILE = CACHE_DIR / 'sleeper_league_history.json'
+USERNAMES_CACHE_FILE = CACHE_DIR / 'sleeper_usernames.json'
+PLAYER_INDEX_CACHE_FILE = CACHE_DIR / 'sleeper_player_index.json'
+
+# /players/nfl is several MB; Sleeper asks that it be fetched at most once a day
+PLAYERS_MAX_AGE = 24 * 60 * 60
+
+# batch.py calls these from several threads at once
+_cache_lock = threading.Lock()
+
+def fetch_json(path):
+    """GET an API path (e.g. 'league/123/rosters') and return the decoded JSON"""
+    response = requests.get(f"{API_BASE}/{path}")
+    response.raise_for_status()
+    return response.json()
+
+def load_cache(cache_file):
+    """Load a JSON cache file (empty if it doesn't exist yet)"""
+    if not cache_file.exists():
+        return {}
+    with open(cache_file, 'r') as f:
+        return json.load(f)
+
+def save_cache(cache_file, data):
+    """Save a JSON cache file"""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def resolve_league_history(league_id=CURRENT_LEAGUE_ID, refresh=False):
+    """
+    Return {season: league_id} for every Sleeper season of a league, oldest first
+
+    Walks previous_league_id from league_id. Leagues whose status is 'complete'
+    are served from the cache; everything else (normally just the current
+    season) is fetched. refresh=True ignores the cache entirely.
+    """
+    cache = load_cache(HISTORY_CACHE_FILE)
+    changed = False
+    history = {}
+
+    while league_id and league_id != "0":
+        entry = cache.get(league_id)
+        if refresh or not entry or entry['status'] != 'complete':
+            league = fetch_json(f"league/{league_id}")
+            entry = {
+                'season': int(league['season']),
+                'name': league.get('name'),
+                'status': league.get('status'),
+                'previous_league_id': league.get('previous_league_id')
+            }
+            cache[league_id] = entry
+            changed = True
+
+        history[entry['season']] = league_id
+        league_id = entry['previous_league_id']
+
+    if changed:
+        save_cache(HISTORY_CACHE_FILE, cache)
+
+    return dict(sorted(history.items()))
+
+def get_roster_owners(league_id, rosters=None):
+    """
+    Return {roster_id: username} for every roster in a league
+
+    Usernames never change for a user_id, so they are cached in
+    output/cache/sleeper_usernames.json; a profile is only fetched the first
+    time a user is seen and the league users payload doesn't include it.
+    Pass rosters if the caller already fetched them.
+    """
+    if rosters is None:
+        rosters = fetch_json(f"league/{league_id}/rosters")
+    users = fetch_json(f"league/{league_id}/users")
+
+    with _cache_lock:
+        usernames = load_cache(USERNAMES_CACHE_FILE)
+        changed = False
+        for user in users:
+            user_id = user['user_id']
+            if user_id in usernames:
+                continue
+            username = user.get('username') or (fetch_json(f"user/{user_id}") or {}).get('username')
+            if username:
+                usernames[user_id] = username
+                changed = True
+
+        if changed:
+            save_cache(USERNAMES_CACHE_FILE, usernames)
+
+    return {roster['roster_id']: usernames.get(roster['owner_id']) for roster in rosters}
+
+def get_draft_picks(league_id):
+    """
+    Return (draft, picks) for a league's draft, or (None, []) if it has none
+
+    Picks from completed drafts are cached in output/cache/ permanently.
+    """
+    drafts = fetch_json(f"league/{league_id}/drafts")
+    if not drafts:
+        return None, []
+
+    # There's usually only one draft per season
+    draft = drafts[0]
+    cache_file = CACHE_DIR / f"sleeper_draft_picks_{draft['draft_id']}.json"
+    if cache_file.exists():
+        with open(cache_file, 'r') as f:
+            return draft, json.load(f)
+
+    picks = fetch_json(f"draft/{draft['draft_id']}/picks") or []
+    if draft.get('status') == 'complete' and picks:
+        save_cache(cache_file, picks)
+
+    return draft, picks
+
+def get_nfl_game_status(season, week):
+    """{team: game status} for a week's NFL games ('complete' once final); teams on bye are absent"""
+    response = requests.get(f"{SCHEDULE_BASE}/{season}")
+    response.raise_for_status()
+    status = {}
+    for game in response.json() or []:
+        if int(game.get('week') or 0) == int(week):
+            for side in ('home', 'away'):
+                if game.get(side):
+                    status[game[side]] = game.get('status')
+    return status
+
+def get_player_index(refresh=False):
+    """
+    Return {player_id: [name, position, team, fantasy positions]} for every NFL player
+
+    Downloads /players/nfl at most once a day (or when refresh=True) and keeps
+    only these fields, a small fraction of the full dump.
+    """
+    with _cache_lock:
+        cache_file = PLAYER_INDEX_CACHE_FILE
+        if not refresh and cache_file.exists() and time.time() - cache_file.stat().st_mtime < PLAYERS_MAX_AGE:
+            return load_cache(cache_file)
+
+        players = fetch_json("players/nfl")
+        index = {}
+        for player_id, player in players.items():
+            name = f"{player.get('first_name') or ''} {player.get('last_name') or ''}".strip()
+            fantasy_positions = player.get('fantasy_positions') or ([player['position']] if player.get('position') else [])
+            index[player_id] = [name or None, player.get('position'), player.get('team'), fantasy_positions]
+        save_cache(cache_file, index)
+        return index
+
+def get_player_positions():
+    """Return {player_id: [fantasy positions]} for every NFL player with one"""
+    return {
+        player_id: row[3]
+        for player_id, row in get_player_index().items()
+        if row[3]
+    }
+
+def main():
+    history = resolve_league_history()
+    print("Sleeper league history:")
+    for season, league_id in history.items():
+        print(f"  {season}: {league_id}")
+    print(f"\n✓ Cached to {HISTORY_CACHE_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Regular-season standings as of any week, from cumulative per-week arrays
+
+season_table() turns a season's finished regular-season games into running
+totals: wins, losses, ties, points for and points against as team x week prefix sums,
+plus a week x team x team array of running head-to-head wins. Standings after
+week N are then a column lookup and one sort of the teams (standings_as_of),
+whatever N is. Teams are ordered by win percentage (ties count half), then by
+TIEBREAKERS in order:
+
+  - h2h:            win percentage in games between the tied teams
+  - points_for:     more is better
+  - points_against: fewer is better
+
+Running this script saves the standings after every week of every season to
+html5up-landed/assets/data/standings.json for the season view:
+
+    {"tiebreakers": [...], "seasons": {"2024": {"weeks": [1, ...],
+     "standings": {"1": [{"owner", "rank", "wins", ...}, ...]}}}}
+"""
+import json
+from bisect import bisect_right
+from itertools import groupby
+
+import numpy as np
+
+from publish_bundle import ASSETS_DIR
+from weekly_scores import games_by_season, load_games
+
+OUTPUT_FILE = ASSETS_DIR / 'standings.json'
+
+TIEBREAKERS = ['h2h', 'points_for', 'points_against']
+
+def season_table(season_games):
+    """Running totals for one season's {week: [games]}, finished regular-season weeks only"""
+    weeks = []
+    for week in sorted(season_games):
+        games = season_games[week]
+        # Stop at the first week still in progress; partial scores aren't results yet
+        if not all(g['final'] for g in games):
+            break
+        if not any(g['playoff'] for g in games):
+            weeks.append(week)
+    owners = sorted({owner for week in weeks for g in season_games[week] for owner in g['teams']})
+    index = {owner: i for i, owner in enumerate(owners)}
+    n, w = len(owners), len(weeks)
+
+    weekly = {key: np.zeros((n, w)) for key in ('wins', 'losses', 'ties', 'points_for', 'points_against')}
+    h2h = np.zeros((w, n, n))
+    for j, week in enumerate(weeks):
+        # MFL division years have two games a week, so everything accumulates
+        for g in season_games[week]:
+            (a, b), (pa, pb) = [index[owner] for owner in g['teams']], g['points']
+            weekly['points_for'][[a, b], j] += (pa, pb)
+            weekly['points_against'][[a, b], j] += (pb, pa)
+            if pa == pb:
+                weekly['ties'][[a, b], j] += 1
+                continue
+            winner, loser = (a, b) if pa > pb else (b, a)
+            weekly['wins'][winner, j] += 1
+            weekly['losses'][loser, j] += 1
+            h2h[j, winner, loser] += 1
+
+    # Column k holds the totals after the first k weeks
+    table = {
+        key: np.concatenate([np.zeros((n, 1)), values.cumsum(axis=1)], axis=1)
+        for key, values in weekly.items()
+    }
+    table['h2h'] = np.concatenate([np.zeros((1, n, n)), h2h.cumsum(axis=0)])
+    table['owners'] = owners
+    table['weeks'] = weeks
+    return table
+
+def standings_as_of(table, week, tiebreakers=TIEBREAKERS):
+    """Rows in standings order after `week` (every regular-season week up to and including it)"""
+    k = bisect_right(table['weeks'], week)
+    wins, losses, ties = table['wins'][:, k], table['losses'][:, k], table['ties'][:, k]
+    points_for, points_against = table['points_for'][:, k], table['points_against'][:, k]
+    h2h = table['h2h'][k]
+    games = wins + losses + ties
+    win_pct = np.where(games > 0, (wins + ties / 2) / np.maximum(games, 1), 0.0)
+
+    def tiebreak_key(i, group):
+        key = []
+        for tiebreaker in tiebreakers:
+            if tiebreaker == 'h2h':
+                won, lost = h2h[i, group].sum(), h2h[group, i].sum()
+                key.append(-(won / (won + lost)) if won + lost else -0.5)
+            elif tiebreaker == 'points_for':
+                key.append(-points_for[i])
+            elif tiebreaker == 'points_against':
+                key.append(points_against[i])
+        return key
+
+    order = []
+    by_pct = sorted(range(len(table['owners'])), key=lambda i: -win_pct[i])
+    for _, tied in groupby(by_pct, key=lambda i: win_pct[i]):
+        group = list(tied)
+        order.extend(sorted(group, key=lambda i: tiebreak_key(i, group)) if len(group) > 1 else group)
+
+    return [
+        {
+            'owner': table['owners'][i],
+            'rank': rank,
+            'wins': int(wins[i]),
+            'losses': int(losses[i]),
+            'ties': int(ties[i]),
+            'points_for': round(float(points_for[i]), 2),
+            'points_against': round(float(points_against[i]), 2)
+        }
+        for rank, i in enumerate(order, 1)
+    ]
+
+def weekly_standings(season_games, tiebreakers=TIEBREAKERS):
+    """{week: rows} for every regular-season week"""
+    table = season_table(season_games)
+    return {week: standings_as_of(table, week, tiebreakers) for week in table['weeks']}
+
+def main():
+    print("Calculating weekly standings...")
+
+    seasons = {}
+    for season, season_games in games_by_season(load_games()).items():
+        snapshots = weekly_standings(season_games)
+        if not snapshots:
+            continue
+        seasons[str(season)] = {
+            'weeks': sorted(snapshots),
+            'standings': {str(week): rows for week, rows in snapshots.items()}
+        }
+        leader = snapshots[max(snapshots)][0]
+        print(f"  {season}: {len(snapshots)} weeks, first place {leader['owner']} "
+              f"({leader['wins']}-{leader['losses']}{'-' + str(leader['ties']) if leader['ties'] else ''})")
+
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump({'tiebreakers': TIEBREAKERS, 'seasons': seasons}, f, indent=2)
+
+    print(f"\n✓ Standings saved to {OUTPUT_FILE}")
+
+if __name__ == "__main__":
+    main()
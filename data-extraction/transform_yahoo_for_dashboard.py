@@ -5,16 +5,6 @@ Transform Yahoo Fantasy data into dashboard format
 import json
 from pathlib import Path
 
-# Load Yahoo data
-yahoo_data_file = Path(__file__).parent / 'output' / 'yahoo' / 'yahoo_all_years.json'
-with open(yahoo_data_file, 'r') as f:
-    yahoo_data = json.load(f)
-
-# Load team name mapping
-mapping_file = Path(__file__).parent / 'yahoo_team_mapping.json'
-with open(mapping_file, 'r') as f:
-    team_mapping = json.load(f)
-
 # Load owner mapping for display names
 owner_mapping_file = Path(__file__).parent / 'owner_mapping.json'
 with open(owner_mapping_file, 'r') as f:
@@ -33,11 +23,11 @@ def get_display_name(username):
     """Get display name from username"""
     return username_to_display.get(username.lower(), username)
 
-def transform_yahoo_data():
+def transform_yahoo_data(yahoo_data, team_mapping):
     """Transform Yahoo data to dashboard format"""
     dashboard_data = {
         'platform': 'Yahoo',
-        'years': [2020, 2021],
+        'years': sorted(int(year) for year in yahoo_data),
         'champions': [],
         'manager_stats': {}
     }
@@ -167,7 +157,17 @@ def transform_yahoo_data():
 def main():
     print("Transforming Yahoo data for dashboard...")
 
-    dashboard_data = transform_yahoo_data()
+    # Load Yahoo data
+    yahoo_data_file = Path(__file__).parent / 'output' / 'yahoo' / 'yahoo_all_years.json'
+    with open(yahoo_data_file, 'r') as f:
+        yahoo_data = json.load(f)
+
+    # Load team name mapping
+    mapping_file = Path(__file__).parent / 'yahoo_team_mapping.json'
+    with open(mapping_file, 'r') as f:
+        team_mapping = json.load(f)
+
+    dashboard_data = transform_yahoo_data(yahoo_data, team_mapping)
 
     # Save to output
     output_file = Path(__file__).parent / 'output' / 'yahoo' / 'yahoo_dashboard_data.json'
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Per-manager waiver, FAAB, free agent and trade stats for every Sleeper season
+
+Computed from the transaction logs written by extract_sleeper_transactions.py.
+Only completed transactions count (failed waiver claims are tallied
+separately), which the browser used to include. For each manager and season:
+
+  - faab_spent / faab_remaining  winning waiver bids against the league budget
+  - waiver_claims                successful waiver transactions
+  - waiver_pickups               players added through those claims
+  - failed_claims                waiver claims that lost or were invalid
+  - free_agent_moves             players added as free agents
+  - trades                       players received in trades
+
+Each season also carries the RECENT_WAIVERS newest successful waiver claims
+and every completed trade (newest first), so the dashboard can list them
+without fetching the transactions itself.
+
+Stats for completed seasons are kept in output/cache/waiver_stats_state.json
+and never recomputed; only the current season is rebuilt from its log. Results
+are published to html5up-landed/assets/data/waiver_stats.json.
+"""
+import json
+from pathlib import Path
+
+from extract_sleeper_transactions import load_all_transactions
+from sleeper_api import get_roster_owners
+
+BASE_DIR = Path(__file__).parent
+STATE_FILE = BASE_DIR / 'output' / 'cache' / 'waiver_stats_state.json'
+ASSETS_DIR = BASE_DIR.parent / 'html5up-landed' / 'assets' / 'data'
+OUTPUT_FILE = ASSETS_DIR / 'waiver_stats.json'
+
+RECENT_WAIVERS = 15
+
+def load_state():
+    if STATE_FILE.exists():
+        with open(STATE_FILE, 'r') as f:
+            return json.load(f)
+    return {}
+
+def save_state(state):
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_FILE, 'w') as f:
+        json.dump(state, f, indent=2)
+
+def season_stats(season_data, roster_owners):
+    """Per-roster stats for one season's transactions"""
+    budget = season_data.get('waiver_budget', 100)
+    managers = {}
+
+    def manager(roster_id):
+        return managers.setdefault(roster_id, {
+            'roster_id': roster_id,
+            'owner': (roster_owners.get(roster_id) or f'roster_{roster_id}').lower(),
+            'faab_spent': 0,
+            'faab_remaining': budget,
+            'waiver_claims': 0,
+            'waiver_pickups': 0,
+            'failed_claims': 0,
+            'free_agent_moves': 0,
+            'trades': 0
+        })
+
+    for roster_id in roster_owners:
+        manager(roster_id)
+
+    for tx in season_data['transactions']:
+        roster_ids = tx.get('roster_ids') or []
+        if not roster_ids:
+            continue
+        adds = tx.get('adds') or {}
+
+        if tx.get('type') == 'waiver':
+            row = manager(roster_ids[0])
+            if tx.get('status') == 'failed':
+                row['failed_claims'] += 1
+            elif tx.get('status') == 'complete' and adds:
+                bid = (tx.get('settings') or {}).get('waiver_bid') or 0
+                row['waiver_claims'] += 1
+                row['waiver_pickups'] += len(adds)
+                row['faab_spent'] += bid
+                row['faab_remaining'] -= bid
+        elif tx.get('status') != 'complete':
+            continue
+        elif tx.get('type') == 'free_agent':
+            manager(roster_ids[0])['free_agent_moves'] += len(adds)
+        elif tx.get('type') == 'trade':
+            for roster_id in roster_ids:
+                manager(roster_id)['trades'] += sum(1 for rid in adds.values() if rid == roster_id)
+
+    return sorted(managers.values(), key=lambda row: row['roster_id'])
+
+def newest_first(transactions, tx_type):
+    completed = [tx for tx in transactions if tx.get('type') == tx_type and tx.get('status') == 'complete']
+    return sorted(completed, key=lambda tx: tx.get('created') or 0, reverse=True)
+
+def recent_waivers(season_data):
+    """The newest successful waiver claims, as the waiver table shows them"""
+    return [
+        {
+            'week': tx.get('leg'),
+            'roster_id': tx['roster_ids'][0],
+            'added': list(tx.get('adds') or {}),
+            'dropped': list(tx.get('drops') or {}),
+            'bid': (tx.get('settings') or {}).get('waiver_bid') or 0,
+            'created': tx.get('created')
+        }
+        for tx in newest_first(season_data['transactions'], 'waiver')
+        if tx.get('roster_ids') and tx.get('adds')
+    ][:RECENT_WAIVERS]
+
+def trade_list(season_data):
+    """Every completed trade: who received which players and picks"""
+    return [
+        {
+            'week': tx.get('leg'),
+            'roster_ids': tx.get('roster_ids') or [],
+            'adds': tx.get('adds') or {},
+            'drops': tx.get('drops') or {},
+            'draft_picks': [
+                {key: pick.get(key) for key in ('season', 'round', 'owner_id', 'previous_owner_id')}
+                for pick in tx.get('draft_picks') or []
+            ],
+            'created': tx.get('created')
+        }
+        for tx in newest_first(season_data['transactions'], 'trade')
+    ]
+
+def main():
+    print("Calculating waiver stats...")
+
+    state = load_state()
+    for season, season_data in load_all_transactions().items():
+        cached = state.get(str(season))
+        # Seasons cached before the waiver and trade lists were added are rebuilt once
+        if cached and cached['status'] == 'complete' and 'trade_list' in cached:
+            print(f"  {season}: complete, cached")
+            continue
+
+        managers = season_stats(season_data, get_roster_owners(season_data['league_id']))
+        state[str(season)] = {
+            'status': season_data['status'],
+            'league_id': season_data['league_id'],
+            'through_week': max(season_data['weeks'], default=0),
+            'waiver_budget': season_data.get('waiver_budget', 100),
+            'managers': managers,
+            'recent_waivers': recent_waivers(season_data),
+            'trade_list': trade_list(season_data)
+        }
+        print(f"  {season}: {len(season_data['transactions'])} transactions ({season_data['status']})")
+
+    save_state(state)
+
+    ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump({'seasons': state}, f, indent=2)
+
+    print(f"\n✓ Waiver stats saved to {OUTPUT_FILE}")
+
+if __name__ == "__main__":
+    main()
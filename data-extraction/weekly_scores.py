@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Normalized weekly games across platforms
+
+Every platform's weekly results are turned into the same game record:
+
+    {'season': 2023, 'week': 5, 'platform': 'sleeper', 'playoff': False,
+     'final': True, 'teams': ['mikeion', 'rpthorp'], 'points': [120.5, 99.1]}
+
+Sources are MFL weeklyResults (extract_mfl_weekly_results.py), Yahoo games
+already in this format (output/yahoo/matchups/yahoo_games_<year>.json) and
+Sleeper matchups (extract_sleeper_matchups.py). Owners are lowercase Sleeper
+usernames, the same keys the dashboard files use; `final` is False for a week
+that may still be in progress.
+score_cube() turns one season of games into team x week arrays for the
+ranking/rating engines.
+"""
+import json
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+from extract_sleeper_matchups import load_all_matchups
+
+BASE_DIR = Path(__file__).parent
+MFL_DIR = BASE_DIR / 'output' / 'mfl'
+YAHOO_GAMES_DIR = BASE_DIR / 'output' / 'yahoo' / 'matchups'
+
+# Load owner mapping
+with open(BASE_DIR / 'owner_mapping.json', 'r') as f:
+    mfl_to_sleeper = json.load(f)['mfl_to_sleeper']
+
+def mfl_owner(franchise_id):
+    """Map MFL franchise ID to lowercase Sleeper username"""
+    franchise_id = str(franchise_id).zfill(4)
+    username = mfl_to_sleeper.get(franchise_id, {}).get('sleeper_username')
+    return username.lower() if username else f'mfl_{franchise_id}'
+
+def mfl_games(year, weekly_results, last_regular_week):
+    """Games from one MFL season's weeklyResults extract"""
+    games = []
+    for week_data in weekly_results:
+        week = int(week_data['week'])
+        for matchup in week_data.get('matchups', []):
+            a, b = matchup['franchise']
+            games.append({
+                'season': year,
+                'week': week,
+                'platform': 'mfl',
+                'playoff': week > last_regular_week,
+                'final': True,
+                'teams': [mfl_owner(a['id']), mfl_owner(b['id'])],
+                'points': [round(float(a.get('score') or 0), 2), round(float(b.get('score') or 0), 2)]
+            })
+    return games
+
+def load_mfl_games():
+    """Every MFL season with a weekly results extract"""
+    games = []
+    for results_file in sorted(MFL_DIR.glob('mfl_[0-9][0-9][0-9][0-9]_weekly_results.json')):
+        year = int(results_file.stem.split('_')[1])
+        with open(results_file, 'r') as f:
+            weekly_results = json.load(f)
+
+        last_regular_week = 99
+        league_file = MFL_DIR / f'mfl_{year}.json'
+        if league_file.exists():
+            with open(league_file, 'r') as f:
+                league = ((json.load(f).get('league') or {}).get('league')) or {}
+            last_regular_week = int(league.get('lastRegularSeasonWeek') or 99)
+
+        games.extend(mfl_games(year, weekly_results, last_regular_week))
+    return games
+
+def load_yahoo_games():
+    """Yahoo seasons, stored already normalized"""
+    games = []
+    for games_file in sorted(YAHOO_GAMES_DIR.glob('yahoo_games_[0-9][0-9][0-9][0-9].json')):
+        with open(games_file, 'r') as f:
+            games.extend(json.load(f))
+    return games
+
+def sleeper_games(season_data):
+    """Pair up one Sleeper season's matchup payloads into games"""
+    owners = season_data.get('roster_owners', {})
+    playoff_week_start = season_data.get('playoff_week_start') or 99
+    complete = season_data.get('status') == 'complete'
+    current_week = season_data.get('current_week') or 99
+
+    games = []
+    for week, matchups in season_data['weeks'].items():
+        pairs = defaultdict(list)
+        for matchup in matchups:
+            # Teams with no game that week (e.g. knocked out of the playoffs)
+            if matchup.get('matchup_id') is None:
+                continue
+            pairs[matchup['matchup_id']].append(matchup)
+
+        for matchup_id, pair in sorted(pairs.items()):
+            if len(pair) != 2:
+                continue
+            games.append({
+                'season': season_data['season'],
+                'week': int(week),
+                'platform': 'sleeper',
+                'playoff': int(week) >= playoff_week_start,
+                'final': complete or int(week) < current_week,
+                'teams': [(owners.get(str(m['roster_id'])) or f"roster_{m['roster_id']}").lower() for m in pair],
+                'points': [round(m.get('points') or 0.0, 2) for m in pair]
+            })
+    return games
+
+def load_games():
+    """Every normalized game we have, in chronological order"""
+    games = load_mfl_games() + load_yahoo_games()
+    for season_data in load_all_matchups().values():
+        games.extend(sleeper_games(season_data))
+    games.sort(key=lambda g: (g['season'], g['week']))
+    return games
+
+def games_by_season(games):
+    """Group games as {season: {week: [games]}}"""
+    grouped = defaultdict(lambda: defaultdict(list))
+    for game in games:
+        grouped[game['season']][game['week']].append(game)
+    return {season: dict(sorted(weeks.items())) for season, weeks in sorted(grouped.items())}
+
+def score_cube(season_games):
+    """
+    Team x week score matrix for one season's {week: [games]}
+
+    Returns (owners, weeks, scores) where scores[i, j] is owners[i]'s score in
+    weeks[j] (NaN if they didn't play). In two-game weeks (MFL division years)
+    a team's score is the same in both games.
+    """
+    owners = sorted({owner for games in season_games.values() for g in games for owner in g['teams']})
+    weeks = sorted(season_games)
+    owner_index = {owner: i for i, owner in enumerate(owners)}
+
+    scores = np.full((len(owners), len(weeks)), np.nan)
+    for j, week in enumerate(weeks):
+        for game in season_games[week]:
+            for owner, points in zip(game['teams'], game['points']):
+                scores[owner_index[owner], j] = points
+
+    return owners, weeks, scores
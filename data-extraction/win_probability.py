@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Win probability for every Sleeper matchup, live and for every finished week
+
+Each team's final score is modelled as the points already scored plus a
+normal draw for every starter still to play. A starter's projection is their
+average this season before the week, shrunk towards the average for their
+roster slot (QB, RB, FLEX, ...) over all earlier weeks, with a variance
+estimated the same way. One vectorized Monte Carlo run (N_SIMS draws of every
+remaining starter in the week at once) gives every matchup's win probability
+in a few milliseconds. Whether a starter still has points to come is read from
+their NFL team's game in Sleeper's schedule, not from their score: a starter
+whose game is final (or who is on bye, or has no team) is done even on zero
+points; one whose game is under way draws only the share of their projection
+they haven't scored yet (there is no game clock to go by).
+
+live_scores.py calls record_live() after every poll that changes a score,
+which appends a point to live/win_probability_<season>_w<week>.json. Running
+this script finishes every final week: it adds the final result to the live
+series (or, for weeks that were never polled, writes a pre-game and final
+point) and saves html5up-landed/assets/data/win_probability/
+sleeper_<season>_w<week>.json. Finished weeks are never recomputed.
+
+Series are stored per matchup as the win probability of rosters[0] in tenths
+of a percent, delta encoded, with delta encoded poll times (t is null for
+weeks without live polls):
+
+    {"matchup_id": 1, "rosters": [3, 8], "t": [1760894400, 30, 60], "p": [512, 23, -140]}
+"""
+import json
+import time
+
+import numpy as np
+
+from extract_sleeper_matchups import load_all_matchups
+from publish_bundle import ASSETS_DIR, LIVE_DIR
+from publish_weekly import final_weeks
+from sleeper_api import fetch_json, get_nfl_game_status, get_player_index
+
+WP_DIR = ASSETS_DIR / 'win_probability'
+N_SIMS = 10000
+
+# Games of a player's own history worth as much as the slot average
+PRIOR_GAMES = 3
+# Slot mean/variance when there is too little history to estimate one
+DEFAULT_PRIOR = (8.0, 49.0)
+MIN_SLOT_SAMPLES = 20
+
+NON_STARTING_SLOTS = {'BN', 'IR', 'TAXI'}
+
+def starting_slots(roster_positions):
+    """Slot of each entry in a matchup row's starters list"""
+    return [slot for slot in roster_positions if slot not in NON_STARTING_SLOTS]
+
+def delta_encode(values):
+    return [values[0]] + [b - a for a, b in zip(values, values[1:])] if values else []
+
+def delta_decode(deltas):
+    values = []
+    for delta in deltas:
+        values.append(delta + (values[-1] if values else 0))
+    return values
+
+def build_model(all_seasons, season, week, roster_positions=None):
+    """
+    Per-player scoring history and per-slot priors from everything before a week
+
+    A season that hasn't been extracted yet has no player history, so its
+    projections are the slot priors alone; pass its roster_positions (else
+    the latest earlier season's are used).
+    """
+    season_data = all_seasons.get(season)
+    if season_data:
+        roster_positions = season_data['roster_positions']
+    elif not roster_positions:
+        earlier = [data for data in all_seasons.values() if data['season'] < season]
+        roster_positions = max(earlier, key=lambda data: data['season'])['roster_positions'] if earlier else []
+    players = {}
+    slot_points = {}
+
+    for data in all_seasons.values():
+        if data['season'] > season:
+            continue
+        slots = starting_slots(data['roster_positions'])
+        for week_key, matchups in data['weeks'].items():
+            if data['season'] == season and int(week_key) >= week:
+                continue
+            for m in matchups:
+                for slot, player_id, points in zip(slots, m.get('starters') or [], m.get('starters_points') or []):
+                    if player_id != '0':
+                        slot_points.setdefault(slot, []).append(points)
+                if data['season'] == season:
+                    for player_id, points in (m.get('players_points') or {}).items():
+                        players.setdefault(player_id, []).append(points)
+
+    priors = {}
+    for slot, points in slot_points.items():
+        if len(points) >= MIN_SLOT_SAMPLES:
+            priors[slot] = (float(np.mean(points)), float(np.var(points)))
+
+    return {
+        'slots': starting_slots(roster_positions),
+        'players': {pid: (len(p), sum(p), sum(x * x for x in p)) for pid, p in players.items()},
+        'priors': priors
+    }
+
+def projection(model, player_id, slot):
+    """Mean and variance of a starter's points, shrunk towards their slot average"""
+    prior_mean, prior_var = model['priors'].get(slot, DEFAULT_PRIOR)
+    n, total, total_sq = model['players'].get(player_id, (0, 0.0, 0.0))
+    mean = (total + PRIOR_GAMES * prior_mean) / (n + PRIOR_GAMES)
+    var = (total_sq - 2 * mean * total + n * mean * mean + PRIOR_GAMES * prior_var) / (n + PRIOR_GAMES)
+    return mean, max(var, 1.0)
+
+def matchup_pairs(rows):
+    """{matchup_id: [roster_a, roster_b]} (lower roster ID first) for two-team matchups"""
+    pairs = {}
+    for row in rows:
+        if row.get('matchup_id') is not None:
+            pairs.setdefault(row['matchup_id'], []).append(row['roster_id'])
+    return {mid: sorted(ids) for mid, ids in sorted(pairs.items()) if len(ids) == 2}
+
+def player_teams():
+    """{player_id: NFL team} (team defenses use their team code as ID)"""
+    return {player_id: row[2] for player_id, row in get_player_index().items() if row[2]}
+
+def points_to_come(model, player_id, slot, points, game_status, teams):
+    """(mean, variance) of a starter's remaining points, or None if their game is over"""
+    mean, var = projection(model, player_id, slot)
+    if game_status is None:
+        return mean, var
+    team = teams.get(player_id) or (player_id if player_id.isalpha() else None)
+    status = game_status.get(team)
+    if status is None or status == 'complete':
+        return None
+    # Mid-game: assume the part of the projection not yet scored is still to come
+    left = min(max(1.0 - (points or 0.0) / mean, 0.0), 1.0) if mean > 0 else 1.0
+    return mean * left, var * left
+
+def win_probabilities(rows, model, rng, n_sims=N_SIMS, game_status=None, teams=None):
+    """
+    {matchup_id: (roster_a, roster_b, P(roster_a wins))} for a week's matchup rows
+
+    rows are Sleeper matchup rows (or live_scores rows); every matchup is
+    simulated in one batch of draws. game_status is {NFL team: status} from
+    get_nfl_game_status() and teams {player_id: NFL team}; without them the
+    week is taken as not started, so every starter is still to play.
+    """
+    teams = teams or {}
+    rosters = sorted(row['roster_id'] for row in rows)
+    index = {roster_id: i for i, roster_id in enumerate(rosters)}
+    scored = np.zeros(len(rosters))
+    means, sds, owners = [], [], []
+
+    for row in rows:
+        i = index[row['roster_id']]
+        scored[i] = row.get('points') or 0.0
+        for slot, player_id, points in zip(model['slots'], row.get('starters') or [], row.get('starters_points') or []):
+            if player_id == '0':
+                continue
+            to_come = points_to_come(model, player_id, slot, points, game_status, teams)
+            if to_come:
+                means.append(to_come[0])
+                sds.append(to_come[1] ** 0.5)
+                owners.append(i)
+
+    totals = np.broadcast_to(scored, (n_sims, len(rosters)))
+    if means:
+        draws = rng.standard_normal((n_sims, len(means))) * np.array(sds) + np.array(means)
+        onehot = np.zeros((len(means), len(rosters)))
+        onehot[np.arange(len(means)), owners] = 1.0
+        totals = totals + draws @ onehot
+
+    pairs = matchup_pairs(rows)
+    if not pairs:
+        return {}
+
+    a = np.array([index[ids[0]] for ids in pairs.values()])
+    b = np.array([index[ids[1]] for ids in pairs.values()])
+    p = (totals[:, a] > totals[:, b]).mean(axis=0) + 0.5 * (totals[:, a] == totals[:, b]).mean(axis=0)
+    return {mid: (ids[0], ids[1], float(p[k])) for k, (mid, ids) in enumerate(pairs.items())}
+
+def final_probabilities(rows):
+    """1, 0 or 0.5 for every matchup of a finished week"""
+    points = {row['roster_id']: row.get('points') or 0.0 for row in rows}
+    result = {}
+    for mid, (a, b) in matchup_pairs(rows).items():
+        result[mid] = (a, b, 1.0 if points[a] > points[b] else 0.0 if points[a] < points[b] else 0.5)
+    return result
+
+def load_series(path):
+    """{matchup_id: {'rosters', 't', 'p'}} with plain (decoded) values"""
+    if not path.exists():
+        return {}
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return {
+        m['matchup_id']: {
+            'rosters': m['rosters'],
+            't': delta_decode(m['t']) if m['t'] is not None else None,
+            'p': delta_decode(m['p'])
+        }
+        for m in data['matchups']
+    }
+
+def add_point(series, probabilities, timestamp):
+    """Append each matchup's probability (in tenths of a percent) if it changed"""
+    for mid, (a, b, p) in probabilities.items():
+        entry = series.setdefault(mid, {'rosters': [a, b], 't': [] if timestamp is not None else None, 'p': []})
+        value = round(p * 1000)
+        if entry['p'] and entry['p'][-1] == value:
+            continue
+        entry['p'].append(value)
+        if entry['t'] is not None:
+            entry['t'].append(timestamp)
+
+def write_series(path, season, league_id, week, series, final):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'season': season,
+        'league_id': league_id,
+        'week': week,
+        'final': final,
+        'matchups': [
+            {
+                'matchup_id': mid,
+                'rosters': entry['rosters'],
+                't': delta_encode(entry['t']) if entry['t'] is not None else None,
+                'p': delta_encode(entry['p'])
+            }
+            for mid, entry in sorted(series.items())
+        ]
+    }
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+    tmp.replace(path)
+
+def live_file(season, week):
+    return LIVE_DIR / f'win_probability_{season}_w{week}.json'
+
+def week_file(season, week):
+    return WP_DIR / f'sleeper_{season}_w{week}.json'
+
+# The model (and the player -> NFL team map) only changes when the week does, so live polls reuse it
+_models = {}
+
+def record_live(season, league_id, week, rows, timestamp):
+    """Recompute a live week's win probabilities and append them to its series"""
+    key = (int(season), week)
+    if key not in _models:
+        _models.clear()
+        all_seasons = load_all_matchups()
+        roster_positions = None
+        if int(season) not in all_seasons:
+            print(f"  ⚠ {season} not extracted yet (run extract_sleeper_matchups.py); win probability uses slot averages only")
+            roster_positions = fetch_json(f"league/{league_id}").get('roster_positions')
+        _models[key] = (build_model(all_seasons, int(season), week, roster_positions), player_teams())
+
+    model, teams = _models[key]
+    probabilities = win_probabilities(list(rows), model, np.random.default_rng(list(key)),
+                                      game_status=get_nfl_game_status(season, week), teams=teams)
+    path = live_file(season, week)
+    series = load_series(path)
+    add_point(series, probabilities, timestamp)
+    write_series(path, int(season), league_id, week, series, final=False)
+    return probabilities
+
+def finish_week(all_seasons, season_data, week):
+    """Series for a finished week: the live polls (or a pre-game point) plus the result"""
+    season = season_data['season']
+    rows = season_data['weeks'][str(week)]
+    path = live_file(season, week)
+    series = load_series(path)
+
+    if not series:
+        pregame = [{**row, 'points': 0.0, 'starters_points': [0.0] * len(row.get('starters') or [])} for row in rows]
+        model = build_model(all_seasons, season, week)
+        add_point(series, win_probabilities(pregame, model, np.random.default_rng([season, week])), None)
+
+    last_poll = max((entry['t'][-1] for entry in series.values() if entry['t']), default=None)
+    add_point(series, final_probabilities(rows), last_poll)
+    write_series(week_file(season, week), season, season_data['league_id'], week, series, final=True)
+    if path.exists():
+        path.unlink()
+
+def main():
+    print("Calculating win probabilities...")
+
+    all_seasons = load_all_matchups()
+    for season, season_data in all_seasons.items():
+        weeks = [week for week in final_weeks(season_data) if not week_file(season, week).exists()]
+        started = time.time()
+        for week in weeks:
+            finish_week(all_seasons, season_data, week)
+        elapsed = (time.time() - started) * 1000 / max(len(weeks), 1)
+        print(f"  {season}: {len(weeks)} weeks added ({elapsed:.0f} ms per week)")
+
+    print(f"\n✓ Win probabilities saved to {WP_DIR}")
+
+if __name__ == "__main__":
+    main()
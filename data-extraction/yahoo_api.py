@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Shared Yahoo Fantasy API helpers
+
+The extract scripts used to build a new yahoofantasy Context per call and
+scan ctx.get_leagues() for the league they wanted. This module keeps one
+authenticated session for the whole process instead: it reuses the OAuth
+token `yahoofantasy login` saved in .yahoofantasy, refreshes it (and saves it
+back, so yahoofantasy sees the new one too) only once it has expired, and is
+safe to call from several threads.
+
+Requests are batched with sub-resources: fetch_league() gets a league's
+settings and standings (teams, managers and records) in one request with
+;out=settings,standings, and fetch_matchups() gets the scoreboards of several
+weeks at once with ;week=1,2,.... Responses are parsed as they stream in
+(stream() yields each matchup as soon as it has arrived and then frees it)
+rather than decoded whole.
+
+get_league() resolves a league key once and caches its settings in
+output/cache/yahoo_leagues.json; finished seasons are never fetched again.
+
+use_recordings(directory, 'record') saves every response body to a
+directory; use_recordings(directory, 'replay') answers requests from those
+files without a token or network, so the parsing can be checked against
+real responses:
+
+    python yahoo_api.py --record recordings/   # fetch and save
+    python yahoo_api.py --replay recordings/   # same output, offline
+"""
+import argparse
+import json
+import pickle
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import requests
+
+from sleeper_api import CACHE_DIR, load_cache, save_cache
+
+API_BASE = "https://fantasysports.yahooapis.com/fantasy/v2"
+TOKEN_URL = "https://api.login.yahoo.com/oauth2/get_token"
+
+# Written by `yahoofantasy login` (a pickled dict; 'auth' holds the OAuth token)
+AUTH_FILE = Path(__file__).parent / '.yahoofantasy'
+LEAGUES_CACHE_FILE = CACHE_DIR / 'yahoo_leagues.json'
+
+# Refresh a little early so a token can't expire mid-request
+EXPIRY_MARGIN = 60
+CHUNK_SIZE = 64 * 1024
+
+# Scoreboard weeks per request; keeps each response a manageable size
+WEEKS_PER_REQUEST = 6
+
+_session = requests.Session()
+_auth = {}
+_auth_lock = threading.Lock()
+_cache_lock = threading.Lock()
+
+# {'dir': Path, 'mode': 'record' | 'replay'} while recordings are in use
+_recordings = {}
+
+def load_auth():
+    with open(AUTH_FILE, 'rb') as f:
+        return pickle.load(f).get('auth') or {}
+
+def save_auth(auth):
+    with open(AUTH_FILE, 'rb') as f:
+        persisted = pickle.load(f)
+    persisted['auth'] = auth
+    persisted['auth__time'] = time.time()
+    with open(AUTH_FILE, 'wb') as f:
+        pickle.dump(persisted, f)
+
+def refresh_token(auth):
+    """Exchange the refresh token for a new access token"""
+    response = requests.post(TOKEN_URL, data={
+        'client_id': auth['client_id'],
+        'client_secret': auth['client_secret'],
+        'redirect_uri': 'oob',
+        'refresh_token': auth['refresh_token'],
+        'grant_type': 'refresh_token'
+    })
+    response.raise_for_status()
+    token = response.json()
+    return {
+        **auth,
+        'access_token': token['access_token'],
+        'refresh_token': token.get('refresh_token') or auth['refresh_token'],
+        'access_token_expires': time.time() + int(token.get('expires_in', 3600))
+    }
+
+def access_token(force_refresh=False):
+    """A valid access token, refreshed only when the saved one has expired"""
+    with _auth_lock:
+        if not _auth:
+            if not AUTH_FILE.exists():
+                raise RuntimeError(f"{AUTH_FILE.name} not found, run `yahoofantasy login` first")
+            _auth.update(load_auth())
+        if force_refresh or _auth.get('access_token_expires', 0) < time.time() + EXPIRY_MARGIN:
+            _auth.update(refresh_token(_auth))
+            save_auth(dict(_auth))
+        return _auth['access_token']
+
+def use_recordings(directory, mode):
+    """Save responses to ('record') or answer requests from ('replay') a directory"""
+    _recordings.clear()
+    if directory:
+        _recordings.update({'dir': Path(directory), 'mode': mode})
+
+def recording_file(resource):
+    return _recordings['dir'] / (re.sub(r'[^A-Za-z0-9.,=-]+', '_', resource) + '.xml')
+
+def response_chunks(resource):
+    """Body of an API resource (e.g. 'league/399.l.114631/settings'), in chunks as it arrives"""
+    if _recordings.get('mode') == 'replay':
+        with open(recording_file(resource), 'rb') as f:
+            yield from iter(lambda: f.read(CHUNK_SIZE), b'')
+        return
+
+    url = f"{API_BASE}/{resource}"
+    response = _session.get(url, headers={'Authorization': f'Bearer {access_token()}'}, stream=True)
+    if response.status_code == 401:
+        # Revoked or expired early: refresh once and retry
+        response.close()
+        response = _session.get(url, headers={'Authorization': f'Bearer {access_token(force_refresh=True)}'}, stream=True)
+    response.raise_for_status()
+
+    recording = None
+    if _recordings.get('mode') == 'record':
+        _recordings['dir'].mkdir(parents=True, exist_ok=True)
+        recording = open(recording_file(resource), 'wb')
+    try:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if recording:
+                recording.write(chunk)
+            yield chunk
+    finally:
+        response.close()
+        if recording:
+            recording.close()
+
+def strip_namespaces(root):
+    """Drop the {http://fantasysports.yahooapis.com/...} prefix from every tag"""
+    for el in root.iter():
+        el.tag = el.tag.rsplit('}', 1)[-1]
+    return root
+
+def fetch_xml(resource):
+    """A whole API response as an XML element"""
+    return strip_namespaces(ET.fromstring(b''.join(response_chunks(resource))))
+
+def stream(resource, tag):
+    """
+    Yield every <tag> element of a response as soon as it is complete
+
+    Each element is cleared once the caller moves on, so a response with
+    hundreds of matchups is never held in memory at once.
+    """
+    parser = ET.XMLPullParser(events=('end',))
+    for chunk in response_chunks(resource):
+        parser.feed(chunk)
+        for _, el in parser.read_events():
+            if el.tag.rsplit('}', 1)[-1] == tag:
+                yield strip_namespaces(el)
+                el.clear()
+    parser.close()
+
+def text(el, path, default=None):
+    found = el.find(path)
+    return found.text if found is not None and found.text is not None else default
+
+def league_settings(league):
+    """Settings of a <league> element"""
+    return {
+        'league_key': text(league, 'league_key'),
+        'season': int(text(league, 'season')),
+        'name': text(league, 'name'),
+        'num_teams': int(text(league, 'num_teams', 0)),
+        'start_week': int(text(league, 'start_week', 1)),
+        'end_week': int(text(league, 'end_week')),
+        'playoff_start_week': int(text(league, 'settings/playoff_start_week', 99)),
+        'is_finished': text(league, 'is_finished') == '1'
+    }
+
+def team_record(team):
+    """Name, manager and record of a standings <team> element"""
+    return {
+        'team_key': text(team, 'team_key'),
+        'team_id': text(team, 'team_id'),
+        'name': text(team, 'name'),
+        'manager_name': text(team, 'managers/manager/nickname'),
+        'wins': int(text(team, 'team_standings/outcome_totals/wins', 0)),
+        'losses': int(text(team, 'team_standings/outcome_totals/losses', 0)),
+        'ties': int(text(team, 'team_standings/outcome_totals/ties', 0)),
+        'points_for': float(text(team, 'team_standings/points_for', 0)),
+        'points_against': float(text(team, 'team_standings/points_against', 0)),
+        'rank': int(text(team, 'team_standings/rank')) if text(team, 'team_standings/rank') else None
+    }
+
+def cache_league(info):
+    with _cache_lock:
+        cache = load_cache(LEAGUES_CACHE_FILE)
+        cache[info['league_key']] = info
+        save_cache(LEAGUES_CACHE_FILE, cache)
+
+def fetch_league(league_key):
+    """(settings, standings) of a league in one request; standings are in rank order"""
+    info, standings = None, []
+    # Read to the end (there is one league) so recordings are complete
+    for league in stream(f"league/{league_key};out=settings,standings", 'league'):
+        info = league_settings(league)
+        standings = [team_record(team) for team in league.findall('standings/teams/team')]
+    if info is None:
+        raise ValueError(f"No <league> in Yahoo's response for {league_key}")
+    standings.sort(key=lambda team: team['rank'] if team['rank'] is not None else len(standings))
+    cache_league(info)
+    return info, standings
+
+def fetch_matchups(league_key, weeks):
+    """Yield the scoreboard <matchup> elements of several weeks, one request per WEEKS_PER_REQUEST weeks"""
+    weeks = list(weeks)
+    for i in range(0, len(weeks), WEEKS_PER_REQUEST):
+        chunk = ','.join(str(week) for week in weeks[i:i + WEEKS_PER_REQUEST])
+        yield from stream(f"league/{league_key}/scoreboard;week={chunk}", 'matchup')
+
+def get_league(league_key, refresh=False):
+    """
+    Settings of a league: {league_key, season, name, num_teams, start_week,
+    end_week, playoff_start_week, is_finished}
+
+    Cached in output/cache/yahoo_leagues.json; only leagues that aren't
+    finished are re-fetched.
+    """
+    with _cache_lock:
+        cached = load_cache(LEAGUES_CACHE_FILE).get(league_key)
+    if cached and cached['is_finished'] and not refresh:
+        return cached
+
+    info = league_settings(fetch_xml(f"league/{league_key}/settings").find('league'))
+    cache_league(info)
+    return info
+
+def yahoo_leagues():
+    """{season: league_key} for the Yahoo seasons in leagues.json"""
+    with open(Path(__file__).parent / 'leagues.json', 'r') as f:
+        config = json.load(f)
+    seasons = {}
+    for league in config['leagues']:
+        if league['platform'] == 'yahoo':
+            seasons.update({int(season): key for season, key in league['seasons'].items()})
+    return dict(sorted(seasons.items()))
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch every Yahoo season in leagues.json with batched requests")
+    recordings = parser.add_mutually_exclusive_group()
+    recordings.add_argument('--record', metavar='DIR', help="save every response to DIR")
+    recordings.add_argument('--replay', metavar='DIR', help="answer requests from responses saved with --record")
+    args = parser.parse_args()
+    use_recordings(args.record or args.replay, 'record' if args.record else 'replay')
+
+    for season, league_key in yahoo_leagues().items():
+        started = time.time()
+        info, standings = fetch_league(league_key)
+        weeks = range(info['start_week'], info['end_week'] + 1)
+        matchups = sum(1 for _ in fetch_matchups(league_key, weeks))
+        requests_made = 1 + -(-len(weeks) // WEEKS_PER_REQUEST)
+        print(f"  {season}: {info['name']}, {len(standings)} teams, {matchups} matchups "
+              f"in {requests_made} requests ({time.time() - started:.1f}s)")
+
+    print("\n✓ Done")
+
+if __name__ == "__main__":
+    main()
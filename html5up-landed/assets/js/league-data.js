@@ -18,7 +18,7 @@ let leagueData = {};
 let rostersData = [];
 let usersData = [];
 let currentWeek = 9;
-let playersData = {}; // Cache for player names
+let playersData = {}; // Player names: {player_id: [name, position, team]}
 let availableSeasons = []; // Store all available seasons and their league IDs
 
 // Username to real name mapping
@@ -149,7 +149,7 @@ async function loadDashboardData() {
             fetchData(getUsersUrl(CURRENT_LEAGUE_ID)),
             playersData && Object.keys(playersData).length > 0
                 ? Promise.resolve(playersData) // Use cached players
-                : fetchData(`${API_BASE}/players/nfl`)
+                : fetchAsset('players/league.json').then(index => index.players).catch(() => ({}))
         ]);
 
         // Combine roster and user data
@@ -195,7 +195,8 @@ async function loadDashboardData() {
 
         // Render all sections
         renderStandings(teamsData);
-        renderPowerRankings(teamsData);
+        await setupStandingsWeekSelect(teamsData);
+        await renderPowerRankings(teamsData);
         await renderWeeklyStats(teamsData, lastCompletedWeek);
         await renderManagerAnalysis(teamsData, lastCompletedWeek);
         await renderWaiverAnalysis(teamsData, lastCompletedWeek);
@@ -215,6 +216,101 @@ async function fetchData(url) {
     return await response.json();
 }
 
+// assets/data/manifest.json maps each data file to its content-hashed, minified
+// copy (data-extraction/publish_assets.py). Loaded once per page; without it the
+// original files are used.
+let manifestPromise = null;
+
+function loadManifest() {
+    if (!manifestPromise) {
+        manifestPromise = fetchData('/assets/data/manifest.json').catch(error => {
+            console.log('No asset manifest, using original files:', error);
+            return {};
+        });
+    }
+    return manifestPromise;
+}
+
+// URL for a file under assets/data, e.g. dataUrl('power_rankings.json')
+async function dataUrl(name) {
+    const manifest = await loadManifest();
+    const path = (manifest.files && manifest.files[name]) || name;
+    return `/assets/data/${path}`;
+}
+
+// Undo the optional columnar encoding (data-extraction/columnar.py); plain JSON passes through
+function decodeColumnar(payload) {
+    if (!payload || payload.$columnar !== 1) return payload;
+
+    const decodeValue = (value) => {
+        if (Array.isArray(value)) return value.map(decodeValue);
+        if (!value || typeof value !== 'object') return value;
+        if (!value.$c) {
+            const out = {};
+            Object.keys(value).forEach(key => { out[key] = decodeValue(value[key]); });
+            return out;
+        }
+
+        // Column arrays, with dictionary-encoded strings expanded
+        const columns = value.$v.map(col => (col && col.$d) ? col.$i.map(i => col.$d[i]) : col);
+        const records = columns[0].map((_, row) => {
+            const record = {};
+            value.$c.forEach((name, c) => { record[name] = decodeValue(columns[c][row]); });
+            return record;
+        });
+        if (!value.$k) return records;
+
+        const keyed = {};
+        value.$k.forEach((key, row) => { keyed[key] = records[row]; });
+        return keyed;
+    };
+
+    return decodeValue(payload.data);
+}
+
+// Fetch and decode a file under assets/data
+async function fetchAsset(name) {
+    return decodeColumnar(await fetchData(await dataUrl(name)));
+}
+
+// Historical dashboard data (MFL/Yahoo stats, playoff results, draft positions).
+// Published as one content-hashed bundle named by assets/data/manifest.json
+// (data-extraction/publish_bundle.py); falls back to the individual files.
+const BUNDLE_SOURCES = {
+    mfl: 'mfl_dashboard_data.json',
+    yahoo: 'yahoo_dashboard_data.json',
+    mfl_playoffs: 'mfl_playoff_results.json',
+    sleeper_playoffs: 'sleeper_playoff_results.json',
+    sleeper_drafts: 'sleeper_draft_positions.json'
+};
+let dashboardBundlePromise = null;
+
+function loadDashboardBundle() {
+    if (!dashboardBundlePromise) {
+        dashboardBundlePromise = (async () => {
+            const manifest = await loadManifest();
+            try {
+                if (manifest.dashboard) {
+                    return decodeColumnar(await fetchData(`/assets/data/${manifest.dashboard}`));
+                }
+            } catch (error) {
+                console.log('No dashboard bundle, loading individual files:', error);
+            }
+
+            const bundle = {};
+            await Promise.all(Object.entries(BUNDLE_SOURCES).map(async ([key, file]) => {
+                try {
+                    bundle[key] = await fetchAsset(file);
+                } catch (error) {
+                    bundle[key] = null;
+                }
+            }));
+            return bundle;
+        })();
+    }
+    return dashboardBundlePromise;
+}
+
 // Combine roster and user data into team objects
 function combineTeamData(rosters, users) {
     return rosters.map(roster => {
@@ -261,8 +357,166 @@ function renderStandings(teams) {
     }).join('');
 }
 
+// Standings after every regular-season week of a season
+// (built by data-extraction/standings.py); null if unavailable
+async function loadStandingsSnapshots(season) {
+    try {
+        const data = await fetchAsset('standings.json');
+        return data.seasons[season] || null;
+    } catch (error) {
+        return null;
+    }
+}
+
+// Teams in a snapshot's order (win %, then the standings.py tiebreakers) when
+// its records match the teams' current ones; null if the snapshot is behind
+function orderLikeSnapshot(teams, rows) {
+    const rowsByOwner = new Map(rows.map(row => [row.owner, row]));
+    const matches = teams.every(team => {
+        const row = rowsByOwner.get(team.username.toLowerCase());
+        return row && row.wins === team.wins && row.losses === team.losses && row.ties === team.ties;
+    });
+    if (!matches) return null;
+    return [...teams].sort((a, b) =>
+        rowsByOwner.get(a.username.toLowerCase()).rank - rowsByOwner.get(b.username.toLowerCase()).rank
+    );
+}
+
+// Let the standings table show the standings as of any past week
+async function setupStandingsWeekSelect(teams) {
+    const select = document.getElementById('standings-week');
+    if (!select) return;
+
+    const snapshots = await loadStandingsSnapshots(leagueData.season);
+    select.style.display = snapshots ? '' : 'none';
+    if (!snapshots) return;
+
+    // "Current" uses the same ordering as the latest snapshot whenever it is up to date
+    const latestWeek = snapshots.weeks[snapshots.weeks.length - 1];
+    const current = (latestWeek !== undefined && orderLikeSnapshot(teams, snapshots.standings[latestWeek])) || teams;
+    renderStandings(current);
+
+    select.innerHTML = '<option value="">Current</option>' +
+        snapshots.weeks.map(week => `<option value="${week}">After week ${week}</option>`).join('');
+    select.onchange = () => {
+        if (!select.value) {
+            renderStandings(current);
+            return;
+        }
+        // Snapshot owners are lowercase usernames
+        const teamsByOwner = new Map(teams.map(team => [team.username.toLowerCase(), team]));
+        renderStandings(snapshots.standings[select.value].map(row => {
+            const team = teamsByOwner.get(row.owner);
+            return {
+                teamName: team?.teamName || row.owner,
+                username: team?.username || row.owner,
+                wins: row.wins,
+                losses: row.losses,
+                ties: row.ties,
+                pointsFor: row.points_for,
+                pointsAgainst: row.points_against
+            };
+        }));
+    };
+}
+
+// Load the precomputed week-by-week power rankings for a season
+// (built by data-extraction/power_rankings.py); null if unavailable
+async function loadPrecomputedPowerRankings(season) {
+    try {
+        const data = await fetchAsset('power_rankings.json');
+        return data.seasons[season] || null;
+    } catch (error) {
+        return null;
+    }
+}
+
+// Published weekly score matrices and transactions for the selected league
+// (data-extraction/publish_weekly.py): a base file plus a delta for the newest week
+const weeklyAssetPromises = {};
+
+function loadPublishedWeekly() {
+    const leagueId = CURRENT_LEAGUE_ID;
+    if (!weeklyAssetPromises[leagueId]) {
+        weeklyAssetPromises[leagueId] = (async () => {
+            const season = leagueData.season;
+            const [base, delta] = await Promise.all([
+                fetchAsset(`weekly/sleeper_${season}.json`).catch(() => null),
+                fetchAsset(`weekly/sleeper_${season}_delta.json`).catch(() => null)
+            ]);
+
+            const weeks = {}; // week -> matchups in Sleeper's shape (roster_id, points, matchup_id)
+            const transactions = [];
+            [base, delta].forEach(asset => {
+                if (!asset || asset.league_id !== leagueId) return;
+                asset.weeks.forEach((week, j) => {
+                    weeks[week] = asset.rosters
+                        .map((rosterId, i) => ({
+                            roster_id: rosterId,
+                            points: asset.points[i][j],
+                            matchup_id: asset.matchup_ids[i][j]
+                        }))
+                        .filter(m => m.points !== null);
+                });
+                transactions.push(...asset.transactions);
+            });
+            return { weeks, transactions };
+        })();
+    }
+    return weeklyAssetPromises[leagueId];
+}
+
+// Matchups for weeks 1..lastCompletedWeek; only weeks not yet published hit the API
+async function loadWeeklyMatchups(lastCompletedWeek) {
+    const published = await loadPublishedWeekly();
+    const weeks = Array.from({length: lastCompletedWeek}, (_, i) => i + 1);
+    return Promise.all(weeks.map(week =>
+        published.weeks[week] ? published.weeks[week] : fetchData(getMatchupsUrl(CURRENT_LEAGUE_ID, week))
+    ));
+}
+
+// Transactions for weeks 1..lastCompletedWeek; only weeks not yet published hit the API
+async function loadWeeklyTransactions(lastCompletedWeek) {
+    const published = await loadPublishedWeekly();
+    const liveWeeks = Array.from({length: lastCompletedWeek}, (_, i) => i + 1)
+        .filter(week => !published.weeks[week]);
+    const live = await Promise.all(
+        liveWeeks.map(week => fetchData(getTransactionsUrl(CURRENT_LEAGUE_ID, week)).catch(() => []))
+    );
+    return published.transactions.concat(live.flat());
+}
+
+// Precomputed waiver/FAAB stats for the selected league (data-extraction/waiver_stats.py); null if unavailable
+async function loadWaiverStats() {
+    try {
+        const data = await fetchAsset('waiver_stats.json');
+        const season = data.seasons[leagueData.season];
+        return season && season.league_id === CURRENT_LEAGUE_ID ? season : null;
+    } catch (error) {
+        return null;
+    }
+}
+
 // Calculate power rankings
-function calculatePowerRankings(teams) {
+function calculatePowerRankings(teams, seasonRankings = null) {
+    // Prefer the precomputed rankings for the latest week when every team is in them
+    if (seasonRankings && seasonRankings.weeks.length > 0) {
+        const latestWeek = seasonRankings.weeks[seasonRankings.weeks.length - 1];
+        const rowsByOwner = {};
+        (seasonRankings.rankings[latestWeek] || []).forEach(row => {
+            rowsByOwner[row.owner] = row;
+        });
+
+        if (teams.every(team => rowsByOwner[(team.username || '').toLowerCase()])) {
+            const ranked = teams.map(team => ({
+                ...team,
+                powerScore: rowsByOwner[team.username.toLowerCase()].power.toFixed(2)
+            })).sort((a, b) => b.powerScore - a.powerScore);
+            ranked.precomputed = true;
+            return ranked;
+        }
+    }
+
     return teams.map(team => {
         const winPct = team.wins / (team.wins + team.losses + team.ties);
         const avgPF = team.pointsFor / (team.wins + team.losses + team.ties);
@@ -289,11 +543,12 @@ function calculatePowerRankings(teams) {
 let powerRankingsChart = null;
 
 // Render power rankings
-function renderPowerRankings(teams) {
+async function renderPowerRankings(teams) {
     const canvas = document.getElementById('power-rankings-chart');
     if (!canvas) return; // Skip if chart doesn't exist on this page
 
-    const rankedTeams = calculatePowerRankings(teams);
+    const seasonRankings = await loadPrecomputedPowerRankings(leagueData.season);
+    const rankedTeams = calculatePowerRankings(teams, seasonRankings);
 
     // Create gradient colors based on rank
     const colors = rankedTeams.map((_, index) => {
@@ -333,7 +588,9 @@ function renderPowerRankings(teams) {
                 },
                 title: {
                     display: true,
-                    text: 'Formula: 40% Win Rate + 35% Avg Points + 25% Points Against',
+                    text: rankedTeams.precomputed
+                        ? 'Formula: 30% Win Rate + 35% All-Play Record + 35% Recent Scoring'
+                        : 'Formula: 40% Win Rate + 35% Avg Points + 25% Points Against',
                     font: {
                         size: 11
                     }
@@ -365,11 +622,9 @@ let weeklyChart = null;
 
 // Render weekly scoring trends with heatmap and line chart
 async function renderWeeklyStats(teams, lastCompletedWeek) {
-    // Fetch matchups for all completed weeks
+    // Matchups for all completed weeks (published weeks come from one cached asset)
     const weeks = Array.from({length: lastCompletedWeek}, (_, i) => i + 1);
-    const allMatchups = await Promise.all(
-        weeks.map(week => fetchData(getMatchupsUrl(CURRENT_LEAGUE_ID, week)))
-    );
+    const allMatchups = await loadWeeklyMatchups(lastCompletedWeek);
 
     // Organize scores by team and week
     const teamScores = {};
@@ -557,11 +812,8 @@ function renderHeatmap(teamScores, weeks) {
 
 // Render manager analysis with weekly data
 async function renderManagerAnalysis(teams, lastCompletedWeek) {
-    // Fetch all weekly matchup data to calculate detailed stats
-    const weeks = Array.from({length: lastCompletedWeek}, (_, i) => i + 1);
-    const allMatchups = await Promise.all(
-        weeks.map(week => fetchData(getMatchupsUrl(CURRENT_LEAGUE_ID, week)))
-    );
+    // All weekly matchup data to calculate detailed stats
+    const allMatchups = await loadWeeklyMatchups(lastCompletedWeek);
 
     // Calculate weekly stats for each team
     const teamStats = teams.map(team => {
@@ -665,9 +917,29 @@ async function renderManagerAnalysis(teams, lastCompletedWeek) {
     }).join('');
 }
 
+// Live scores for the week in progress, published by data-extraction/live_scores.py
+// so open pages don't each poll Sleeper; null if the poller isn't covering this week
+async function loadLiveMatchups(week) {
+    try {
+        const live = await fetchData('/assets/data/live/latest.json');
+        return live.league_id === CURRENT_LEAGUE_ID && live.week === week ? live.matchups : null;
+    } catch (error) {
+        return null;
+    }
+}
+
+// Re-render live matchups this often while the poller is publishing them
+const LIVE_REFRESH_MS = 60 * 1000;
+let liveRefreshTimer = null;
+
 // Render current week matchups
 async function renderCurrentMatchups(week) {
-    const matchups = await fetchData(getMatchupsUrl(CURRENT_LEAGUE_ID, week));
+    clearTimeout(liveRefreshTimer);
+    const live = await loadLiveMatchups(week);
+    const matchups = live || await fetchData(getMatchupsUrl(CURRENT_LEAGUE_ID, week));
+    if (live) {
+        liveRefreshTimer = setTimeout(() => renderCurrentMatchups(week), LIVE_REFRESH_MS);
+    }
 
     // Group matchups by matchup_id
     const matchupPairs = {};
@@ -715,108 +987,93 @@ async function renderCurrentMatchups(week) {
     container.innerHTML = html;
 }
 
+// Waiver stats in the waiver_stats.json shape, tallied from the raw transactions;
+// only used when the published stats are missing or behind lastCompletedWeek
+async function computeWaiverStats(lastCompletedWeek) {
+    const transactions = await loadWeeklyTransactions(lastCompletedWeek);
+    const managers = {};
+    rostersData.forEach(roster => {
+        // waiver_budget_used is the amount SPENT; $100 starting budget
+        const spent = roster.settings?.waiver_budget_used || 0;
+        managers[roster.roster_id] = {
+            roster_id: roster.roster_id,
+            faab_spent: spent,
+            faab_remaining: 100 - spent,
+            waiver_claims: 0,
+            waiver_pickups: 0,
+            free_agent_moves: 0,
+            trades: 0
+        };
+    });
+
+    // Published weeks and live weeks can overlap, so count each transaction once
+    const latest = new Map();
+    transactions.forEach(tx => latest.set(tx.transaction_id, tx));
+    const completed = [...latest.values()]
+        .filter(tx => tx.status === 'complete' && tx.roster_ids && tx.roster_ids.length > 0)
+        .sort((a, b) => (b.created || 0) - (a.created || 0));
+
+    const recentWaivers = [];
+    const trades = [];
+    completed.forEach(tx => {
+        const rosterId = tx.roster_ids[0];
+        const added = Object.keys(tx.adds || {});
+        if (tx.type === 'waiver' && added.length > 0 && managers[rosterId]) {
+            managers[rosterId].waiver_claims++;
+            managers[rosterId].waiver_pickups += added.length;
+            recentWaivers.push({
+                week: tx.leg,
+                roster_id: rosterId,
+                added,
+                dropped: Object.keys(tx.drops || {}),
+                bid: tx.settings?.waiver_bid || 0,
+                created: tx.created
+            });
+        } else if (tx.type === 'free_agent' && managers[rosterId]) {
+            managers[rosterId].free_agent_moves += added.length;
+        } else if (tx.type === 'trade') {
+            tx.roster_ids.forEach(rid => {
+                if (managers[rid]) {
+                    managers[rid].trades += Object.values(tx.adds || {}).filter(receiver => receiver === rid).length;
+                }
+            });
+            trades.push({ ...tx, week: tx.leg });
+        }
+    });
+
+    return {
+        managers: Object.values(managers),
+        recent_waivers: recentWaivers.slice(0, 15),
+        trade_list: trades
+    };
+}
+
 // Render waiver wire and transaction analysis
 async function renderWaiverAnalysis(teams, lastCompletedWeek) {
     try {
-        // Fetch ALL transactions by fetching each week
-        const weeks = Array.from({length: lastCompletedWeek}, (_, i) => i + 1);
-        const allTransactions = await Promise.all(
-            weeks.map(week => fetchData(getTransactionsUrl(CURRENT_LEAGUE_ID, week)).catch(() => []))
-        );
-        const transactions = allTransactions.flat();
-
-        console.log('Total raw transactions:', transactions.length);
-        console.log('Sample transaction:', transactions[0]);
+        // Precomputed stats (data-extraction/waiver_stats.py); the browser only tallies transactions when they're behind
+        let stats = await loadWaiverStats();
+        if (!stats || stats.through_week < lastCompletedWeek || !stats.trade_list) {
+            stats = await computeWaiverStats(lastCompletedWeek);
+        }
 
-        // Track stats per team
         const teamStats = {};
         teams.forEach(team => {
+            const row = stats.managers.find(r => r.roster_id === team.rosterId) || {};
             teamStats[team.rosterId] = {
                 teamName: team.teamName,
                 username: team.username,
                 rosterId: team.rosterId,
-                totalSpent: 0,
-                remainingFaab: rostersData.find(r => r.roster_id === team.rosterId)?.settings?.waiver_budget_used || 0,
-                waiverPickups: 0,      // Number of players added via waivers
-                waiverClaims: 0,       // Number of waiver transactions
-                freeAgentMoves: 0,
-                trades: 0
+                totalSpent: row.faab_spent || 0,
+                remainingFaab: row.faab_remaining ?? 100,
+                waiverClaims: row.waiver_claims || 0,
+                waiverPickups: row.waiver_pickups || 0,
+                freeAgentMoves: row.free_agent_moves || 0,
+                trades: row.trades || 0
             };
         });
-
-        console.log('Team stats mapping:', teamStats);
-
-        // Process transactions - deduplicate by transaction ID
-        const waiverTransactions = [];
-        const tradeTransactions = [];
-        const seenTransactions = new Set();
-
-        transactions.forEach(tx => {
-            // Skip duplicate transactions
-            if (seenTransactions.has(tx.transaction_id)) {
-                return;
-            }
-            seenTransactions.add(tx.transaction_id);
-
-            if (!tx.roster_ids || tx.roster_ids.length === 0) return;
-
-            const rosterId = tx.roster_ids[0];
-            if (!teamStats[rosterId]) {
-                console.log('Roster ID not found in teamStats:', rosterId, 'Transaction:', tx);
-                return;
-            }
-
-            if (tx.type === 'waiver') {
-                // Count both claims (transactions) and pickups (players added)
-                const addedPlayers = tx.adds ? Object.keys(tx.adds) : [];
-                const droppedPlayers = tx.drops ? Object.keys(tx.drops) : [];
-
-                if (addedPlayers.length > 0) {
-                    // Count the claim (1 per transaction)
-                    teamStats[rosterId].waiverClaims++;
-                    // Count the pickups (number of players added)
-                    teamStats[rosterId].waiverPickups += addedPlayers.length;
-
-                    waiverTransactions.push({
-                        week: tx.leg || 'N/A',
-                        rosterId: rosterId,
-                        added: addedPlayers,
-                        dropped: droppedPlayers,
-                        bid: tx.settings?.waiver_bid || 0,
-                        timestamp: tx.created
-                    });
-                }
-            } else if (tx.type === 'free_agent') {
-                // Count actual players added (not just number of transactions)
-                const addedPlayers = tx.adds ? Object.keys(tx.adds) : [];
-                if (addedPlayers.length > 0) {
-                    // Add the number of players added, not just 1
-                    teamStats[rosterId].freeAgentMoves += addedPlayers.length;
-                }
-            } else if (tx.type === 'trade') {
-                // For trades, count players received by each team
-                tx.roster_ids.forEach(rid => {
-                    if (teamStats[rid]) {
-                        // Count how many players this roster received in the trade
-                        const playersReceived = tx.adds ? Object.entries(tx.adds).filter(([playerId, receivingRosterId]) => receivingRosterId === rid).length : 0;
-                        teamStats[rid].trades += playersReceived;
-                    }
-                });
-                tradeTransactions.push(tx);
-            }
-        });
-
-        console.log('After processing - unique transactions:', seenTransactions.size);
-        console.log('Final team stats:', teamStats);
-
-        // Get actual remaining FAAB from roster settings
-        Object.values(teamStats).forEach(stats => {
-            const roster = rostersData.find(r => r.roster_id === stats.rosterId);
-            // waiver_budget_used is actually the amount SPENT
-            const budgetUsed = roster?.settings?.waiver_budget_used || 0;
-            stats.totalSpent = budgetUsed; // Use the actual spent amount from roster
-            stats.remainingFaab = 100 - budgetUsed; // $100 starting budget
-        });
+        const recentWaivers = stats.recent_waivers;
+        const tradeTransactions = stats.trade_list;
 
         // Render FAAB table
         const faabTbody = document.querySelector('#faab-table tbody');
@@ -848,10 +1105,13 @@ async function renderWaiverAnalysis(teams, lastCompletedWeek) {
             </tr>
         `).join('');
 
-        // Render recent waivers (last 15)
-        const recentWaivers = waiverTransactions
-            .sort((a, b) => b.timestamp - a.timestamp)
-            .slice(0, 15);
+        await ensurePlayers([
+            ...recentWaivers.flatMap(tx => [...tx.added, ...tx.dropped]),
+            ...tradeTransactions.slice(0, 10).flatMap(tx => [
+                ...Object.keys(tx.adds || {}),
+                ...Object.keys(tx.drops || {})
+            ])
+        ]);
 
         const waiversTbody = document.querySelector('#recent-waivers-table tbody');
         if (!waiversTbody) return; // Skip if table doesn't exist on this page
@@ -859,7 +1119,7 @@ async function renderWaiverAnalysis(teams, lastCompletedWeek) {
             waiversTbody.innerHTML = '<tr><td colspan="5">No waiver activity yet</td></tr>';
         } else {
             waiversTbody.innerHTML = recentWaivers.map(tx => {
-                const team = teamStats[tx.rosterId];
+                const team = teamStats[tx.roster_id];
 
                 // Get player names
                 const addedNames = tx.added.map(playerId => getPlayerName(playerId)).join(', ');
@@ -867,7 +1127,7 @@ async function renderWaiverAnalysis(teams, lastCompletedWeek) {
 
                 return `
                     <tr>
-                        <td>${tx.week}</td>
+                        <td>${tx.week || 'N/A'}</td>
                         <td><strong>${team?.teamName || 'Unknown'}</strong></td>
                         <td style="font-size: 0.9em;">${addedNames || '-'}</td>
                         <td style="font-size: 0.9em;">${droppedNames || '-'}</td>
@@ -893,9 +1153,6 @@ async function renderWaiverAnalysis(teams, lastCompletedWeek) {
                 // Build trade details for each team
                 let tradeDetails = '<div style="font-size: 0.9em;">';
 
-                // Debug: log trade structure
-                console.log('Trade structure:', trade);
-
                 trade.roster_ids.forEach(rosterId => {
                     const team = teamStats[rosterId];
                     if (!team) return;
@@ -952,7 +1209,7 @@ async function renderWaiverAnalysis(teams, lastCompletedWeek) {
 
                 tradesHtml += `
                     <tr>
-                        <td>${trade.leg || 'N/A'}</td>
+                        <td>${trade.week || 'N/A'}</td>
                         <td><strong>${teamNames}</strong></td>
                         <td>${tradeDetails}</td>
                     </tr>
@@ -968,15 +1225,27 @@ async function renderWaiverAnalysis(teams, lastCompletedWeek) {
     }
 }
 
+// Load the full player index (data-extraction/player_index.py) if any of
+// these players aren't in the league subset, e.g. a brand new pickup
+async function ensurePlayers(playerIds) {
+    if (playerIds.every(playerId => !playerId || playersData[playerId])) {
+        return;
+    }
+    try {
+        const index = await fetchAsset('players/index.json');
+        playersData = { ...index.players, ...playersData };
+    } catch (error) {
+        console.warn('Could not load player index:', error);
+    }
+}
+
 // Helper function to get player name from ID
 function getPlayerName(playerId) {
     if (!playerId || !playersData[playerId]) {
         return 'Unknown Player';
     }
-    const player = playersData[playerId];
-    const fullName = `${player.first_name || ''} ${player.last_name || ''}`.trim();
-    const position = player.position ? ` (${player.position})` : '';
-    return fullName + position || 'Unknown Player';
+    const [name, position] = playersData[playerId];
+    return name + (position ? ` (${position})` : '') || 'Unknown Player';
 }
 
 // Generate distinct colors for charts
@@ -1164,53 +1433,12 @@ async function renderAllTimeStats() {
     container.innerHTML = '<p style="text-align: center;">Loading all-time statistics...</p>';
 
     try {
-        // Load MFL historical data
-        let mflData = null;
-        try {
-            const mflResponse = await fetch('/assets/data/mfl_dashboard_data.json');
-            if (mflResponse.ok) {
-                mflData = await mflResponse.json();
-                console.log('MFL data loaded:', mflData);
-            }
-        } catch (mflError) {
-            console.log('No MFL data available:', mflError);
-        }
-
-        // Load Yahoo historical data
-        let yahooData = null;
-        try {
-            const yahooResponse = await fetch('/assets/data/yahoo_dashboard_data.json');
-            if (yahooResponse.ok) {
-                yahooData = await yahooResponse.json();
-                console.log('Yahoo data loaded:', yahooData);
-            }
-        } catch (yahooError) {
-            console.log('No Yahoo data available:', yahooError);
-        }
-
-        // Load MFL playoff results
-        let mflPlayoffs = null;
-        try {
-            const mflPlayoffsResponse = await fetch('/assets/data/mfl_playoff_results.json');
-            if (mflPlayoffsResponse.ok) {
-                mflPlayoffs = await mflPlayoffsResponse.json();
-                console.log('MFL playoff results loaded:', mflPlayoffs);
-            }
-        } catch (mflPlayoffsError) {
-            console.log('No MFL playoff results:', mflPlayoffsError);
-        }
-
-        // Load Sleeper playoff results
-        let sleeperPlayoffs = null;
-        try {
-            const playoffsResponse = await fetch('/assets/data/sleeper_playoff_results.json');
-            if (playoffsResponse.ok) {
-                sleeperPlayoffs = await playoffsResponse.json();
-                console.log('Sleeper playoff results loaded:', sleeperPlayoffs);
-            }
-        } catch (playoffsError) {
-            console.log('No Sleeper playoff results:', playoffsError);
-        }
+        // Load historical data (one cached bundle)
+        const bundle = await loadDashboardBundle();
+        const mflData = bundle.mfl;
+        const yahooData = bundle.yahoo;
+        const mflPlayoffs = bundle.mfl_playoffs;
+        const sleeperPlayoffs = bundle.sleeper_playoffs;
 
         // Get all available seasons
         const sleeperSeasons = await loadAvailableSeasons();
@@ -1929,6 +2157,9 @@ async function renderWeeklyRecap(selectedWeek = null) {
                     </div>
                 </div>
 
+                <!-- Win probability charts, filled in below when published -->
+                <div id="win-probability-section" style="margin-bottom: 40px;"></div>
+
                 <!-- Scoreboard -->
                 <div style="margin-bottom: 40px;">
                     <h3 style="text-align: center; margin-bottom: 20px;">Complete Scoreboard</h3>
@@ -1966,6 +2197,7 @@ async function renderWeeklyRecap(selectedWeek = null) {
         `;
 
         container.innerHTML = html;
+        await renderWinProbabilityCharts(nflState.season, recapWeek, getTeamName);
 
     } catch (error) {
         console.error('Error rendering weekly recap:', error);
@@ -1973,6 +2205,88 @@ async function renderWeeklyRecap(selectedWeek = null) {
     }
 }
 
+// Win probability series for a week (data-extraction/win_probability.py): the
+// published file once the week is final, the live one while it is in progress
+async function loadWinProbability(season, week) {
+    try {
+        return await fetchAsset(`win_probability/sleeper_${season}_w${week}.json`);
+    } catch (error) {
+        try {
+            return await fetchData(`/assets/data/live/win_probability_${season}_w${week}.json`);
+        } catch (liveError) {
+            return null;
+        }
+    }
+}
+
+// Series are delta encoded: the first value, then differences
+function deltaDecode(deltas) {
+    let total = 0;
+    return deltas.map(delta => (total += delta));
+}
+
+// One line chart per matchup of the first team's win probability
+async function renderWinProbabilityCharts(season, week, getTeamName) {
+    const section = document.getElementById('win-probability-section');
+    if (!section || typeof Chart === 'undefined') return;
+
+    const data = await loadWinProbability(season, week);
+    if (!data || data.league_id !== CURRENT_LEAGUE_ID || data.matchups.length === 0) return;
+
+    section.innerHTML = `
+        <h3 style="text-align: center; margin-bottom: 20px;">Win Probability</h3>
+        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); gap: 20px;">
+            ${data.matchups.map(m => `<div><canvas id="wp-chart-${m.matchup_id}"></canvas></div>`).join('')}
+        </div>
+    `;
+
+    data.matchups.forEach(m => {
+        const [team1, team2] = m.rosters.map(getTeamName);
+        const probabilities = deltaDecode(m.p).map(p => p / 10);
+        // Weeks that weren't polled live only have a pre-game and a final point
+        const labels = m.t
+            ? deltaDecode(m.t).map(t => new Date(t * 1000).toLocaleString([], { weekday: 'short', hour: 'numeric', minute: '2-digit' }))
+            : probabilities.map((_, i) => i === 0 ? 'Kickoff' : 'Final');
+
+        new Chart(document.getElementById(`wp-chart-${m.matchup_id}`), {
+            type: 'line',
+            data: {
+                labels: labels,
+                datasets: [{
+                    label: `${team1} win %`,
+                    data: probabilities,
+                    borderColor: '#764ba2',
+                    backgroundColor: 'rgba(118, 75, 162, 0.1)',
+                    fill: true,
+                    pointRadius: 0
+                }]
+            },
+            options: {
+                responsive: true,
+                plugins: {
+                    title: {
+                        display: true,
+                        text: `${team1} vs ${team2}`
+                    },
+                    legend: {
+                        display: false
+                    }
+                },
+                scales: {
+                    y: {
+                        min: 0,
+                        max: 100,
+                        title: {
+                            display: true,
+                            text: `${team1} win %`
+                        }
+                    }
+                }
+            }
+        });
+    });
+}
+
 // Initialize homepage with preview data
 async function initHomePage() {
     try {
@@ -2100,257 +2414,268 @@ document.addEventListener('DOMContentLoaded', () => {
 });
 
 // User Profile Page
-async function renderUserProfile(username) {
-    const container = document.getElementById('user-content');
-    const nameHeader = document.getElementById('user-name');
-    const subtitle = document.getElementById('user-subtitle');
-    
-    container.innerHTML = '<p style="text-align: center;">Loading user profile...</p>';
-
+// Per-owner profile shard (data-extraction/publish_profiles.py); null if unavailable
+async function loadProfileShard(normalizedUsername) {
     try {
-        // Normalize username to lowercase
-        const normalizedUsername = username.toLowerCase();
-
-        // Load historical data
-        let mflData = null;
-        let yahooData = null;
-
-        try {
-            const mflResponse = await fetch('/assets/data/mfl_dashboard_data.json');
-            if (mflResponse.ok) mflData = await mflResponse.json();
-        } catch (e) { console.log('No MFL data'); }
-
-        try {
-            const yahooResponse = await fetch('/assets/data/yahoo_dashboard_data.json');
-            if (yahooResponse.ok) yahooData = await yahooResponse.json();
-        } catch (e) { console.log('No Yahoo data'); }
-
-        // Load Sleeper playoff results
-        let sleeperPlayoffs = null;
-        try {
-            const playoffsResponse = await fetch('/assets/data/sleeper_playoff_results.json');
-            if (playoffsResponse.ok) sleeperPlayoffs = await playoffsResponse.json();
-        } catch (e) { console.log('No Sleeper playoff data'); }
-
-        // Load Sleeper draft positions
-        let sleeperDrafts = null;
-        try {
-            const draftsResponse = await fetch('/assets/data/sleeper_draft_positions.json');
-            if (draftsResponse.ok) sleeperDrafts = await draftsResponse.json();
-        } catch (e) { console.log('No Sleeper draft data'); }
+        const shard = await fetchAsset(`profiles/${normalizedUsername}.json`);
+        return { ...shard, displayName: getDisplayName({ username: normalizedUsername }) };
+    } catch (error) {
+        return null;
+    }
+}
 
-        // Get Sleeper data
-        const sleeperSeasons = await loadAvailableSeasons();
-        
-        // Find user data across all platforms
-        let userData = {
-            username: normalizedUsername,
-            displayName: getDisplayName({ username: normalizedUsername }),
-            seasons: [],
-            totalWins: 0,
-            totalLosses: 0,
-            totalTies: 0,
-            totalPointsFor: 0,
-            totalPointsAgainst: 0,
-            championships: 0,
-            runnerUps: 0,
-            sackos: 0,
-            playoffAppearances: 0
-        };
+// Build a profile from every platform's full data (fallback when there's no shard)
+async function aggregateUserProfile(normalizedUsername) {
+    // Load historical data (one cached bundle)
+    const bundle = await loadDashboardBundle();
+    const mflData = bundle.mfl;
+    const yahooData = bundle.yahoo;
+    const sleeperPlayoffs = bundle.sleeper_playoffs;
+    const sleeperDrafts = bundle.sleeper_drafts;
+
+    // Load Elo rating trajectories
+    let eloData = null;
+    try {
+        eloData = await fetchAsset('elo_ratings.json');
+    } catch (e) { console.log('No Elo data'); }
 
-        // Collect MFL data
-        if (mflData && mflData.manager_stats) {
-            const mflUser = mflData.manager_stats.find(m => m.username === normalizedUsername);
-            if (mflUser) {
-                userData.totalWins += mflUser.totals.wins;
-                userData.totalLosses += mflUser.totals.losses;
-                userData.totalTies += mflUser.totals.ties;
-                userData.totalPointsFor += mflUser.totals.points_for;
-                userData.totalPointsAgainst += mflUser.totals.points_against;
-                userData.championships += mflUser.totals.championships;
-
-                Object.entries(mflUser.years).forEach(([year, yearData]) => {
-                    userData.seasons.push({
-                        year: parseInt(year),
-                        platform: 'MFL',
-                        wins: yearData.wins,
-                        losses: yearData.losses,
-                        ties: yearData.ties,
-                        pointsFor: yearData.points_for,
-                        pointsAgainst: yearData.points_against,
-                        champion: yearData.champion,
-                        runnerUp: yearData.runner_up || false,
-                        finish: yearData.finish || null,
-                        totalTeams: yearData.total_teams || null,
-                        draftPick: yearData.draft_pick || null
-                    });
+    // Get Sleeper data
+    const sleeperSeasons = await loadAvailableSeasons();
+    
+    // Find user data across all platforms
+    let userData = {
+        username: normalizedUsername,
+        displayName: getDisplayName({ username: normalizedUsername }),
+        seasons: [],
+        totalWins: 0,
+        totalLosses: 0,
+        totalTies: 0,
+        totalPointsFor: 0,
+        totalPointsAgainst: 0,
+        championships: 0,
+        runnerUps: 0,
+        sackos: 0,
+        playoffAppearances: 0,
+        elo: eloData && eloData.history[normalizedUsername] ? {
+            history: eloData.history[normalizedUsername],
+            current: eloData.current.find(r => r.owner === normalizedUsername),
+            rank: eloData.current.findIndex(r => r.owner === normalizedUsername) + 1
+        } : null
+    };
+
+    // Collect MFL data
+    if (mflData && mflData.manager_stats) {
+        const mflUser = mflData.manager_stats.find(m => m.username === normalizedUsername);
+        if (mflUser) {
+            userData.totalWins += mflUser.totals.wins;
+            userData.totalLosses += mflUser.totals.losses;
+            userData.totalTies += mflUser.totals.ties;
+            userData.totalPointsFor += mflUser.totals.points_for;
+            userData.totalPointsAgainst += mflUser.totals.points_against;
+            userData.championships += mflUser.totals.championships;
+
+            Object.entries(mflUser.years).forEach(([year, yearData]) => {
+                userData.seasons.push({
+                    year: parseInt(year),
+                    platform: 'MFL',
+                    wins: yearData.wins,
+                    losses: yearData.losses,
+                    ties: yearData.ties,
+                    pointsFor: yearData.points_for,
+                    pointsAgainst: yearData.points_against,
+                    champion: yearData.champion,
+                    runnerUp: yearData.runner_up || false,
+                    finish: yearData.finish || null,
+                    totalTeams: yearData.total_teams || null,
+                    draftPick: yearData.draft_pick || null
                 });
-            }
+            });
         }
+    }
 
-        // Collect Yahoo data
-        if (yahooData && yahooData.manager_stats) {
-            const yahooUser = yahooData.manager_stats.find(m => m.username === normalizedUsername);
-            if (yahooUser) {
-                userData.totalWins += yahooUser.totals.wins;
-                userData.totalLosses += yahooUser.totals.losses;
-                userData.totalTies += yahooUser.totals.ties;
-                userData.totalPointsFor += yahooUser.totals.points_for;
-                userData.totalPointsAgainst += yahooUser.totals.points_against;
-                userData.championships += yahooUser.totals.championships;
-
-                Object.entries(yahooUser.years).forEach(([year, yearData]) => {
-                    userData.seasons.push({
-                        year: parseInt(year),
-                        platform: 'Yahoo',
-                        wins: yearData.wins,
-                        losses: yearData.losses,
-                        ties: yearData.ties,
-                        pointsFor: yearData.points_for,
-                        pointsAgainst: yearData.points_against,
-                        champion: yearData.champion,
-                        runnerUp: yearData.runner_up || false,
-                        finish: yearData.finish || null,
-                        totalTeams: yearData.total_teams || null
-                    });
+    // Collect Yahoo data
+    if (yahooData && yahooData.manager_stats) {
+        const yahooUser = yahooData.manager_stats.find(m => m.username === normalizedUsername);
+        if (yahooUser) {
+            userData.totalWins += yahooUser.totals.wins;
+            userData.totalLosses += yahooUser.totals.losses;
+            userData.totalTies += yahooUser.totals.ties;
+            userData.totalPointsFor += yahooUser.totals.points_for;
+            userData.totalPointsAgainst += yahooUser.totals.points_against;
+            userData.championships += yahooUser.totals.championships;
+
+            Object.entries(yahooUser.years).forEach(([year, yearData]) => {
+                userData.seasons.push({
+                    year: parseInt(year),
+                    platform: 'Yahoo',
+                    wins: yearData.wins,
+                    losses: yearData.losses,
+                    ties: yearData.ties,
+                    pointsFor: yearData.points_for,
+                    pointsAgainst: yearData.points_against,
+                    champion: yearData.champion,
+                    runnerUp: yearData.runner_up || false,
+                    finish: yearData.finish || null,
+                    totalTeams: yearData.total_teams || null
                 });
-            }
+            });
         }
+    }
 
-        // Collect Sleeper data
-        for (const season of sleeperSeasons) {
-            try {
-                const rosters = await fetchData(getRostersUrl(season.leagueId));
-                const users = await fetchData(getUsersUrl(season.leagueId));
+    // Collect Sleeper data
+    for (const season of sleeperSeasons) {
+        try {
+            const rosters = await fetchData(getRostersUrl(season.leagueId));
+            const users = await fetchData(getUsersUrl(season.leagueId));
 
-                // Fetch user profiles for usernames
-                const userProfiles = {};
-                for (const user of users) {
-                    try {
-                        const profile = await fetchData(`${API_BASE}/user/${user.user_id}`);
-                        if (profile && profile.username) {
-                            userProfiles[user.user_id] = profile.username.toLowerCase();
-                        }
-                    } catch (e) {}
-                }
+            // Fetch user profiles for usernames
+            const userProfiles = {};
+            for (const user of users) {
+                try {
+                    const profile = await fetchData(`${API_BASE}/user/${user.user_id}`);
+                    if (profile && profile.username) {
+                        userProfiles[user.user_id] = profile.username.toLowerCase();
+                    }
+                } catch (e) {}
+            }
 
-                // Calculate standings for this season
-                const standings = rosters
-                    .map(r => ({
-                        owner_id: r.owner_id,
-                        wins: r.settings?.wins || 0,
-                        losses: r.settings?.losses || 0,
-                        ties: r.settings?.ties || 0,
-                        fpts: r.settings?.fpts || 0
-                    }))
-                    .sort((a, b) => {
-                        if (b.wins !== a.wins) return b.wins - a.wins;
-                        return b.fpts - a.fpts;
-                    });
+            // Calculate standings for this season
+            const standings = rosters
+                .map(r => ({
+                    owner_id: r.owner_id,
+                    wins: r.settings?.wins || 0,
+                    losses: r.settings?.losses || 0,
+                    ties: r.settings?.ties || 0,
+                    fpts: r.settings?.fpts || 0
+                }))
+                .sort((a, b) => {
+                    if (b.wins !== a.wins) return b.wins - a.wins;
+                    return b.fpts - a.fpts;
+                });
 
-                const totalTeams = rosters.length;
-
-                // Find this user's roster
-                const userEntry = Object.entries(userProfiles).find(([userId, uname]) => uname === normalizedUsername);
-                if (userEntry) {
-                    const [userId, uname] = userEntry;
-                    const roster = rosters.find(r => r.owner_id === userId);
-
-                    if (roster) {
-                        const wins = roster.settings?.wins || 0;
-                        const losses = roster.settings?.losses || 0;
-                        const ties = roster.settings?.ties || 0;
-                        const pointsFor = roster.settings?.fpts || 0;
-                        const pointsAgainst = roster.settings?.fpts_against || 0;
-
-                        // Get team name
-                        const user = users.find(u => u.user_id === userId);
-                        const teamName = user?.metadata?.team_name || null;
-
-                        // Find placement
-                        const finish = standings.findIndex(s => s.owner_id === userId) + 1;
-
-                        // Check playoff results
-                        let isChampion = false;
-                        let isRunnerUp = false;
-                        let isThirdPlace = false;
-                        let isFourthPlace = false;
-                        let isFifthPlace = false;
-                        let isSixthPlace = false;
-                        let isSeventhPlace = false;
-                        let isEighthPlace = false;
-                        let isSacko = false;
-                        if (sleeperPlayoffs) {
-                            const yearPlayoffs = sleeperPlayoffs.find(p => p.year === season.season);
-                            if (yearPlayoffs) {
-                                isChampion = yearPlayoffs.champion === normalizedUsername;
-                                isRunnerUp = yearPlayoffs.runner_up === normalizedUsername;
-                                isThirdPlace = yearPlayoffs.third_place === normalizedUsername;
-                                isFourthPlace = yearPlayoffs.fourth_place === normalizedUsername;
-                                isFifthPlace = yearPlayoffs.fifth_place === normalizedUsername;
-                                isSixthPlace = yearPlayoffs.sixth_place === normalizedUsername;
-                                isSeventhPlace = yearPlayoffs.seventh_place === normalizedUsername;
-                                isEighthPlace = yearPlayoffs.eighth_place === normalizedUsername;
-                                isSacko = yearPlayoffs.sacko === normalizedUsername;
-                            }
+            const totalTeams = rosters.length;
+
+            // Find this user's roster
+            const userEntry = Object.entries(userProfiles).find(([userId, uname]) => uname === normalizedUsername);
+            if (userEntry) {
+                const [userId, uname] = userEntry;
+                const roster = rosters.find(r => r.owner_id === userId);
+
+                if (roster) {
+                    const wins = roster.settings?.wins || 0;
+                    const losses = roster.settings?.losses || 0;
+                    const ties = roster.settings?.ties || 0;
+                    const pointsFor = roster.settings?.fpts || 0;
+                    const pointsAgainst = roster.settings?.fpts_against || 0;
+
+                    // Get team name
+                    const user = users.find(u => u.user_id === userId);
+                    const teamName = user?.metadata?.team_name || null;
+
+                    // Find placement
+                    const finish = standings.findIndex(s => s.owner_id === userId) + 1;
+
+                    // Check playoff results
+                    let isChampion = false;
+                    let isRunnerUp = false;
+                    let isThirdPlace = false;
+                    let isFourthPlace = false;
+                    let isFifthPlace = false;
+                    let isSixthPlace = false;
+                    let isSeventhPlace = false;
+                    let isEighthPlace = false;
+                    let isSacko = false;
+                    if (sleeperPlayoffs) {
+                        const yearPlayoffs = sleeperPlayoffs.find(p => p.year === season.season);
+                        if (yearPlayoffs) {
+                            isChampion = yearPlayoffs.champion === normalizedUsername;
+                            isRunnerUp = yearPlayoffs.runner_up === normalizedUsername;
+                            isThirdPlace = yearPlayoffs.third_place === normalizedUsername;
+                            isFourthPlace = yearPlayoffs.fourth_place === normalizedUsername;
+                            isFifthPlace = yearPlayoffs.fifth_place === normalizedUsername;
+                            isSixthPlace = yearPlayoffs.sixth_place === normalizedUsername;
+                            isSeventhPlace = yearPlayoffs.seventh_place === normalizedUsername;
+                            isEighthPlace = yearPlayoffs.eighth_place === normalizedUsername;
+                            isSacko = yearPlayoffs.sacko === normalizedUsername;
                         }
+                    }
 
-                        // Get draft position
-                        let draftPick = null;
-                        if (sleeperDrafts && sleeperDrafts[season.season]) {
-                            const yearDrafts = sleeperDrafts[season.season];
-                            if (yearDrafts[normalizedUsername]) {
-                                draftPick = yearDrafts[normalizedUsername].pick;
-                            }
+                    // Get draft position
+                    let draftPick = null;
+                    if (sleeperDrafts && sleeperDrafts[season.season]) {
+                        const yearDrafts = sleeperDrafts[season.season];
+                        if (yearDrafts[normalizedUsername]) {
+                            draftPick = yearDrafts[normalizedUsername].pick;
                         }
+                    }
 
-                        userData.totalWins += wins;
-                        userData.totalLosses += losses;
-                        userData.totalTies += ties;
-                        userData.totalPointsFor += pointsFor;
-                        userData.totalPointsAgainst += pointsAgainst;
-
-                        if (isChampion) {
-                            userData.championships++;
-                        }
-                        if (isRunnerUp) {
-                            userData.runnerUps++;
-                        }
-                        if (isSacko) {
-                            userData.sackos++;
-                        }
+                    userData.totalWins += wins;
+                    userData.totalLosses += losses;
+                    userData.totalTies += ties;
+                    userData.totalPointsFor += pointsFor;
+                    userData.totalPointsAgainst += pointsAgainst;
 
-                        userData.seasons.push({
-                            year: season.season,
-                            platform: 'Sleeper',
-                            teamName,
-                            wins,
-                            losses,
-                            ties,
-                            pointsFor,
-                            pointsAgainst,
-                            champion: isChampion,
-                            runnerUp: isRunnerUp,
-                            thirdPlace: isThirdPlace,
-                            fourthPlace: isFourthPlace,
-                            fifthPlace: isFifthPlace,
-                            sixthPlace: isSixthPlace,
-                            seventhPlace: isSeventhPlace,
-                            eighthPlace: isEighthPlace,
-                            sacko: isSacko,
-                            finish,
-                            totalTeams,
-                            draftPick
-                        });
+                    if (isChampion) {
+                        userData.championships++;
+                    }
+                    if (isRunnerUp) {
+                        userData.runnerUps++;
                     }
+                    if (isSacko) {
+                        userData.sackos++;
+                    }
+
+                    userData.seasons.push({
+                        year: season.season,
+                        platform: 'Sleeper',
+                        teamName,
+                        wins,
+                        losses,
+                        ties,
+                        pointsFor,
+                        pointsAgainst,
+                        champion: isChampion,
+                        runnerUp: isRunnerUp,
+                        thirdPlace: isThirdPlace,
+                        fourthPlace: isFourthPlace,
+                        fifthPlace: isFifthPlace,
+                        sixthPlace: isSixthPlace,
+                        seventhPlace: isSeventhPlace,
+                        eighthPlace: isEighthPlace,
+                        sacko: isSacko,
+                        finish,
+                        totalTeams,
+                        draftPick
+                    });
                 }
-            } catch (error) {
-                console.error(`Error loading Sleeper data for ${season.season}:`, error);
             }
+        } catch (error) {
+            console.error(`Error loading Sleeper data for ${season.season}:`, error);
         }
+    }
+
+    // Sort seasons by year
+    userData.seasons.sort((a, b) => a.year - b.year);
 
-        // Sort seasons by year
-        userData.seasons.sort((a, b) => a.year - b.year);
+    return userData;
+}
+
+async function renderUserProfile(username) {
+    const container = document.getElementById('user-content');
+    const nameHeader = document.getElementById('user-name');
+    const subtitle = document.getElementById('user-subtitle');
+    
+    container.innerHTML = '<p style="text-align: center;">Loading user profile...</p>';
+
+    try {
+        // Normalize username to lowercase
+        const normalizedUsername = username.toLowerCase();
+
+        // Prefer the precomputed profile shard; aggregate in the browser if it's missing
+        let userData = await loadProfileShard(normalizedUsername);
+        if (!userData) {
+            userData = await aggregateUserProfile(normalizedUsername);
+        }
 
         // Check if user exists
         if (userData.seasons.length === 0) {
@@ -2421,6 +2746,15 @@ function renderUserProfileContent(userData) {
                 <canvas id="pointsChart" style="max-height: 400px;"></canvas>
             </div>
 
+            ${userData.elo ? `
+            <!-- Elo Rating Chart -->
+            <div style="margin-bottom: 40px; background: white; padding: 20px; border-radius: 8px;">
+                <h3 style="text-align: center; margin-bottom: 20px;">Elo Rating</h3>
+                <p style="text-align: center; color: #666; font-size: 0.9em; margin-bottom: 15px;">${userData.elo.current.rating.toFixed(0)} now (#${userData.elo.rank}) • peak ${userData.elo.current.peak.toFixed(0)} in ${userData.elo.current.peak_season} week ${userData.elo.current.peak_week}</p>
+                <canvas id="eloChart" style="max-height: 400px;"></canvas>
+            </div>
+            ` : ''}
+
             <!-- Year-by-Year Table -->
             <div style="margin-bottom: 40px;">
                 <h3 style="text-align: center; margin-bottom: 20px;">Season-by-Season Performance</h3>
@@ -2514,13 +2848,118 @@ function renderUserProfileContent(userData) {
                     </table>
                 </div>
             </div>
+    `;
+
+    // Head-to-head records (only in precomputed profiles)
+    if (userData.h2h && userData.h2h.length > 0) {
+        html += `
+            <div style="margin-bottom: 40px;">
+                <h3 style="text-align: center; margin-bottom: 20px;">Head-to-Head</h3>
+                <div class="table-wrapper">
+                    <table>
+                        <thead>
+                            <tr>
+                                <th>Opponent</th>
+                                <th>Record</th>
+                                <th>Win %</th>
+                                <th>Points For</th>
+                                <th>Points Against</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+        `;
+
+        userData.h2h.forEach(row => {
+            const games = row.wins + row.losses + row.ties;
+            const h2hWinPct = games > 0 ? ((row.wins + row.ties / 2) / games * 100).toFixed(1) : '0.0';
+            html += `
+                <tr>
+                    <td><a href="user.html?username=${encodeURIComponent(row.opponent)}">${getDisplayName({ username: row.opponent })}</a></td>
+                    <td>${row.wins}-${row.losses}${row.ties > 0 ? '-' + row.ties : ''}</td>
+                    <td>${h2hWinPct}%</td>
+                    <td>${row.pointsFor.toFixed(1)}</td>
+                    <td>${row.pointsAgainst.toFixed(1)}</td>
+                </tr>
+            `;
+        });
+
+        html += `
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        `;
+    }
+
+    html += `
         </div>
     `;
 
     container.innerHTML = html;
 
-    // Render chart
+    // Render charts
     renderPointsChart(userData);
+    renderEloChart(userData);
+}
+
+function renderEloChart(userData) {
+    const ctx = document.getElementById('eloChart');
+    if (!ctx || !userData.elo) return;
+
+    // History points are [season, week, rating after that week]
+    const history = userData.elo.history;
+
+    new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: history.map(([season, week]) => `${season} W${week}`),
+            datasets: [{
+                label: 'Elo Rating',
+                data: history.map(point => point[2]),
+                borderColor: '#764ba2',
+                backgroundColor: 'rgba(118, 75, 162, 0.1)',
+                tension: 0.2,
+                fill: false,
+                pointRadius: 0
+            }, {
+                label: 'League Average',
+                data: history.map(() => 1500),
+                borderColor: 'rgba(0, 0, 0, 0.3)',
+                borderDash: [5, 5],
+                borderWidth: 1,
+                pointRadius: 0,
+                fill: false
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: true,
+            plugins: {
+                legend: {
+                    display: false
+                }
+            },
+            scales: {
+                y: {
+                    title: {
+                        display: true,
+                        text: 'Rating'
+                    }
+                },
+                x: {
+                    ticks: {
+                        // One label per season
+                        callback: function(value, index) {
+                            const season = history[index][0];
+                            return index === 0 || history[index - 1][0] !== season ? season : null;
+                        },
+                        autoSkip: false,
+                        maxRotation: 0
+                    }
+                }
+            }
+        }
+    });
 }
 
 function renderPointsChart(userData) {
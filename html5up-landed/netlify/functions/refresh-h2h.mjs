@@ -2,13 +2,7 @@ import { getStore } from '@netlify/blobs';
 
 const API_BASE = 'https://api.sleeper.app/v1';
 const LEAGUE_ID = '1257482235834028032';
-
-// List of all season league IDs (add new seasons as they come)
-const SEASONS = [
-    { season: '2022', leagueId: '784850758166863872' },
-    { season: '2023', leagueId: '918746033135255552' },
-    { season: '2024', leagueId: LEAGUE_ID }
-];
+const HISTORY_KEY = 'league-history';
 
 async function fetchData(url) {
     try {
@@ -21,13 +15,49 @@ async function fetchData(url) {
     }
 }
 
-async function calculateH2HData() {
+// Walk previous_league_id back from the current league to find every season.
+// Finished leagues never change, so they are cached in the blob store and only
+// the in-progress league is fetched on each run (same cache shape as
+// data-extraction/sleeper_api.py).
+async function resolveLeagueHistory(store) {
+    const cache = (await store.get(HISTORY_KEY, { type: 'json' })) || {};
+    const seasons = [];
+    let changed = false;
+    let leagueId = LEAGUE_ID;
+
+    while (leagueId && leagueId !== '0') {
+        let entry = cache[leagueId];
+        if (!entry || entry.status !== 'complete') {
+            const league = await fetchData(`${API_BASE}/league/${leagueId}`);
+            if (!league) break;
+            entry = {
+                season: parseInt(league.season),
+                name: league.name,
+                status: league.status,
+                previous_league_id: league.previous_league_id
+            };
+            cache[leagueId] = entry;
+            changed = true;
+        }
+
+        seasons.push({ season: String(entry.season), leagueId });
+        leagueId = entry.previous_league_id;
+    }
+
+    if (changed) {
+        await store.set(HISTORY_KEY, JSON.stringify(cache));
+    }
+
+    return seasons.reverse();
+}
+
+async function calculateH2HData(seasons) {
     console.log('Starting H2H calculation...');
 
     const h2hMatrix = {};
     const userNames = {};
 
-    for (const season of SEASONS) {
+    for (const season of seasons) {
         try {
             const leagueData = await fetchData(`${API_BASE}/league/${season.leagueId}`);
             const rosters = await fetchData(`${API_BASE}/league/${season.leagueId}/rosters`);
@@ -95,17 +125,29 @@ export const handler = async (event, context) => {
     try {
         console.log('Running H2H refresh at:', new Date().toISOString());
 
-        const h2hData = await calculateH2HData();
-
-        // Store in Netlify Blobs using context
+        // Netlify Blobs store (also caches the league history)
         const store = getStore({
             name: 'fantasy-stats',
             siteID: context.site?.id,
             token: context.token
         });
-        await store.set('h2h-data', JSON.stringify(h2hData));
 
-        console.log('H2H data calculated and stored successfully');
+        const seasons = await resolveLeagueHistory(store);
+        const h2hData = await calculateH2HData(seasons);
+
+        // Only write the blob when a record changed (data-extraction/blob_sync.py
+        // uploads the same payload from the published h2h.json)
+        const existing = await store.get('h2h-data', { type: 'json' });
+        const unchanged = existing &&
+            JSON.stringify(existing.h2hMatrix) === JSON.stringify(h2hData.h2hMatrix) &&
+            JSON.stringify(existing.userNames) === JSON.stringify(h2hData.userNames);
+        if (unchanged) {
+            h2hData.lastUpdated = existing.lastUpdated;
+        } else {
+            await store.set('h2h-data', JSON.stringify(h2hData));
+        }
+
+        console.log(unchanged ? 'H2H data unchanged' : 'H2H data calculated and stored successfully');
 
         return {
             statusCode: 200,